@@ -0,0 +1,249 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import click
+from benchmarks.fake_aws import DEFAULT_CATALOG_SIZE, DEFAULT_PAGE_SIZE, FakeAWSServer
+from src.offering_finder.batch import MANAGERS, PARAMS
+from src.offering_finder.clients.ClientFactory import DEFAULT_MAX_ATTEMPTS, ClientFactory
+from src.offering_finder.clients.Paginator import PageStats
+from src.offering_finder.instrumentation import Instrumentation
+from src.offering_finder.regions import DEFAULT_MAX_WORKERS, fetch_across_regions
+
+SERVICES = ["rds", "elasticache", "opensearch", "savingsplans"]
+REGIONS = [
+    "us-east-1",
+    "us-west-2",
+    "eu-west-1",
+    "eu-central-1",
+    "ap-northeast-1",
+    "ap-southeast-1",
+    "ap-southeast-2",
+    "sa-east-1",
+]
+DEFAULT_REGIONS = 4
+DEFAULT_LATENCY = 0.02
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    Nearest-rank percentile (q in 0-100); 0 for no values.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+def use_dummy_credentials() -> None:
+    """
+    botocore signs every request, so credentials must resolve; the local
+    endpoint never checks them.
+    """
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+
+def run_service(
+    service_name: str,
+    endpoint_url: str,
+    region_names: Sequence[str],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    prefetch: int = 0,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> Dict[str, Any]:
+    """
+    Fetch the full catalog of a service in every region through the endpoint,
+    on a fresh factory (no cache), and return the throughput, the page
+    latencies (including retries) and the retry counters.
+    """
+    instrumentation = Instrumentation()
+    factory = ClientFactory(
+        endpoint_url=endpoint_url,
+        max_attempts=max_attempts,
+        instrumentation=instrumentation,
+    )
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def on_page(stats: PageStats) -> None:
+        with lock:
+            latencies.append(stats.elapsed)
+
+    managers = {}
+    for region_name in region_names:
+        manager = MANAGERS[service_name](region_name, client_factory=factory, prefetch=prefetch)
+        manager.paginator.on_page = on_page
+        managers[region_name] = manager
+    params_class = PARAMS[service_name]
+    # Unset model defaults (e.g. Duration) would narrow the catalog
+    params = params_class(**{name: None for name in params_class.model_fields})
+
+    def fetch(region_name: str) -> Any:
+        manager = managers[region_name]
+        if service_name == "opensearch":
+            return manager.iter_offering_ids(params)
+        return manager.iter_offerings(params)
+
+    start = time.perf_counter()
+    offerings = fetch_across_regions(fetch, region_names, max_workers=max_workers)
+    elapsed = time.perf_counter() - start
+    counters = instrumentation.summary()["counters"]
+    return {
+        "regions": len(region_names),
+        "offerings": len(offerings),
+        "pages": len(latencies),
+        "seconds": round(elapsed, 6),
+        "offerings_per_s": round(len(offerings) / elapsed, 1) if elapsed else 0.0,
+        "pages_per_s": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "retries": counters.get("retries", 0),
+        "throttles": counters.get("throttles", 0),
+    }
+
+
+def run_e2e(
+    endpoint_url: str,
+    services: Sequence[str] = SERVICES,
+    region_names: Sequence[str] = REGIONS[:DEFAULT_REGIONS],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    prefetch: int = 0,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> Dict[str, Any]:
+    """
+    Run every service against the endpoint. Results are keyed by service.
+    """
+    use_dummy_credentials()
+    return {
+        service_name: run_service(
+            service_name,
+            endpoint_url,
+            region_names,
+            max_workers=max_workers,
+            prefetch=prefetch,
+            max_attempts=max_attempts,
+        )
+        for service_name in services
+    }
+
+
+@click.command()
+@click.option(
+    "--services",
+    default=",".join(SERVICES),
+    help="Comma-separated services to run",
+)
+@click.option(
+    "--regions",
+    default=DEFAULT_REGIONS,
+    type=click.IntRange(1, len(REGIONS)),
+    help="Number of regions fetched concurrently",
+)
+@click.option(
+    "--endpoint_url",
+    required=False,
+    type=str,
+    help="Use a running endpoint instead of starting a local one",
+)
+@click.option(
+    "--catalog_size",
+    default=DEFAULT_CATALOG_SIZE,
+    type=int,
+    help="Offerings per service and region",
+)
+@click.option(
+    "--page_size",
+    default=DEFAULT_PAGE_SIZE,
+    type=int,
+    help="Largest page the endpoint returns",
+)
+@click.option(
+    "--latency",
+    default=DEFAULT_LATENCY,
+    type=float,
+    help="Seconds the endpoint adds to each request",
+)
+@click.option(
+    "--throttle_rate",
+    default=0.0,
+    type=float,
+    help="Share of the requests the endpoint throttles (0-1)",
+)
+@click.option("--max_workers", default=DEFAULT_MAX_WORKERS, type=int, help="Concurrent regions")
+@click.option("--prefetch", default=0, type=int, help="Pages fetched ahead per region")
+@click.option(
+    "--max_attempts",
+    default=DEFAULT_MAX_ATTEMPTS,
+    type=int,
+    help="botocore retries per request (max_attempts of its retry config)",
+)
+@click.option("--seed", default=0, type=int, help="Seed of the synthetic catalogs")
+@click.option(
+    "--output",
+    default="text",
+    type=click.Choice(["text", "json"]),
+    help="Report format",
+)
+def main(
+    services,
+    regions,
+    endpoint_url,
+    catalog_size,
+    page_size,
+    latency,
+    throttle_rate,
+    max_workers,
+    prefetch,
+    max_attempts,
+    seed,
+    output,
+):
+    """Time the full network path (botocore, HTTP, paging) against a local endpoint"""
+    service_names = [s.strip() for s in services.split(",") if s.strip()]
+    unknown = [s for s in service_names if s not in SERVICES]
+    if unknown:
+        raise click.BadParameter(f"Unknown services: {', '.join(unknown)}")
+    server: Optional[FakeAWSServer] = None
+    if endpoint_url is None:
+        server = FakeAWSServer(
+            catalog_size=catalog_size,
+            page_size=page_size,
+            latency=latency,
+            throttle_rate=throttle_rate,
+            seed=seed,
+        )
+        endpoint_url = server.start()
+    try:
+        results = run_e2e(
+            endpoint_url,
+            service_names,
+            REGIONS[:regions],
+            max_workers=max_workers,
+            prefetch=prefetch,
+            max_attempts=max_attempts,
+        )
+    finally:
+        if server is not None:
+            server.stop()
+    if output == "json":
+        click.echo(json.dumps(results))
+        return
+    click.echo(
+        f"{'service':<14} {'offerings':>10} {'pages':>7} {'seconds':>9} "
+        f"{'offers/s':>10} {'p50(ms)':>9} {'p99(ms)':>9} {'retries':>8} {'throttles':>9}"
+    )
+    for service_name, result in results.items():
+        click.echo(
+            f"{service_name:<14} {result['offerings']:>10} {result['pages']:>7} "
+            f"{result['seconds']:>9.3f} {result['offerings_per_s']:>10.1f} "
+            f"{result['p50_ms']:>9.2f} {result['p99_ms']:>9.2f} "
+            f"{result['retries']:>8} {result['throttles']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,410 @@
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape
+
+import click
+from benchmarks.generators import generate_pool
+
+DEFAULT_CATALOG_SIZE = 1_000
+DEFAULT_PAGE_SIZE = 100
+
+# Query protocol operations (RDS, ElastiCache):
+# Action -> (service, API version, list element, member element)
+QUERY_OPERATIONS: Dict[str, Tuple[str, str, str, str]] = {
+    "DescribeReservedDBInstancesOfferings": (
+        "rds",
+        "2014-10-31",
+        "ReservedDBInstancesOfferings",
+        "ReservedDBInstancesOffering",
+    ),
+    "DescribeReservedCacheNodesOfferings": (
+        "elasticache",
+        "2015-02-02",
+        "ReservedCacheNodesOfferings",
+        "ReservedCacheNodesOffering",
+    ),
+}
+QUERY_NAMESPACES = {
+    "rds": "http://rds.amazonaws.com/doc/2014-10-31/",
+    "elasticache": "http://elasticache.amazonaws.com/doc/2015-02-02/",
+}
+OPENSEARCH_PATH = "/2021-01-01/opensearch/reservedInstanceOfferings"
+SAVINGSPLANS_PATH = "/DescribeSavingsPlansOfferings"
+
+# OpenSearch query string parameter -> offering field
+OPENSEARCH_FILTERS = {"offeringId": "ReservedInstanceOfferingId"}
+# Savings Plans list parameter -> offering field
+SAVINGSPLANS_FILTERS = {
+    "offeringIds": "offeringId",
+    "planTypes": "planType",
+    "paymentOptions": "paymentOption",
+    "durations": "durationSeconds",
+    "currencies": "currency",
+    "descriptions": "description",
+    "serviceCodes": "serviceCode",
+    "usageTypes": "usageType",
+    "operations": "operation",
+}
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _matches(offering: Dict[str, Any], field: str, values: List[Any]) -> bool:
+    return _text(offering.get(field)).lower() in {_text(v).lower() for v in values}
+
+
+def _page(
+    offerings: List[Dict[str, Any]], token: Optional[str], size: int
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Slice a page out of the offerings. Tokens are opaque offsets.
+    """
+    start = int(token) if token else 0
+    end = start + size
+    return offerings[start:end], (str(end) if end < len(offerings) else None)
+
+
+def _query_member(name: str, value: Any) -> str:
+    if isinstance(value, list):
+        # Query protocol lists (RecurringCharges) wrap each entry in its
+        # singular name
+        member = name[:-1]
+        items = "".join(
+            f"<{member}>"
+            + "".join(_query_member(k, v) for k, v in item.items())
+            + f"</{member}>"
+            for item in value
+        )
+        return f"<{name}>{items}</{name}>"
+    return f"<{name}>{escape(_text(value))}</{name}>"
+
+
+class FakeAWSServer:
+    """
+    Local stand-in for the four describe offerings APIs, speaking the wire
+    protocols botocore expects: query/XML for RDS and ElastiCache, rest-json
+    for OpenSearch and Savings Plans. The catalogs are synthetic (seeded),
+    each request is delayed by latency seconds, and a throttle_rate share of
+    the requests fail with the service's throttling error.
+    Point a ClientFactory at it with endpoint_url=server.url.
+    """
+
+    def __init__(
+        self,
+        catalog_size: int = DEFAULT_CATALOG_SIZE,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        latency: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.catalog_size = catalog_size
+        self.page_size = page_size
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.seed = seed
+        self.requests = 0
+        self.throttled = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._catalogs: Dict[str, List[Dict[str, Any]]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def catalog(self, service_name: str) -> List[Dict[str, Any]]:
+        """
+        The synthetic offerings of a service, generated on first use.
+        """
+        with self._lock:
+            if service_name not in self._catalogs:
+                self._catalogs[service_name] = generate_pool(
+                    service_name, self.seed, self.catalog_size
+                )
+            return self._catalogs[service_name]
+
+    def start(self) -> str:
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeAWSServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def admit(self) -> bool:
+        """
+        Count a request, wait out the configured latency and decide whether
+        it is throttled.
+        """
+        with self._lock:
+            self.requests += 1
+            throttled = self._rng.random() < self.throttle_rate
+            if throttled:
+                self.throttled += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+        return not throttled
+
+    def page_size_for(self, requested: Optional[Any]) -> int:
+        if requested is None:
+            return self.page_size
+        return max(1, min(int(requested), self.page_size))
+
+    def _handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, so the client's connection pool is exercised
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                url = urlsplit(self.path)
+                if url.path != OPENSEARCH_PATH:
+                    self._send_json(404, {"message": f"Unknown path {url.path}"})
+                    return
+                query = parse_qs(url.query)
+                self._rest_json(
+                    "opensearch",
+                    {k: v[-1] for k, v in query.items()},
+                    token_field="nextToken",
+                    page_size_field="maxResults",
+                )
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                path = urlsplit(self.path).path
+                if path == SAVINGSPLANS_PATH:
+                    self._rest_json(
+                        "savingsplans",
+                        json.loads(body or b"{}"),
+                        token_field="nextToken",
+                        page_size_field="maxResults",
+                    )
+                    return
+                form = {k: v[-1] for k, v in parse_qs(body.decode()).items()}
+                operation = QUERY_OPERATIONS.get(form.get("Action", ""))
+                if path != "/" or operation is None:
+                    self._send_json(404, {"message": f"Unknown operation {path}"})
+                    return
+                self._query(form, *operation)
+
+            def _query(
+                self,
+                form: Dict[str, str],
+                service_name: str,
+                version: str,
+                list_name: str,
+                member_name: str,
+            ) -> None:
+                namespace = QUERY_NAMESPACES[service_name]
+                request_id = str(uuid.uuid4())
+                if not server.admit():
+                    self._send(
+                        400,
+                        "text/xml",
+                        f'<ErrorResponse xmlns="{namespace}"><Error><Type>Sender</Type>'
+                        f"<Code>Throttling</Code><Message>Rate exceeded</Message>"
+                        f"</Error><RequestId>{request_id}</RequestId></ErrorResponse>",
+                    )
+                    return
+                offerings = server.catalog(service_name)
+                # Request parameters named after an offering field filter on it
+                fields = offerings[0].keys() if offerings else ()
+                for name, value in form.items():
+                    if name in fields:
+                        offerings = [o for o in offerings if _matches(o, name, [value])]
+                items, marker = _page(
+                    offerings, form.get("Marker"), server.page_size_for(form.get("MaxRecords"))
+                )
+                action = form["Action"]
+                members = "".join(
+                    f"<{member_name}>"
+                    + "".join(_query_member(k, v) for k, v in item.items())
+                    + f"</{member_name}>"
+                    for item in items
+                )
+                marker_element = f"<Marker>{marker}</Marker>" if marker else ""
+                self._send(
+                    200,
+                    "text/xml",
+                    f'<{action}Response xmlns="{namespace}">'
+                    f"<{action}Result>{marker_element}"
+                    f"<{list_name}>{members}</{list_name}>"
+                    f"</{action}Result>"
+                    f"<ResponseMetadata><RequestId>{request_id}</RequestId>"
+                    f"</ResponseMetadata></{action}Response>",
+                )
+
+            def _rest_json(
+                self,
+                service_name: str,
+                params: Dict[str, Any],
+                token_field: str,
+                page_size_field: str,
+            ) -> None:
+                if not server.admit():
+                    self._send_json(
+                        400,
+                        {"message": "Rate exceeded"},
+                        {"x-amzn-ErrorType": "ThrottlingException"},
+                    )
+                    return
+                offerings = server.catalog(service_name)
+                if service_name == "opensearch":
+                    result_key, next_key = "ReservedInstanceOfferings", "NextToken"
+                    filters = OPENSEARCH_FILTERS
+                else:
+                    result_key, next_key = "searchResults", "nextToken"
+                    filters = SAVINGSPLANS_FILTERS
+                for name, field in filters.items():
+                    values = params.get(name)
+                    if values:
+                        values = values if isinstance(values, list) else [values]
+                        offerings = [o for o in offerings if _matches(o, field, values)]
+                if service_name == "savingsplans":
+                    offerings = self._savingsplans_filters(offerings, params)
+                items, token = _page(
+                    offerings,
+                    params.get(token_field),
+                    server.page_size_for(params.get(page_size_field)),
+                )
+                body: Dict[str, Any] = {result_key: items}
+                if token:
+                    body[next_key] = token
+                elif service_name == "savingsplans":
+                    # Savings Plans ends the listing with an empty token
+                    body[next_key] = ""
+                self._send_json(200, body)
+
+            @staticmethod
+            def _savingsplans_filters(
+                offerings: List[Dict[str, Any]], params: Dict[str, Any]
+            ) -> List[Dict[str, Any]]:
+                product_type = params.get("productType")
+                if product_type:
+                    offerings = [
+                        o for o in offerings if product_type in o.get("productTypes", [])
+                    ]
+                # Property filters (e.g. region, instanceFamily)
+                for entry in params.get("filters") or []:
+                    values = set(entry.get("values") or [])
+                    offerings = [
+                        o
+                        for o in offerings
+                        if any(
+                            p.get("name") == entry.get("name") and p.get("value") in values
+                            for p in o.get("properties", [])
+                        )
+                    ]
+                return offerings
+
+            def _send_json(
+                self,
+                status: int,
+                body: Dict[str, Any],
+                headers: Optional[Dict[str, str]] = None,
+            ) -> None:
+                self._send(status, "application/json", json.dumps(body), headers)
+
+            def _send(
+                self,
+                status: int,
+                content_type: str,
+                body: str,
+                headers: Optional[Dict[str, str]] = None,
+            ) -> None:
+                # The status line, headers and body go out in one write:
+                # split writes on a keep-alive connection stall on Nagle's
+                # algorithm and delayed ACKs, which would swamp the latency
+                # being measured
+                data = body.encode()
+                self.log_request(status)
+                lines = [
+                    f"{self.protocol_version} {status} {self.responses[status][0]}",
+                    f"Date: {self.date_time_string()}",
+                    f"Content-Type: {content_type}",
+                    f"Content-Length: {len(data)}",
+                    f"x-amzn-RequestId: {uuid.uuid4()}",
+                    *(f"{name}: {value}" for name, value in (headers or {}).items()),
+                ]
+                head = "\r\n".join(lines) + "\r\n\r\n"
+                self.wfile.write(head.encode("latin-1") + data)
+
+        return Handler
+
+
+@click.command()
+@click.option("--host", default="127.0.0.1", help="Address to listen on")
+@click.option("--port", default=4566, type=int, help="Port to listen on")
+@click.option(
+    "--catalog_size",
+    default=DEFAULT_CATALOG_SIZE,
+    type=int,
+    help="Offerings per service",
+)
+@click.option(
+    "--page_size",
+    default=DEFAULT_PAGE_SIZE,
+    type=int,
+    help="Largest page returned, whatever the request asks for",
+)
+@click.option("--latency", default=0.0, type=float, help="Seconds added to each request")
+@click.option(
+    "--throttle_rate",
+    default=0.0,
+    type=float,
+    help="Share of the requests failing with a throttling error (0-1)",
+)
+@click.option("--seed", default=0, type=int, help="Seed of the synthetic catalogs")
+def main(host, port, catalog_size, page_size, latency, throttle_rate, seed):
+    """Serve the describe offerings APIs locally"""
+    server = FakeAWSServer(
+        catalog_size=catalog_size,
+        page_size=page_size,
+        latency=latency,
+        throttle_rate=throttle_rate,
+        seed=seed,
+        host=host,
+        port=port,
+    )
+    click.echo(f"Serving on {server.url}", err=True)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
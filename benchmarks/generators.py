@@ -0,0 +1,167 @@
+import itertools
+import random
+import uuid
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Distinct offerings generated per catalog; larger catalogs cycle through
+# them, so a 1M offering run does not hold 1M dicts in memory
+POOL_SIZE = 10_000
+
+DURATIONS = [31536000, 94608000]
+OFFERING_TYPES = ["All Upfront", "Partial Upfront", "No Upfront"]
+REGIONS = ["us-east-1", "us-west-2", "eu-west-1", "ap-northeast-1"]
+FAMILIES = ["m5", "m6g", "m7g", "r5", "r6g", "r7g", "c5", "c6g", "t3", "t4g"]
+SIZES = ["large", "xlarge", "2xlarge", "4xlarge", "8xlarge", "12xlarge"]
+
+
+def _offering_id(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128)))
+
+
+def _prices(rng: random.Random, duration: int, offering_type: str) -> Dict[str, Any]:
+    hourly = round(rng.uniform(0.01, 5.0), 4)
+    hours = duration / 3600
+    upfront_share = {"All Upfront": 1.0, "Partial Upfront": 0.5, "No Upfront": 0.0}
+    share = upfront_share[offering_type]
+    return {
+        "FixedPrice": round(hourly * hours * share, 2),
+        "UsagePrice": 0.0,
+        "RecurringCharges": (
+            []
+            if share == 1.0
+            else [
+                {
+                    "RecurringChargeAmount": round(hourly * (1 - share), 4),
+                    "RecurringChargeFrequency": "Hourly",
+                }
+            ]
+        ),
+    }
+
+
+def rds_offering(rng: random.Random) -> Dict[str, Any]:
+    duration = rng.choice(DURATIONS)
+    offering_type = rng.choice(OFFERING_TYPES)
+    return {
+        "ReservedDBInstancesOfferingId": _offering_id(rng),
+        "DBInstanceClass": f"db.{rng.choice(FAMILIES)}.{rng.choice(SIZES)}",
+        "Duration": duration,
+        **_prices(rng, duration, offering_type),
+        "CurrencyCode": "USD",
+        "ProductDescription": rng.choice(
+            ["mysql", "postgresql", "mariadb", "aurora-mysql", "aurora-postgresql"]
+        ),
+        "OfferingType": offering_type,
+        "MultiAZ": rng.random() < 0.5,
+    }
+
+
+def elasticache_offering(rng: random.Random) -> Dict[str, Any]:
+    duration = rng.choice(DURATIONS)
+    offering_type = rng.choice(OFFERING_TYPES)
+    return {
+        "ReservedCacheNodesOfferingId": _offering_id(rng),
+        "CacheNodeType": f"cache.{rng.choice(FAMILIES)}.{rng.choice(SIZES)}",
+        "Duration": duration,
+        **_prices(rng, duration, offering_type),
+        "ProductDescription": rng.choice(["redis", "memcached", "valkey"]),
+        "OfferingType": offering_type,
+    }
+
+
+def opensearch_offering(rng: random.Random) -> Dict[str, Any]:
+    duration = rng.choice(DURATIONS)
+    offering_type = rng.choice(OFFERING_TYPES)
+    return {
+        "ReservedInstanceOfferingId": _offering_id(rng),
+        "InstanceType": f"{rng.choice(FAMILIES)}.{rng.choice(SIZES)}.search",
+        "Duration": duration,
+        **_prices(rng, duration, offering_type),
+        "CurrencyCode": "USD",
+        "PaymentOption": offering_type.upper().replace(" ", "_"),
+    }
+
+
+# Savings Plans plan type -> (product types, service code, description, usage type)
+SAVINGSPLANS_PLANS = {
+    "Compute": (
+        ["EC2", "Fargate", "Lambda"],
+        "ComputeSavingsPlans",
+        "Compute Savings Plan",
+        "ComputeSP",
+    ),
+    "EC2Instance": (
+        ["EC2"],
+        "ComputeSavingsPlans",
+        "{family} EC2 Instance Savings Plan in {region}",
+        "{region_code}-EC2SP:{family}",
+    ),
+    "SageMaker": (
+        ["SageMaker"],
+        "MachineLearningSavingsPlans",
+        "SageMaker Savings Plan",
+        "SageMakerSP",
+    ),
+}
+
+
+def savingsplans_offering(rng: random.Random) -> Dict[str, Any]:
+    family = rng.choice(FAMILIES)
+    region = rng.choice(REGIONS)
+    plan_type = rng.choice(list(SAVINGSPLANS_PLANS))
+    payment_option = rng.choice(OFFERING_TYPES)
+    duration = rng.choice(DURATIONS)
+    product_types, service_code, description, usage_type = SAVINGSPLANS_PLANS[plan_type]
+    names = {"family": family, "region": region, "region_code": region.upper()}
+    years = duration // 31536000
+    return {
+        "offeringId": _offering_id(rng),
+        "productTypes": product_types,
+        "planType": plan_type,
+        "description": (
+            f"{years} year {payment_option} {description.format(**names)}"
+        ),
+        "paymentOption": payment_option,
+        "durationSeconds": duration,
+        "currency": "USD",
+        "serviceCode": service_code,
+        "usageType": (
+            f"{usage_type.format(**names)}.{years}yr{payment_option.replace(' ', '')}"
+        ),
+        "operation": "",
+        "properties": [
+            {"name": "region", "value": region},
+            {"name": "instanceFamily", "value": family},
+        ],
+    }
+
+
+GENERATORS: Dict[str, Callable[[random.Random], Dict[str, Any]]] = {
+    "rds": rds_offering,
+    "elasticache": elasticache_offering,
+    "opensearch": opensearch_offering,
+    "savingsplans": savingsplans_offering,
+}
+
+
+def generate_pool(
+    service_name: str, seed: int = 0, size: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Generate the distinct synthetic offerings of a service (POOL_SIZE unless
+    given), shaped like the describe offerings responses. The same seed
+    gives the same catalog.
+    """
+    rng = random.Random(seed)
+    generate = GENERATORS[service_name]
+    return [generate(rng) for _ in range(POOL_SIZE if size is None else size)]
+
+
+def generate_offerings(
+    service_name: str, count: int, seed: int = 0
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield count synthetic offerings, cycling through the pool.
+    """
+    pool = generate_pool(service_name, seed, min(count, POOL_SIZE))
+    return itertools.islice(itertools.cycle(pool), count)
@@ -0,0 +1,323 @@
+import io
+import itertools
+import json
+import platform
+import statistics
+import sys
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+import click
+from benchmarks.generators import generate_pool
+from src.offering_finder.clients.ClientFactory import ClientFactory
+from src.offering_finder.clients.Snapshot import Snapshot
+from src.offering_finder.enrichment import materialize
+from src.offering_finder.managers.elasticache_manager import ElastiCacheManager
+from src.offering_finder.managers.opensearch_manager import OpenSearchManager
+from src.offering_finder.managers.rds_manager import RDSManager
+from src.offering_finder.managers.savingsplans_manager import SavingsPlansManager
+from src.offering_finder.models.elasticache_params import ElastiCachePurchaseParams
+from src.offering_finder.models.opensearch_params import (
+    OpenSearchFilterParams,
+    OpenSearchPurchaseParams,
+)
+from src.offering_finder.models.rds_params import RDSPurchaseParams
+from src.offering_finder.models.savingsplans_params import SavingsPlansPurchaseParams
+from src.offering_finder.serializers import write
+
+SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+DEFAULT_SIZES = "1k,100k"
+DEFAULT_REPEAT = 3
+# A case is reported as a regression when it is this much slower than the
+# baseline
+DEFAULT_THRESHOLD = 0.10
+REGION = "us-east-1"
+
+
+class Case(NamedTuple):
+    """
+    One benchmark: runs the given function over the offerings of a service.
+    """
+
+    name: str
+    service_name: str
+    run: Callable[[Iterable[Dict[str, Any]]], None]
+
+
+class NullStream(io.RawIOBase):
+    """
+    A binary stream discarding what is written, so the serialize cases time
+    the serializer without the I/O.
+    """
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        return len(data)
+
+
+def consume(iterator: Iterable[Any]) -> None:
+    deque(iterator, maxlen=0)
+
+
+def build_cases() -> List[Case]:
+    """
+    Build the managers without AWS access (a replaying snapshot means no
+    boto3 client is created) and the cases timing them.
+    """
+    factory = ClientFactory(snapshot=Snapshot(replay=True))
+    rds = RDSManager(REGION, client_factory=factory)
+    elasticache = ElastiCacheManager(REGION, client_factory=factory)
+    opensearch = OpenSearchManager(REGION, client_factory=factory)
+    savingsplans = SavingsPlansManager(REGION, client_factory=factory)
+    rds_params = RDSPurchaseParams(region_name=REGION, quantity=2)
+    elasticache_params = ElastiCachePurchaseParams(region_name=REGION, quantity=2)
+    opensearch_params = OpenSearchPurchaseParams(region_name=REGION, quantity=2)
+    savingsplans_params = SavingsPlansPurchaseParams(region_name=REGION, commitment=1.0)
+    filter_params = OpenSearchFilterParams(InstanceType="m5.large.search")
+
+    # Enrich, materialize and write each offering, as --output ndjson does
+    def serialize(manager: Any, params: Any) -> Callable[[Iterable[Any]], None]:
+        def run(offerings: Iterable[Dict[str, Any]]) -> None:
+            records = materialize(manager.enrich_offerings(offerings, params))
+            write(records, NullStream(), "ndjson")
+
+        return run
+
+    return [
+        Case(
+            "opensearch.filter_offerings",
+            "opensearch",
+            lambda o: consume(opensearch.iter_filter_offerings(o, filter_params)),
+        ),
+        Case(
+            "rds.add_keys_to_offerings",
+            "rds",
+            lambda o: consume(rds.iter_add_keys_to_offerings(o, rds_params)),
+        ),
+        Case(
+            "elasticache.add_keys_to_offerings",
+            "elasticache",
+            lambda o: consume(
+                elasticache.iter_add_keys_to_offerings(o, elasticache_params)
+            ),
+        ),
+        Case(
+            "opensearch.add_keys_to_offerings",
+            "opensearch",
+            lambda o: consume(
+                opensearch.iter_add_keys_to_offerings(o, opensearch_params)
+            ),
+        ),
+        Case(
+            "savingsplans.add_keys_to_offerings",
+            "savingsplans",
+            lambda o: consume(
+                savingsplans.iter_add_keys_to_offerings(o, savingsplans_params)
+            ),
+        ),
+        Case(
+            "rds.generate_purchase_command",
+            "rds",
+            lambda o: consume(
+                rds.generate_purchase_command(
+                    purchase_profile=None,
+                    offering_id=offering["ReservedDBInstancesOfferingId"],
+                    region_name=REGION,
+                    quantity=2,
+                )
+                for offering in o
+            ),
+        ),
+        Case(
+            "elasticache.generate_purchase_command",
+            "elasticache",
+            lambda o: consume(
+                elasticache.generate_purchase_command(
+                    purchase_profile=None,
+                    region_name=REGION,
+                    offering_id=offering["ReservedCacheNodesOfferingId"],
+                    quantity=2,
+                    reserved_cache_node_id=None,
+                )
+                for offering in o
+            ),
+        ),
+        Case(
+            "opensearch.generate_purchase_command",
+            "opensearch",
+            lambda o: consume(
+                opensearch.generate_purchase_command(
+                    offering_id=offering["ReservedInstanceOfferingId"],
+                    region_name=REGION,
+                    quantity=2,
+                )
+                for offering in o
+            ),
+        ),
+        Case(
+            "savingsplans.generate_purchase_command",
+            "savingsplans",
+            lambda o: consume(
+                savingsplans.generate_purchase_command(
+                    purchase_profile=None,
+                    region_name=REGION,
+                    offering_id=offering["offeringId"],
+                    commitment=1,
+                )
+                for offering in o
+            ),
+        ),
+        Case("rds.serialize", "rds", serialize(rds, rds_params)),
+        Case(
+            "elasticache.serialize",
+            "elasticache",
+            serialize(elasticache, elasticache_params),
+        ),
+        Case(
+            "opensearch.serialize",
+            "opensearch",
+            serialize(opensearch, opensearch_params),
+        ),
+        Case(
+            "savingsplans.serialize",
+            "savingsplans",
+            serialize(savingsplans, savingsplans_params),
+        ),
+    ]
+
+
+def time_case(
+    case: Case, pool: List[Dict[str, Any]], size: int, repeat: int
+) -> Dict[str, Any]:
+    """
+    Run a case repeat times over size offerings cycled from the pool and
+    return the best and median times.
+    """
+    timings = []
+    for _ in range(repeat):
+        offerings = itertools.islice(itertools.cycle(pool), size)
+        start = time.perf_counter()
+        case.run(offerings)
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return {
+        "size": size,
+        "min": round(best, 6),
+        "median": round(statistics.median(timings), 6),
+        "per_item_us": round(best / size * 1e6, 4),
+    }
+
+
+def run_benchmarks(
+    sizes: List[str],
+    repeat: int = DEFAULT_REPEAT,
+    match: Optional[str] = None,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Run every case (whose name contains match) at each size.
+    Results are keyed by '<case>[<size>]'.
+    """
+    pools: Dict[str, List[Dict[str, Any]]] = {}
+    results: Dict[str, Any] = {}
+    for case in build_cases():
+        if match and match not in case.name:
+            continue
+        if case.service_name not in pools:
+            pools[case.service_name] = generate_pool(case.service_name, seed)
+        for size in sizes:
+            key = f"{case.name}[{size}]"
+            results[key] = time_case(case, pools[case.service_name], SIZES[size], repeat)
+            click.echo(
+                f"{key:<48} {results[key]['min']:>10.4f}s "
+                f"{results[key]['per_item_us']:>10.3f}us/item",
+                err=True,
+            )
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": results,
+    }
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[Dict[str, Any]]:
+    """
+    Compare the best times of the cases present in both runs.
+    A ratio above 1 + threshold is a regression.
+    """
+    rows = []
+    for key, result in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None or not base["min"]:
+            continue
+        ratio = result["min"] / base["min"]
+        rows.append(
+            {
+                "case": key,
+                "baseline": base["min"],
+                "current": result["min"],
+                "ratio": round(ratio, 3),
+                "regression": ratio > 1 + threshold,
+            }
+        )
+    return rows
+
+
+@click.command()
+@click.option(
+    "--sizes",
+    default=DEFAULT_SIZES,
+    help="Comma-separated catalog sizes to run (1k, 100k, 1m)",
+)
+@click.option("--repeat", default=DEFAULT_REPEAT, type=int, help="Runs per case")
+@click.option("--match", required=False, type=str, help="Only run cases containing this")
+@click.option("--seed", default=0, type=int, help="Seed of the synthetic catalogs")
+@click.option(
+    "--save",
+    required=False,
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write the results to a JSON file (e.g., a new baseline)",
+)
+@click.option(
+    "--baseline",
+    required=False,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Compare against saved results; exits with 1 on a regression",
+)
+@click.option(
+    "--threshold",
+    default=DEFAULT_THRESHOLD,
+    type=float,
+    help="Slowdown ratio over the baseline reported as a regression (default: 0.10)",
+)
+def main(sizes, repeat, match, seed, save, baseline, threshold):
+    """Time the offering pipeline on synthetic catalogs"""
+    size_names = [s.strip().lower() for s in sizes.split(",") if s.strip()]
+    unknown = [s for s in size_names if s not in SIZES]
+    if unknown:
+        raise click.BadParameter(f"Unknown sizes: {', '.join(unknown)}")
+    current = run_benchmarks(size_names, repeat, match, seed)
+    if save:
+        with open(save, "w") as f:
+            json.dump(current, f, indent=2)
+    if baseline:
+        with open(baseline) as f:
+            rows = compare(current, json.load(f), threshold)
+        for row in rows:
+            flag = "REGRESSION" if row["regression"] else ""
+            click.echo(
+                f"{row['case']:<48} {row['baseline']:>10.4f}s -> "
+                f"{row['current']:>10.4f}s  x{row['ratio']:<6} {flag}"
+            )
+        if any(row["regression"] for row in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
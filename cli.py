@@ -1,19 +1,24 @@
 import click
-from mycli.rds import rds
-from mycli.elasticache import elasticache
-from mycli.savingsplans import savingsplans
-from mycli.opensearch import opensearch
+from mycli.lazy_group import LazyGroup
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "rds": ("mycli.rds:rds", "Retrieve Amazon RDS offerings"),
+        "elasticache": ("mycli.elasticache:elasticache", "Retrieve ElastiCache offerings"),
+        "savingsplans": (
+            "mycli.savingsplans:savingsplans",
+            "Retrieve SavingsPlans offerings",
+        ),
+        "opensearch": ("mycli.opensearch:opensearch", "Retrieve OpenSearch offerings"),
+        "batch": ("mycli.batch:batch", "Answer every line item of an inventory"),
+        "serve": ("mycli.serve:serve", "Serve warm catalogs over a local HTTP API"),
+    },
+)
 def cli():
     pass
 
 
-cli.add_command(rds)
-cli.add_command(elasticache)
-cli.add_command(savingsplans)
-cli.add_command(opensearch)
-
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,71 @@
+import click
+from src.offering_finder.regions import DEFAULT_MAX_WORKERS
+from mycli.cache import build_cache, cache_options
+from mycli.client import build_client_factory, client_options
+from mycli.fields import fields_option, parse_fields
+from mycli.output import output_options, require_output, write_records
+from mycli.snapshot import build_snapshot, snapshot_options
+from mycli.timings import build_instrumentation, report_timings, timings_option
+
+
+# batch subcommand
+@click.command()
+@click.argument("inventory", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--purchase_profile",
+    required=False,
+    type=str,
+    help="Purchase command set a named profile, unless the item sets one",
+)
+@click.option(
+    "--max_workers",
+    default=DEFAULT_MAX_WORKERS,
+    type=int,
+    help="Number of (service, region) catalogs fetched concurrently",
+)
+@output_options
+@client_options
+@cache_options
+@snapshot_options
+@fields_option
+@timings_option
+def batch(
+    inventory,
+    purchase_profile,
+    max_workers,
+    output,
+    output_file,
+    profile,
+    endpoint_url,
+    no_cache,
+    refresh,
+    cache_ttl,
+    record_snapshot,
+    from_snapshot,
+    fields,
+    timings,
+):
+    """Answer every line item of a JSON/YAML/CSV inventory"""
+    from pydantic import ValidationError
+    from src.offering_finder.batch import load_inventory, run_batch
+
+    require_output(output)
+    try:
+        items = load_inventory(inventory)
+    except (ValueError, ValidationError) as e:
+        raise click.UsageError(f"Invalid inventory {inventory}: {e}")
+    instrumentation = build_instrumentation(timings)
+    with instrumentation.span("total"):
+        cache = build_cache(no_cache, refresh, cache_ttl)
+        snapshot = build_snapshot(record_snapshot, from_snapshot)
+        client_factory = build_client_factory(
+            profile, endpoint_url, cache, snapshot, instrumentation
+        )
+        with instrumentation.span("run_batch"):
+            results = run_batch(
+                items, client_factory, max_workers, purchase_profile, parse_fields(fields)
+            )
+        write_records(results, output, instrumentation, output_file)
+    if record_snapshot:
+        snapshot.save(record_snapshot)
+    report_timings(instrumentation, timings)
@@ -0,0 +1,31 @@
+from typing import Optional
+
+import click
+from src.offering_finder.clients.OfferingCache import DEFAULT_TTL, OfferingCache
+
+
+def cache_options(f):
+    """
+    Add the offering cache options to a subcommand.
+    """
+    f = click.option(
+        "--cache_ttl",
+        default=DEFAULT_TTL,
+        type=int,
+        help="Seconds a cached offering page stays valid (default: 86400)",
+    )(f)
+    f = click.option(
+        "--refresh",
+        is_flag=True,
+        help="Ignore cached pages and re-download them into the cache",
+    )(f)
+    f = click.option(
+        "--no_cache", is_flag=True, help="Do not read or write the offering cache"
+    )(f)
+    return f
+
+
+def build_cache(no_cache: bool, refresh: bool, cache_ttl: int) -> Optional[OfferingCache]:
+    if no_cache:
+        return None
+    return OfferingCache(ttl=cache_ttl, refresh=refresh)
@@ -0,0 +1,42 @@
+from typing import Optional
+
+import click
+from src.offering_finder.clients.ClientFactory import ClientFactory
+from src.offering_finder.clients.OfferingCache import OfferingCache
+from src.offering_finder.clients.Snapshot import Snapshot
+from src.offering_finder.instrumentation import Instrumentation
+
+
+def client_options(f):
+    """
+    Add the AWS connection options to a subcommand.
+    """
+    f = click.option(
+        "--endpoint_url",
+        required=False,
+        type=str,
+        help="Override the AWS endpoint URL (e.g., 'http://localhost:8080')",
+    )(f)
+    f = click.option(
+        "--profile",
+        required=False,
+        type=str,
+        help="Named profile used to look up the offerings (e.g., 'readonly')",
+    )(f)
+    return f
+
+
+def build_client_factory(
+    profile: Optional[str],
+    endpoint_url: Optional[str],
+    cache: Optional[OfferingCache] = None,
+    snapshot: Optional[Snapshot] = None,
+    instrumentation: Optional[Instrumentation] = None,
+) -> ClientFactory:
+    return ClientFactory(
+        profile_name=profile,
+        endpoint_url=endpoint_url,
+        cache=cache,
+        snapshot=snapshot,
+        instrumentation=instrumentation,
+    )
@@ -1,10 +1,12 @@
 import click
-import json
-from src.offering_finder.models.elasticache_params import (
-    ElastiCacheParams,
-    ElastiCachePurchaseParams,
-)
-from src.offering_finder.managers.elasticache_manager import ElastiCacheManager
+from src.offering_finder.regions import DEFAULT_MAX_WORKERS, resolve_regions
+from mycli.cache import build_cache, cache_options
+from mycli.client import build_client_factory, client_options
+from mycli.output import output_options, ranking_options, write_offerings
+from mycli.snapshot import build_snapshot, snapshot_options
+from mycli.timings import build_instrumentation, report_timings, timings_option
+from mycli.fields import build_fields, fields_option
+from mycli.where import build_where, where_option
 
 
 # elasticache subcommand
@@ -16,8 +18,36 @@ from src.offering_finder.managers.elasticache_manager import ElastiCacheManager
     help="Purchase command set a named profile (e.g., 'default' 'my-profile')",
 )
 @click.option(
-    "--region_name", required=True, help="AWS region name (e.g., 'ap-northeast-1')"
+    "--region_name",
+    required=False,
+    multiple=True,
+    help="AWS region name, can be repeated (e.g., 'ap-northeast-1')",
+)
+@click.option(
+    "--all_regions",
+    is_flag=True,
+    help="Query every region where ElastiCache is available",
+)
+@click.option(
+    "--max_workers",
+    default=DEFAULT_MAX_WORKERS,
+    type=int,
+    help="Number of regions fetched concurrently",
 )
+@click.option(
+    "--prefetch",
+    default=0,
+    type=int,
+    help="Pages fetched ahead in the background while the current one is processed",
+)
+@output_options
+@ranking_options
+@client_options
+@cache_options
+@snapshot_options
+@where_option
+@fields_option
+@timings_option
 @click.option("--quantity", required=True, type=int, help="Quantity (e.g., 1)")
 @click.option(
     "--cache_node_type",
@@ -61,6 +91,24 @@ from src.offering_finder.managers.elasticache_manager import ElastiCacheManager
 def elasticache(
     purchase_profile,
     region_name,
+    all_regions,
+    max_workers,
+    prefetch,
+    output,
+    output_file,
+    sort,
+    top,
+    on_demand_rate,
+    profile,
+    endpoint_url,
+    no_cache,
+    refresh,
+    cache_ttl,
+    record_snapshot,
+    from_snapshot,
+    where,
+    fields,
+    timings,
     quantity,
     reserved_cache_node_id,
     reserved_cache_nodes_offering_id,
@@ -70,24 +118,89 @@ def elasticache(
     offering_type,
 ):
     """Retrieve ElastiCache offerings"""
-    manager = ElastiCacheManager(region_name=region_name)
-    """ 1. Get all offerings """
-    offering_params = ElastiCacheParams(
-        CacheNodeType=cache_node_type,
-        Duration=duration,
-        ProductDescription=product_description,
-        OfferingType=offering_type,
-        ReservedCacheNodesOfferingId=reserved_cache_nodes_offering_id,
+    from src.offering_finder.models.elasticache_params import (
+        ElastiCacheParams,
+        ElastiCachePurchaseParams,
     )
-    offerings = manager.get_offerings(offering_params)
+    from src.offering_finder.managers.elasticache_manager import ElastiCacheManager
+    from src.offering_finder.planner import plan_query
 
-    """ 2. Add Purchase Command and Purchase Offering """
-    purchase_params = ElastiCachePurchaseParams(
-        purchase_profile=purchase_profile,
-        region_name=region_name,
-        quantity=quantity,
-        reserved_cache_node_id=reserved_cache_node_id,
-    )
-    result = manager.add_keys_to_offerings(offerings, purchase_params)
+    instrumentation = build_instrumentation(timings)
+    with instrumentation.span("total"):
+        try:
+            region_names = resolve_regions("elasticache", region_name, all_regions)
+        except ValueError as e:
+            raise click.UsageError(str(e))
+        cache = build_cache(no_cache, refresh, cache_ttl)
+        snapshot = build_snapshot(record_snapshot, from_snapshot)
+        where_expression = build_where(where)
+        client_factory = build_client_factory(
+            profile, endpoint_url, cache, snapshot, instrumentation
+        )
+        offering_params = ElastiCacheParams(
+            CacheNodeType=cache_node_type,
+            Duration=duration,
+            ProductDescription=product_description,
+            OfferingType=offering_type,
+            ReservedCacheNodesOfferingId=reserved_cache_nodes_offering_id,
+        )
+        # Push what the API can filter into the request, check the rest locally
+        plan = plan_query(
+            "elasticache",
+            {},
+            request=offering_params.model_dump(exclude_none=True),
+            where=where_expression,
+        )
+        offering_params = ElastiCacheParams(**plan.request)
+        projection = build_fields(
+            "elasticache",
+            fields,
+            plan,
+            where_expression,
+            ranked=sort is not None or on_demand_rate is not None,
+        )
+        managers = {
+            name: ElastiCacheManager(
+                region_name=name,
+                client_factory=client_factory,
+                prefetch=prefetch,
+                fields=projection,
+            )
+            for name in region_names
+        }
+
+        def fetch(region):
+            manager = managers[region]
+            """ 1. Stream all offerings """
+            offerings = instrumentation.timed(
+                "paginate", manager.iter_offerings(offering_params)
+            )
+            offerings = instrumentation.timed("filter", plan.filter(offerings))
+
+            """ 2. Add Purchase Command and Purchase Offering """
+            purchase_params = ElastiCachePurchaseParams(
+                purchase_profile=purchase_profile,
+                region_name=region,
+                quantity=quantity,
+                reserved_cache_node_id=reserved_cache_node_id,
+            )
+            return instrumentation.timed(
+                "enrich", manager.enrich_offerings(offerings, purchase_params)
+            )
 
-    print(json.dumps(result, indent=2))
+        write_offerings(
+            fetch,
+            region_names,
+            max_workers,
+            output,
+            sort,
+            top,
+            on_demand_rate,
+            # An offering ID matches at most one offering: stop at the first hit
+            first_match=reserved_cache_nodes_offering_id is not None,
+            instrumentation=instrumentation,
+            output_file=output_file,
+        )
+    if record_snapshot:
+        snapshot.save(record_snapshot)
+    report_timings(instrumentation, timings)
@@ -0,0 +1,42 @@
+from typing import Any, List, Optional, Tuple
+
+import click
+
+fields_option = click.option(
+    "--fields",
+    required=False,
+    type=str,
+    help=(
+        "Comma-separated offering fields to keep, e.g. "
+        "'ReservedDBInstancesOfferingId,FixedPrice,UsagePrice'"
+    ),
+)
+
+
+def parse_fields(fields: Optional[str]) -> List[str]:
+    return [f.strip() for f in (fields or "").split(",") if f.strip()]
+
+
+def build_fields(
+    service_name: str,
+    fields: Optional[str],
+    plan: Any = None,
+    where_expression: Any = None,
+    ranked: bool = False,
+) -> Optional[Tuple[str, ...]]:
+    """
+    Fields kept from each page: the requested ones plus those the offerings
+    still need to be filtered, enriched and ranked.
+    """
+    requested = parse_fields(fields)
+    if not requested:
+        return None
+    from src.offering_finder.projection import RANKING_FIELDS, projection_fields
+
+    return projection_fields(
+        service_name,
+        requested,
+        plan.residual if plan is not None else (),
+        where_expression.fields() if where_expression is not None else (),
+        RANKING_FIELDS[service_name] if ranked else (),
+    )
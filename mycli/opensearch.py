@@ -1,11 +1,12 @@
 import click
-import json
-from src.offering_finder.models.opensearch_params import (
-    OpenSearchParams,
-    OpenSearchFilterParams,
-    OpenSearchPurchaseParams,
-)
-from src.offering_finder.managers.opensearch_manager import OpenSearchManager
+from src.offering_finder.regions import DEFAULT_MAX_WORKERS, resolve_regions
+from mycli.cache import build_cache, cache_options
+from mycli.client import build_client_factory, client_options
+from mycli.output import output_options, ranking_options, write_offerings
+from mycli.snapshot import build_snapshot, snapshot_options
+from mycli.timings import build_instrumentation, report_timings, timings_option
+from mycli.fields import build_fields, fields_option
+from mycli.where import build_where, where_option
 
 
 # Opensearch subcommand
@@ -18,10 +19,36 @@ from src.offering_finder.managers.opensearch_manager import OpenSearchManager
 )
 @click.option(
     "--region_name",
-    required=True,
+    required=False,
+    multiple=True,
     type=str,
-    help="AWS region name (e.g., 'ap-northeast-1') (required)",
+    help="AWS region name, can be repeated (e.g., 'ap-northeast-1')",
+)
+@click.option(
+    "--all_regions",
+    is_flag=True,
+    help="Query every region where OpenSearch is available",
+)
+@click.option(
+    "--max_workers",
+    default=DEFAULT_MAX_WORKERS,
+    type=int,
+    help="Number of regions fetched concurrently",
 )
+@click.option(
+    "--prefetch",
+    default=0,
+    type=int,
+    help="Pages fetched ahead in the background while the current one is processed",
+)
+@output_options
+@ranking_options
+@client_options
+@cache_options
+@snapshot_options
+@where_option
+@fields_option
+@timings_option
 @click.option(
     "--instance_type",
     required=False,
@@ -72,6 +99,24 @@ from src.offering_finder.managers.opensearch_manager import OpenSearchManager
 def opensearch(
     purchase_profile,
     region_name,
+    all_regions,
+    max_workers,
+    prefetch,
+    output,
+    output_file,
+    sort,
+    top,
+    on_demand_rate,
+    profile,
+    endpoint_url,
+    no_cache,
+    refresh,
+    cache_ttl,
+    record_snapshot,
+    from_snapshot,
+    where,
+    fields,
+    timings,
     reserved_instance_offering_id,
     instance_type,
     duration,
@@ -81,29 +126,93 @@ def opensearch(
     reservation_name,
 ):
     """Retrieve OpenSearch offerings"""
-    """ 1. Get all offerings """
-    params_all = OpenSearchParams(
-        ReservedInstanceOfferingId=reserved_instance_offering_id,
+    from src.offering_finder.models.opensearch_params import (
+        OpenSearchParams,
+        OpenSearchFilterParams,
+        OpenSearchPurchaseParams,
     )
-    manager = OpenSearchManager(region_name=region_name)
-    all_offerings = manager.get_offering_ids(params_all)
+    from src.offering_finder.managers.opensearch_manager import OpenSearchManager
+    from src.offering_finder.planner import plan_query
 
-    """ 2. Filter offerings to match the specified criteria """
-    filter_params = OpenSearchFilterParams(
-        ReservedInstanceOfferingId=reserved_instance_offering_id,
-        InstanceType=instance_type,
-        Duration=duration,
-        CurrencyCode=currency_code,
-        PaymentOption=payment_option,
-    )
-    filter_offerings = manager.filter_offerings(all_offerings, filter_params)
+    instrumentation = build_instrumentation(timings)
+    with instrumentation.span("total"):
+        try:
+            region_names = resolve_regions("opensearch", region_name, all_regions)
+        except ValueError as e:
+            raise click.UsageError(str(e))
+        cache = build_cache(no_cache, refresh, cache_ttl)
+        snapshot = build_snapshot(record_snapshot, from_snapshot)
+        where_expression = build_where(where)
+        client_factory = build_client_factory(
+            profile, endpoint_url, cache, snapshot, instrumentation
+        )
+        filter_params = OpenSearchFilterParams(
+            ReservedInstanceOfferingId=reserved_instance_offering_id,
+            InstanceType=instance_type,
+            Duration=duration,
+            CurrencyCode=currency_code,
+            PaymentOption=payment_option,
+        )
+        # Push what the API can filter into the request, check the rest locally
+        plan = plan_query(
+            "opensearch",
+            filter_params.model_dump(exclude_none=True),
+            where=where_expression,
+        )
+        params_all = OpenSearchParams(**plan.request)
+        projection = build_fields(
+            "opensearch",
+            fields,
+            plan,
+            where_expression,
+            ranked=sort is not None or on_demand_rate is not None,
+        )
+        managers = {
+            name: OpenSearchManager(
+                region_name=name,
+                client_factory=client_factory,
+                prefetch=prefetch,
+                fields=projection,
+            )
+            for name in region_names
+        }
 
-    """ 3. Add Purchase Command and Purchase Offering """
-    purchase_params = OpenSearchPurchaseParams(
-        purchase_profile=purchase_profile,
-        region_name=region_name,
-        quantity=quantity,
-        reservation_name=reservation_name,
-    )
-    result = manager.add_keys_to_offerings(filter_offerings, purchase_params)
-    print(json.dumps(result, indent=2))
+        def fetch(region):
+            manager = managers[region]
+            """ 1. Stream all offerings """
+            all_offerings = instrumentation.timed(
+                "paginate", manager.iter_offering_ids(params_all)
+            )
+
+            """ 2. Filter offerings to match the specified criteria """
+            filter_offerings = instrumentation.timed(
+                "filter", plan.filter(all_offerings)
+            )
+
+            """ 3. Add Purchase Command and Purchase Offering """
+            purchase_params = OpenSearchPurchaseParams(
+                purchase_profile=purchase_profile,
+                region_name=region,
+                quantity=quantity,
+                reservation_name=reservation_name,
+            )
+            return instrumentation.timed(
+                "enrich", manager.enrich_offerings(filter_offerings, purchase_params)
+            )
+
+        write_offerings(
+            fetch,
+            region_names,
+            max_workers,
+            output,
+            sort,
+            top,
+            on_demand_rate,
+            # An offering ID matches at most one offering: stop at the first hit
+            first_match=reserved_instance_offering_id is not None,
+            instrumentation=instrumentation,
+            output_file=output_file,
+        )
+    if record_snapshot:
+        snapshot.save(record_snapshot)
+    report_timings(instrumentation, timings)
@@ -0,0 +1,167 @@
+import itertools
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import click
+from src.offering_finder.enrichment import materialize
+from src.offering_finder.instrumentation import Instrumentation
+from src.offering_finder.regions import fetch_across_regions, iter_across_regions
+from src.offering_finder.serializers import (
+    OUTPUT_FORMATS,
+    STREAMING_FORMATS,
+    check_output,
+    open_output,
+    write,
+)
+
+# Kept in sync with offering_finder.ranking.RANK_METRICS, which imports numpy
+RANK_METRICS = ["effective_hourly_rate", "total_cost", "break_even_month"]
+
+
+def output_options(f):
+    """
+    Add the output format and file options to a subcommand.
+    """
+    f = click.option(
+        "--output_file",
+        required=False,
+        type=click.Path(dir_okay=False, writable=True),
+        help="Write the output to a file instead of stdout",
+    )(f)
+    f = click.option(
+        "--output",
+        default="json",
+        type=click.Choice(OUTPUT_FORMATS),
+        help=(
+            "Output format: 'json' prints one indented array, 'json-compact' one "
+            "compact array, 'ndjson' streams one offering per line, 'csv' one row "
+            "per offering, 'arrow'/'parquet' a columnar file (requires pyarrow)"
+        ),
+    )(f)
+    return f
+
+
+def require_output(output: str) -> None:
+    """
+    Fail before fetching when the output format cannot be written.
+    """
+    try:
+        check_output(output)
+    except ImportError as e:
+        raise click.UsageError(str(e))
+
+
+def ranking_options(f):
+    """
+    Add the cost ranking options to a subcommand.
+    """
+    f = click.option(
+        "--on_demand_rate",
+        required=False,
+        type=float,
+        help="On-demand hourly rate the break-even month is computed against",
+    )(f)
+    f = click.option(
+        "--top",
+        required=False,
+        type=click.IntRange(min=1),
+        help="Only output the first N offerings (the N cheapest with --by)",
+    )(f)
+    f = click.option(
+        "--sort",
+        "--by",
+        "sort",
+        required=False,
+        type=click.Choice(RANK_METRICS),
+        help="Sort by a cost metric, ascending",
+    )(f)
+    return f
+
+
+def write_records(
+    records: Iterable[Dict[str, Any]],
+    output: str = "json",
+    instrumentation: Optional[Instrumentation] = None,
+    output_file: Optional[str] = None,
+) -> None:
+    """
+    Write records to stdout or output_file, streaming them as they arrive
+    for 'json-compact' and 'ndjson'.
+    Enriched views are materialized here, as they are written.
+    """
+    instrumentation = instrumentation or Instrumentation(enabled=False)
+    require_output(output)
+    with open_output(output_file) as stream:
+        with instrumentation.span("serialize"):
+            write(materialize(records), stream, output)
+
+
+def write_offerings(
+    fetch: Callable[[str], Iterable[Dict[str, Any]]],
+    region_names: Sequence[str],
+    max_workers: int,
+    output: str = "json",
+    sort: Optional[str] = None,
+    top: Optional[int] = None,
+    on_demand_rate: Optional[float] = None,
+    first_match: bool = False,
+    instrumentation: Optional[Instrumentation] = None,
+    output_file: Optional[str] = None,
+) -> None:
+    """
+    Fetch the offerings of every region and write them to stdout or
+    output_file.
+    --top with --by keeps a bounded heap while the offerings stream in, --top
+    alone stops fetching after the first N offerings found, and an exact
+    offering ID lookup (first_match) stops after the first hit. Any other
+    ranking collects every offering first.
+    Time spent waiting for the regions is reported as 'wait_regions'.
+    """
+    instrumentation = instrumentation or Instrumentation(enabled=False)
+    require_output(output)
+    if first_match:
+        top = 1
+
+    def stream() -> Iterator[Dict[str, Any]]:
+        offerings = iter_across_regions(fetch, region_names, max_workers)
+        try:
+            yield from instrumentation.timed("wait_regions", offerings)
+        finally:
+            # Stops the remaining regions and pages when the consumer stops
+            offerings.close()
+
+    def collect() -> List[Dict[str, Any]]:
+        with instrumentation.span("wait_regions"):
+            return fetch_across_regions(fetch, region_names, max_workers)
+
+    if top is not None and (sort is None or first_match):
+        offerings = stream()
+        try:
+            found = list(itertools.islice(offerings, top))
+        finally:
+            offerings.close()
+        if on_demand_rate is not None:
+            from src.offering_finder.ranking import rank_offerings
+
+            with instrumentation.span("rank"):
+                found = rank_offerings(found, on_demand_rate=on_demand_rate)
+        write_records(found, output, instrumentation, output_file)
+        return
+    if top is not None:
+        from src.offering_finder.ranking import top_offerings
+
+        with instrumentation.span("rank"):
+            found = top_offerings(stream(), top, sort, on_demand_rate)
+        write_records(found, output, instrumentation, output_file)
+        return
+    if sort is not None or on_demand_rate is not None:
+        from src.offering_finder.ranking import rank_offerings
+
+        offerings = collect()
+        with instrumentation.span("rank"):
+            ranked = rank_offerings(offerings, sort, top, on_demand_rate)
+        write_records(ranked, output, instrumentation, output_file)
+        return
+    if output in STREAMING_FORMATS:
+        write_records(stream(), output, instrumentation, output_file)
+        return
+    write_records(collect(), output, instrumentation, output_file)
@@ -1,7 +1,12 @@
 import click
-import json
-from src.offering_finder.models.rds_params import RDSParams, RDSPurchaseParams
-from src.offering_finder.managers.rds_manager import RDSManager
+from src.offering_finder.regions import DEFAULT_MAX_WORKERS, resolve_regions
+from mycli.cache import build_cache, cache_options
+from mycli.client import build_client_factory, client_options
+from mycli.output import output_options, ranking_options, write_offerings
+from mycli.snapshot import build_snapshot, snapshot_options
+from mycli.timings import build_instrumentation, report_timings, timings_option
+from mycli.fields import build_fields, fields_option
+from mycli.where import build_where, where_option
 
 
 # rds subcommand
@@ -36,12 +41,38 @@ from src.offering_finder.managers.rds_manager import RDSManager
 @click.option("--quantity", required=True, type=int, help="Quantity (e.g., 2)")
 @click.option(
     "--region_name",
-    required=True,
+    required=False,
+    multiple=True,
     type=str,
-    help="AWS region name (e.g., 'ap-northeast-1')",
+    help="AWS region name, can be repeated (e.g., 'ap-northeast-1')",
+)
+@click.option(
+    "--all_regions", is_flag=True, help="Query every region where RDS is available"
+)
+@click.option(
+    "--max_workers",
+    default=DEFAULT_MAX_WORKERS,
+    type=int,
+    help="Number of regions fetched concurrently",
+)
+@click.option(
+    "--prefetch",
+    default=0,
+    type=int,
+    help="Pages fetched ahead in the background while the current one is processed",
 )
+@output_options
+@ranking_options
+@client_options
+@cache_options
+@snapshot_options
+@where_option
+@fields_option
+@timings_option
 @click.option(
-    "--multi_az", is_flag=True, help="Specify if the instance should be Multi-AZ"
+    "--multi_az",
+    is_flag=True,
+    help="Multi-AZ offerings (default: single-AZ, unless --where tests MultiAZ)",
 )
 @click.option(
     "--offering_type",
@@ -58,6 +89,24 @@ from src.offering_finder.managers.rds_manager import RDSManager
 def rds(
     purchase_profile,
     region_name,
+    all_regions,
+    max_workers,
+    prefetch,
+    output,
+    output_file,
+    sort,
+    top,
+    on_demand_rate,
+    profile,
+    endpoint_url,
+    no_cache,
+    refresh,
+    cache_ttl,
+    record_snapshot,
+    from_snapshot,
+    where,
+    fields,
+    timings,
     reserved_instances_offering_id,
     quantity,
     product_description,
@@ -68,25 +117,92 @@ def rds(
     reserved_instance_id,
 ):
     """Retrieve Amazon RDS offerings"""
-    manager = RDSManager(region_name=region_name)
-    """ 1. Get all offerings """
-    params = RDSParams(
-        ReservedDBInstancesOfferingId=reserved_instances_offering_id,
-        ProductDescription=product_description,
-        DBInstanceClass=db_instance_class,
-        Duration=duration,
-        MultiAZ=multi_az,
-        OfferingType=offering_type,
-    )
-    offerings = manager.get_offerings(params)
+    from src.offering_finder.models.rds_params import RDSParams, RDSPurchaseParams
+    from src.offering_finder.managers.rds_manager import RDSManager
+    from src.offering_finder.planner import plan_query
+
+    instrumentation = build_instrumentation(timings)
+    with instrumentation.span("total"):
+        try:
+            region_names = resolve_regions("rds", region_name, all_regions)
+        except ValueError as e:
+            raise click.UsageError(str(e))
+        cache = build_cache(no_cache, refresh, cache_ttl)
+        snapshot = build_snapshot(record_snapshot, from_snapshot)
+        where_expression = build_where(where)
+        client_factory = build_client_factory(
+            profile, endpoint_url, cache, snapshot, instrumentation
+        )
+        if not multi_az and where_expression is not None:
+            # The flag defaults to single-AZ: without it, a --where term on
+            # MultiAZ decides instead
+            if "MultiAZ" in where_expression.fields():
+                multi_az = None
+        params = RDSParams(
+            ReservedDBInstancesOfferingId=reserved_instances_offering_id,
+            ProductDescription=product_description,
+            DBInstanceClass=db_instance_class,
+            Duration=duration,
+            MultiAZ=multi_az,
+            OfferingType=offering_type,
+        )
+        # Push what the API can filter into the request, check the rest locally
+        plan = plan_query(
+            "rds",
+            {},
+            request=params.model_dump(exclude_none=True),
+            where=where_expression,
+        )
+        params = RDSParams(**plan.request)
+        projection = build_fields(
+            "rds",
+            fields,
+            plan,
+            where_expression,
+            ranked=sort is not None or on_demand_rate is not None,
+        )
+        managers = {
+            name: RDSManager(
+                region_name=name,
+                client_factory=client_factory,
+                prefetch=prefetch,
+                fields=projection,
+            )
+            for name in region_names
+        }
+
+        def fetch(region):
+            manager = managers[region]
+            """ 1. Stream all offerings """
+            offerings = instrumentation.timed(
+                "paginate", manager.iter_offerings(params)
+            )
+            offerings = instrumentation.timed("filter", plan.filter(offerings))
 
-    """ 2. Add Purchase Command and Purchase Offering """
-    purchase_params = RDSPurchaseParams(
-        purchase_profile=purchase_profile,
-        region_name=region_name,
-        quantity=quantity,
-        reserved_instance_id=reserved_instance_id,
-    )
-    result = manager.add_keys_to_offerings(offerings, purchase_params)
+            """ 2. Add Purchase Command and Purchase Offering """
+            purchase_params = RDSPurchaseParams(
+                purchase_profile=purchase_profile,
+                region_name=region,
+                quantity=quantity,
+                reserved_instance_id=reserved_instance_id,
+            )
+            return instrumentation.timed(
+                "enrich", manager.enrich_offerings(offerings, purchase_params)
+            )
 
-    print(json.dumps(result, indent=2))
+        write_offerings(
+            fetch,
+            region_names,
+            max_workers,
+            output,
+            sort,
+            top,
+            on_demand_rate,
+            # An offering ID matches at most one offering: stop at the first hit
+            first_match=reserved_instances_offering_id is not None,
+            instrumentation=instrumentation,
+            output_file=output_file,
+        )
+    if record_snapshot:
+        snapshot.save(record_snapshot)
+    report_timings(instrumentation, timings)
@@ -1,10 +1,12 @@
 import click
-import json
-from src.offering_finder.models.savingsplans_params import (
-    SavingsPlansParams,
-    SavingsPlansPurchaseParams,
-)
-from src.offering_finder.managers.savingsplans_manager import SavingsPlansManager
+from src.offering_finder.regions import DEFAULT_MAX_WORKERS, resolve_regions
+from mycli.cache import build_cache, cache_options
+from mycli.client import build_client_factory, client_options
+from mycli.output import output_options, ranking_options, write_offerings
+from mycli.snapshot import build_snapshot, snapshot_options
+from mycli.timings import build_instrumentation, report_timings, timings_option
+from mycli.fields import build_fields, fields_option
+from mycli.where import build_where, where_option
 
 
 # savingsplans subcommand
@@ -17,11 +19,37 @@ from src.offering_finder.managers.savingsplans_manager import SavingsPlansManage
 )
 @click.option(
     "--region_name",
-    default="ap-northeast-1",
-    required=True,
+    default=["ap-northeast-1"],
+    required=False,
+    multiple=True,
     type=str,
-    help="AWS region name (e.g., 'ap-northeast-1')",
+    help="AWS region name, can be repeated (e.g., 'ap-northeast-1')",
 )
+@click.option(
+    "--all_regions",
+    is_flag=True,
+    help="Query the global Savings Plans catalog once",
+)
+@click.option(
+    "--max_workers",
+    default=DEFAULT_MAX_WORKERS,
+    type=int,
+    help="Number of regions fetched concurrently",
+)
+@click.option(
+    "--prefetch",
+    default=0,
+    type=int,
+    help="Pages fetched ahead in the background while the current one is processed",
+)
+@output_options
+@ranking_options
+@client_options
+@cache_options
+@snapshot_options
+@where_option
+@fields_option
+@timings_option
 @click.option(
     "--offering_id",
     required=False,
@@ -79,9 +107,41 @@ from src.offering_finder.managers.savingsplans_manager import SavingsPlansManage
     help="The purchase time of the Savings Plan in UTC format (YYYY-MM-DDTHH:MM:SSZ).",
 )
 @click.option("--client_token", required=False, type=str, help="Client token")
+@click.option(
+    "--usage_types",
+    required=False,
+    multiple=True,
+    type=str,
+    help="Usage types of the billing line items (e.g., 'USE1-BoxUsage:m5.large')",
+)
+@click.option(
+    "--instance_family",
+    required=False,
+    multiple=True,
+    type=str,
+    help="Instance family, for EC2 Instance Savings Plans (e.g., 'm5')",
+)
 def savingsplans(
     purchase_profile,
     region_name,
+    all_regions,
+    max_workers,
+    prefetch,
+    output,
+    output_file,
+    sort,
+    top,
+    on_demand_rate,
+    profile,
+    endpoint_url,
+    no_cache,
+    refresh,
+    cache_ttl,
+    record_snapshot,
+    from_snapshot,
+    where,
+    fields,
+    timings,
     commitment,
     durations,
     plan_types,
@@ -91,28 +151,97 @@ def savingsplans(
     client_token,
     currency,
     purchase_time,
+    usage_types,
+    instance_family,
 ):
     """Retrieve SavingsPlans offerings"""
-    manager = SavingsPlansManager(region_name=region_name)
-    """ 1. Get all offerings """
-    params = SavingsPlansParams(
-        offeringIds=offering_id,
-        paymentOptions=payment_options,
-        durations=durations,
-        planTypes=plan_types,
-        productType=product_type,
-        currencies=currency,
+    from src.offering_finder.models.savingsplans_params import (
+        SavingsPlansParams,
+        SavingsPlansPurchaseParams,
     )
-    offerings = manager.get_offerings(params)
+    from src.offering_finder.managers.savingsplans_manager import SavingsPlansManager
+    from src.offering_finder.planner import plan_query
 
-    """ 2. Add Purchase Command and Purchase Offering """
-    purchase_params = SavingsPlansPurchaseParams(
-        purchase_profile=purchase_profile,
-        region_name=region_name,
-        commitment=float(commitment),
-        client_token=client_token,
-        purchase_time=purchase_time,
-    )
-    result = manager.add_keys_to_offerings(offerings, purchase_params)
+    instrumentation = build_instrumentation(timings)
+    with instrumentation.span("total"):
+        try:
+            region_names = resolve_regions("savingsplans", region_name, all_regions)
+        except ValueError as e:
+            raise click.UsageError(str(e))
+        cache = build_cache(no_cache, refresh, cache_ttl)
+        snapshot = build_snapshot(record_snapshot, from_snapshot)
+        where_expression = build_where(where)
+        client_factory = build_client_factory(
+            profile, endpoint_url, cache, snapshot, instrumentation
+        )
+        base_params = SavingsPlansParams(
+            offeringIds=offering_id,
+            paymentOptions=payment_options,
+            durations=durations,
+            planTypes=plan_types,
+            productType=product_type,
+            currencies=currency,
+        )
+        plan = plan_query(
+            "savingsplans",
+            {
+                "usageType": usage_types or None,
+                "instanceFamily": instance_family or None,
+            },
+            request=base_params.model_dump(exclude_none=True),
+            where=where_expression,
+        )
+        params = SavingsPlansParams(**plan.request)
+        projection = build_fields(
+            "savingsplans",
+            fields,
+            plan,
+            where_expression,
+            ranked=sort is not None or on_demand_rate is not None,
+        )
+        managers = {
+            name: SavingsPlansManager(
+                region_name=name,
+                client_factory=client_factory,
+                prefetch=prefetch,
+                fields=projection,
+            )
+            for name in region_names
+        }
+
+        def fetch(region):
+            manager = managers[region]
+            """ 1. Stream all offerings """
+            offerings = instrumentation.timed(
+                "paginate", manager.iter_offerings(params)
+            )
+            offerings = instrumentation.timed("filter", plan.filter(offerings))
+
+            """ 2. Add Purchase Command and Purchase Offering """
+            purchase_params = SavingsPlansPurchaseParams(
+                purchase_profile=purchase_profile,
+                region_name=region,
+                commitment=float(commitment),
+                client_token=client_token,
+                purchase_time=purchase_time,
+            )
+            return instrumentation.timed(
+                "enrich", manager.enrich_offerings(offerings, purchase_params)
+            )
 
-    print(json.dumps(result, indent=2))
+        write_offerings(
+            fetch,
+            region_names,
+            max_workers,
+            output,
+            sort,
+            top,
+            on_demand_rate,
+            # An offering ID matches at most one offering: stop at the first hit
+            first_match=len(offering_id) == 1,
+            instrumentation=instrumentation,
+            output_file=output_file,
+        )
+    if record_snapshot:
+        snapshot.save(record_snapshot)
+    report_timings(instrumentation, timings)
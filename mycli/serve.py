@@ -0,0 +1,96 @@
+import os
+
+import click
+from src.offering_finder.regions import DEFAULT_MAX_WORKERS, resolve_regions
+from mycli.client import build_client_factory, client_options
+
+SERVICES = ["rds", "elasticache", "opensearch", "savingsplans"]
+
+
+# serve subcommand
+@click.command()
+@click.option(
+    "--service",
+    "services",
+    multiple=True,
+    type=click.Choice(SERVICES),
+    help="Service whose catalogs are served, can be repeated (default: all)",
+)
+@click.option(
+    "--region_name",
+    required=False,
+    multiple=True,
+    type=str,
+    help="AWS region name, can be repeated (e.g., 'ap-northeast-1')",
+)
+@click.option(
+    "--all_regions", is_flag=True, help="Serve every region where each service is available"
+)
+@click.option(
+    "--refresh_interval",
+    default=3600,
+    type=click.IntRange(min=1),
+    help="Seconds between background catalog refreshes",
+)
+@click.option("--host", default="127.0.0.1", help="Address to listen on")
+@click.option("--port", default=8080, type=int, help="Port to listen on")
+@click.option(
+    "--socket",
+    "socket_path",
+    required=False,
+    type=click.Path(dir_okay=False),
+    help="Listen on a unix socket instead of host and port",
+)
+@click.option(
+    "--max_workers",
+    default=DEFAULT_MAX_WORKERS,
+    type=int,
+    help="Number of catalogs loaded concurrently",
+)
+@client_options
+def serve(
+    services,
+    region_name,
+    all_regions,
+    refresh_interval,
+    host,
+    port,
+    socket_path,
+    max_workers,
+    profile,
+    endpoint_url,
+):
+    """Serve warm catalogs over a local HTTP API"""
+    from src.offering_finder.server import CatalogStore, make_server
+
+    targets = []
+    for service_name in services or SERVICES:
+        try:
+            regions = resolve_regions(service_name, region_name, all_regions)
+        except ValueError as e:
+            raise click.UsageError(str(e))
+        targets.extend((service_name, region) for region in regions)
+    # No offering cache: refreshes must reach the API
+    client_factory = build_client_factory(profile, endpoint_url)
+    store = CatalogStore(targets, client_factory, refresh_interval, max_workers)
+    # Bind first, so a bad address or socket path fails before the catalogs load
+    try:
+        server = make_server(store, host, port, socket_path)
+    except OSError as e:
+        raise click.UsageError(str(e))
+    click.echo(f"Loading {len(targets)} catalogs", err=True)
+    store.refresh()
+    store.start()
+    click.echo(
+        f"Serving on {socket_path or f'http://{host}:{server.server_address[1]}'}",
+        err=True,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        store.stop()
+        if socket_path and os.path.lexists(socket_path):
+            os.unlink(socket_path)
@@ -0,0 +1,37 @@
+from typing import Optional
+
+import click
+from src.offering_finder.clients.Snapshot import Snapshot
+
+
+def snapshot_options(f):
+    """
+    Add the snapshot record and replay options to a subcommand.
+    """
+    f = click.option(
+        "--from_snapshot",
+        required=False,
+        type=click.Path(exists=True, dir_okay=False),
+        help="Replay offerings from a recorded snapshot file without calling AWS",
+    )(f)
+    f = click.option(
+        "--record_snapshot",
+        required=False,
+        type=click.Path(dir_okay=False, writable=True),
+        help="Record the raw describe offerings pages to a snapshot file",
+    )(f)
+    return f
+
+
+def build_snapshot(
+    record_snapshot: Optional[str], from_snapshot: Optional[str]
+) -> Optional[Snapshot]:
+    if record_snapshot and from_snapshot:
+        raise click.UsageError(
+            "--record_snapshot and --from_snapshot cannot be used together"
+        )
+    if from_snapshot:
+        return Snapshot.load(from_snapshot)
+    if record_snapshot:
+        return Snapshot()
+    return None
@@ -0,0 +1,25 @@
+import sys
+from typing import Optional
+
+import click
+from src.offering_finder.instrumentation import Instrumentation
+
+TIMINGS_FORMATS = ["text", "json"]
+
+timings_option = click.option(
+    "--timings",
+    required=False,
+    is_flag=False,
+    flag_value="text",
+    type=click.Choice(TIMINGS_FORMATS),
+    help="Print a per-stage timing summary to stderr ('text' or 'json')",
+)
+
+
+def build_instrumentation(timings: Optional[str]) -> Instrumentation:
+    return Instrumentation(enabled=timings is not None)
+
+
+def report_timings(instrumentation: Instrumentation, timings: Optional[str]) -> None:
+    if timings is not None:
+        instrumentation.report(sys.stderr, timings)
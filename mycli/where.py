@@ -0,0 +1,25 @@
+from typing import Any, Optional
+
+import click
+
+where_option = click.option(
+    "--where",
+    required=False,
+    type=str,
+    help=(
+        "Filter expression over offering fields, e.g. "
+        "'Duration=31536000 and FixedPrice<2000 and ProductDescription~\"postgres\"'"
+    ),
+)
+
+
+def build_where(where: Optional[str]) -> Optional[Any]:
+    if where is None:
+        return None
+    # Imported here: the planner pulls in pydantic
+    from src.offering_finder.expressions import parse_where
+
+    try:
+        return parse_where(where)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="'--where'")
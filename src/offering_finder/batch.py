@@ -0,0 +1,264 @@
+import csv
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from pydantic import BaseModel
+from offering_finder.catalog import OFFERING_ID_FIELDS, OfferingCatalog
+from offering_finder.clients.ClientFactory import ClientFactory
+from offering_finder.enrichment import materialize
+from offering_finder.managers.elasticache_manager import ElastiCacheManager
+from offering_finder.managers.opensearch_manager import OpenSearchManager
+from offering_finder.managers.rds_manager import RDSManager
+from offering_finder.managers.savingsplans_manager import SavingsPlansManager
+from offering_finder.models.elasticache_params import (
+    ElastiCacheParams,
+    ElastiCachePurchaseParams,
+)
+from offering_finder.models.opensearch_params import (
+    OpenSearchParams,
+    OpenSearchPurchaseParams,
+)
+from offering_finder.models.rds_params import RDSParams, RDSPurchaseParams
+from offering_finder.models.savingsplans_params import (
+    SavingsPlansParams,
+    SavingsPlansPurchaseParams,
+)
+from offering_finder.planner import plan_query
+from offering_finder.projection import projection_fields
+from offering_finder.regions import DEFAULT_MAX_WORKERS
+
+MANAGERS = {
+    "rds": RDSManager,
+    "elasticache": ElastiCacheManager,
+    "opensearch": OpenSearchManager,
+    "savingsplans": SavingsPlansManager,
+}
+
+PARAMS = {
+    "rds": RDSParams,
+    "elasticache": ElastiCacheParams,
+    "opensearch": OpenSearchParams,
+    "savingsplans": SavingsPlansParams,
+}
+
+# Inventory column -> offering field, per service
+ITEM_FIELDS: Dict[str, Dict[str, str]] = {
+    "rds": {
+        "instance_class": "DBInstanceClass",
+        "engine": "ProductDescription",
+        "duration": "Duration",
+        "payment_option": "OfferingType",
+        "multi_az": "MultiAZ",
+    },
+    "elasticache": {
+        "instance_class": "CacheNodeType",
+        "engine": "ProductDescription",
+        "duration": "Duration",
+        "payment_option": "OfferingType",
+    },
+    "opensearch": {
+        "instance_class": "InstanceType",
+        "duration": "Duration",
+        "payment_option": "PaymentOption",
+    },
+    "savingsplans": {
+        "instance_class": "instanceFamily",
+        "duration": "durationSeconds",
+        "payment_option": "paymentOption",
+        "plan_type": "planType",
+    },
+}
+
+
+class BatchItem(BaseModel):
+    """
+    Data class for one line item of a fleet inventory.
+    instance_class is the instance family for Savings Plans, and
+    reservation_id is the reserved instance / cache node / reservation name.
+    """
+
+    service: str
+    region: str
+    instance_class: Optional[str] = None
+    engine: Optional[str] = None
+    duration: Optional[int] = None
+    payment_option: Optional[str] = None
+    multi_az: Optional[bool] = None
+    plan_type: Optional[str] = None
+    offering_id: Optional[str] = None
+    quantity: int = 1
+    commitment: Optional[float] = None
+    reservation_id: Optional[str] = None
+    purchase_profile: Optional[str] = None
+
+    def criteria(self) -> Dict[str, Any]:
+        """
+        Offering fields this item has to match.
+        """
+        criteria = {
+            field: getattr(self, column)
+            for column, field in ITEM_FIELDS[self.service].items()
+            if getattr(self, column) is not None
+        }
+        if self.offering_id is not None:
+            criteria[OFFERING_ID_FIELDS[self.service]] = self.offering_id
+        return criteria
+
+
+def load_inventory(path: str) -> List[BatchItem]:
+    """
+    Load the line items of a JSON, YAML or CSV inventory file.
+    JSON and YAML files hold a list of items, or a mapping with an 'items' list.
+    Empty CSV cells are treated as unset.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, newline="") as f:
+        if extension == ".csv":
+            rows: Any = [
+                {k: v for k, v in row.items() if v not in ("", None)}
+                for row in csv.DictReader(f)
+            ]
+        elif extension in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError(
+                    "YAML inventories require PyYAML: "
+                    "pip install 'offering-finder[yaml]'"
+                )
+            rows = yaml.safe_load(f)
+        elif extension == ".json":
+            rows = json.load(f)
+        else:
+            raise ValueError(f"Unsupported inventory format: {path}")
+    if isinstance(rows, dict):
+        rows = rows.get("items", [])
+    items = [BatchItem(**row) for row in rows or []]
+    for item in items:
+        if item.service not in MANAGERS:
+            raise ValueError(f"Unsupported service: {item.service}")
+    return items
+
+
+def group_criteria(items: Iterable[BatchItem]) -> Dict[str, Any]:
+    """
+    Criteria shared by a group of items: a field is kept only when every item
+    constrains it, with the values accepted by any of them. The planner then
+    sends to the API what it can, so the catalog stays as small as possible.
+    """
+    items = list(items)
+    shared: Dict[str, List[Any]] = {}
+    for field in set.intersection(*(set(item.criteria()) for item in items)):
+        values: List[Any] = []
+        for item in items:
+            value = item.criteria()[field]
+            if value not in values:
+                values.append(value)
+        shared[field] = values
+    return shared
+
+
+def build_purchase_params(item: BatchItem, purchase_profile: Optional[str]) -> Any:
+    profile = item.purchase_profile or purchase_profile
+    if item.service == "rds":
+        return RDSPurchaseParams(
+            purchase_profile=profile,
+            region_name=item.region,
+            quantity=item.quantity,
+            reserved_instance_id=item.reservation_id,
+        )
+    if item.service == "elasticache":
+        return ElastiCachePurchaseParams(
+            purchase_profile=profile,
+            region_name=item.region,
+            quantity=item.quantity,
+            reserved_cache_node_id=item.reservation_id,
+        )
+    if item.service == "opensearch":
+        return OpenSearchPurchaseParams(
+            purchase_profile=profile,
+            region_name=item.region,
+            quantity=item.quantity,
+            reservation_name=item.reservation_id,
+        )
+    return SavingsPlansPurchaseParams(
+        purchase_profile=profile,
+        region_name=item.region,
+        commitment=item.commitment or 0.0,
+    )
+
+
+def run_batch(
+    items: List[BatchItem],
+    client_factory: Optional[ClientFactory] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    purchase_profile: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Answer every line item, fetching each (service, region) catalog only once.
+    Returns one result per item, in inventory order, with the matching
+    offerings enriched with their purchase command. Items whose catalog
+    could not be fetched carry an 'Error' instead.
+    With fields set, the catalogs only keep those offering fields, plus the
+    ones the items are matched on.
+    """
+    groups: Dict[Tuple[str, str], List[BatchItem]] = {}
+    for item in items:
+        groups.setdefault((item.service, item.region), []).append(item)
+
+    # boto3 clients are created here, on one thread
+    managers = {
+        key: MANAGERS[key[0]](
+            region_name=key[1],
+            client_factory=client_factory,
+            fields=projection_fields(
+                key[0], fields, *(item.criteria() for item in groups[key])
+            ),
+        )
+        for key in groups
+    }
+
+    def fetch(key: Tuple[str, str]) -> OfferingCatalog:
+        service_name, _ = key
+        params_class = PARAMS[service_name]
+        plan = plan_query(service_name, group_criteria(groups[key]))
+        # Unset model defaults (e.g. Duration) would narrow the catalog
+        params = params_class(
+            **{**{name: None for name in params_class.model_fields}, **plan.request}
+        )
+        return OfferingCatalog.from_manager(managers[key], params, compact=True)
+
+    catalogs: Dict[Tuple[str, str], OfferingCatalog] = {}
+    errors: Dict[Tuple[str, str], str] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {key: executor.submit(fetch, key) for key in groups}
+        for key, future in futures.items():
+            try:
+                catalogs[key] = future.result()
+            except Exception as e:
+                logging.error(f"Failed to fetch {key[0]} offerings in {key[1]}: {e}")
+                errors[key] = str(e)
+
+    results = []
+    for item in items:
+        key = (item.service, item.region)
+        result: Dict[str, Any] = {"Item": item.model_dump(exclude_none=True)}
+        if key in errors:
+            result["Error"] = errors[key]
+            results.append(result)
+            continue
+        offerings = list(
+            materialize(
+                managers[key].enrich_offerings(
+                    catalogs[key].query(item.criteria()),
+                    build_purchase_params(item, purchase_profile),
+                )
+            )
+        )
+        result["MatchCount"] = len(offerings)
+        result["Offerings"] = offerings
+        results.append(result)
+    return results
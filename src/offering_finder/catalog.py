@@ -0,0 +1,185 @@
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set
+from offering_finder.planner import offering_value, values_equal
+from offering_finder.records import to_record
+
+OFFERING_ID_FIELDS: Dict[str, str] = {
+    "rds": "ReservedDBInstancesOfferingId",
+    "elasticache": "ReservedCacheNodesOfferingId",
+    "opensearch": "ReservedInstanceOfferingId",
+    "savingsplans": "offeringId",
+}
+
+INDEX_FIELDS: Dict[str, tuple] = {
+    "rds": (
+        "ReservedDBInstancesOfferingId",
+        "DBInstanceClass",
+        "Duration",
+        "OfferingType",
+        "ProductDescription",
+        "CurrencyCode",
+        "MultiAZ",
+        "RegionName",
+    ),
+    "elasticache": (
+        "ReservedCacheNodesOfferingId",
+        "CacheNodeType",
+        "Duration",
+        "OfferingType",
+        "ProductDescription",
+        "RegionName",
+    ),
+    "opensearch": (
+        "ReservedInstanceOfferingId",
+        "InstanceType",
+        "Duration",
+        "PaymentOption",
+        "CurrencyCode",
+        "RegionName",
+    ),
+    "savingsplans": (
+        "offeringId",
+        "planType",
+        "durationSeconds",
+        "paymentOption",
+        "currency",
+        "productTypes",
+        "usageType",
+        "RegionName",
+    ),
+}
+
+
+def index_key(value: Any) -> str:
+    """
+    Normalize a value into an index key, consistently with values_equal:
+    '31536000' and 31536000 share a key, booleans are lower-cased.
+    """
+    if isinstance(value, bool):
+        return str(value).lower()
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return str(value)
+    return str(int(number)) if number.is_integer() else str(number)
+
+
+class OfferingCatalog:
+    """
+    In-memory catalog of one service's offerings with hash indexes on the
+    common dimensions. Multi-field queries intersect the matching index
+    entries, starting from the smallest, and only check the remaining
+    non-indexed criteria on those candidates.
+    Queries return the stored offering dicts; copy them before mutating.
+    With compact set, offerings are stored as read-only OfferingRecords,
+    which take a fraction of the memory of the response dicts.
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        offerings: Optional[Iterable[Dict[str, Any]]] = None,
+        compact: bool = False,
+    ) -> None:
+        self.service_name = service_name
+        self.compact = compact
+        self.index_fields = INDEX_FIELDS[service_name]
+        self.offerings: List[Dict[str, Any]] = []
+        self._indexes: Dict[str, Dict[str, Set[int]]] = {
+            field: defaultdict(set) for field in self.index_fields
+        }
+        if offerings is not None:
+            self.add(offerings)
+
+    @classmethod
+    def from_manager(
+        cls, manager: Any, params: Any, compact: bool = False
+    ) -> "OfferingCatalog":
+        """
+        Load a catalog through a manager's iter_offerings (or OpenSearch's
+        iter_offering_ids).
+        """
+        fetch = getattr(manager, "iter_offerings", None) or manager.iter_offering_ids
+        return cls(manager.client.service_name, fetch(params), compact=compact)
+
+    def add(self, offerings: Iterable[Dict[str, Any]]) -> None:
+        # Values repeated across the added records are shared through a table
+        # dropped once they are built, so it never outlives the catalog
+        shared: Dict[Any, Any] = {}
+        for offering in offerings:
+            if self.compact:
+                offering = to_record(self.service_name, offering, shared)
+            position = len(self.offerings)
+            self.offerings.append(offering)
+            for field in self.index_fields:
+                value = offering_value(offering, field)
+                if value is None:
+                    continue
+                values = value if isinstance(value, (list, tuple)) else [value]
+                for v in values:
+                    self._indexes[field][index_key(v)].add(position)
+
+    def query(
+        self, criteria: Optional[Dict[str, Any]] = None, **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the offerings matching every criterion.
+        A criterion value may be a list of accepted values; None is ignored.
+        """
+        criteria = {**(criteria or {}), **kwargs}
+        criteria = {k: v for k, v in criteria.items() if v is not None}
+        candidate_sets = []
+        residual = {}
+        for field, expected in criteria.items():
+            if field not in self._indexes:
+                residual[field] = expected
+                continue
+            index = self._indexes[field]
+            accepted = expected if isinstance(expected, (list, tuple)) else [expected]
+            if len(accepted) == 1:
+                candidate_sets.append(index.get(index_key(accepted[0]), set()))
+            else:
+                candidate_sets.append(
+                    set().union(*(index.get(index_key(v), set()) for v in accepted))
+                )
+        if candidate_sets:
+            candidate_sets.sort(key=len)
+            positions = candidate_sets[0].intersection(*candidate_sets[1:])
+        else:
+            positions = range(len(self.offerings))
+        result = []
+        for position in sorted(positions):
+            offering = self.offerings[position]
+            if all(
+                self._matches(offering, field, expected)
+                for field, expected in residual.items()
+            ):
+                result.append(offering)
+        return result
+
+    def where(self, expression: Any) -> List[Dict[str, Any]]:
+        """
+        Return the offerings matching a where expression: its equality terms
+        are looked up in the indexes, and only the candidates they leave are
+        checked against the rest of the expression.
+        """
+        criteria, predicate = expression.split()
+        candidates = self.query(criteria)
+        if predicate is None:
+            return candidates
+        return [offering for offering in candidates if predicate(offering)]
+
+    def get(self, offering_id: str) -> Optional[Dict[str, Any]]:
+        result = self.query({OFFERING_ID_FIELDS[self.service_name]: offering_id})
+        return result[0] if result else None
+
+    def __len__(self) -> int:
+        return len(self.offerings)
+
+    @staticmethod
+    def _matches(offering: Dict[str, Any], field: str, expected: Any) -> bool:
+        actual = offering_value(offering, field)
+        if actual is None:
+            return False
+        accepted = expected if isinstance(expected, (list, tuple)) else [expected]
+        return any(values_equal(actual, e) for e in accepted)
@@ -1,18 +1,135 @@
-import boto3
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Sequence
+from offering_finder.clients.ClientFactory import ClientFactory, default_client_factory
+from offering_finder.clients.OfferingCache import OfferingCache
+from offering_finder.clients.Paginator import PAGINATION_DESCRIPTORS
+from offering_finder.projection import project_page
 
 
 class AWSClient:
     def __init__(
         self,
         service_name: str,
-        region_name: str
+        region_name: str,
+        client_factory: Optional[ClientFactory] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> None:
-        self.client = boto3.client(service_name, region_name=region_name)
+        factory = client_factory or default_client_factory()
+        self.service_name = service_name
+        self.region_name = region_name
+        # Offering fields kept from each page, None to keep them all
+        self.fields = tuple(fields) if fields else None
+        self.cache = factory.cache
+        self.endpoint_url = factory.endpoint_url
+        self.profile_name = factory.profile_name
+        self.snapshot = factory.snapshot
+        self.single_flight = factory.single_flight
+        self.limiter = factory.rate_limiter.limiter(service_name, region_name)
+        self.instrumentation = factory.instrumentation
+        descriptor = PAGINATION_DESCRIPTORS.get(service_name)
+        self.result_key = descriptor.result_key if descriptor is not None else None
+        if self.snapshot is not None and self.snapshot.replay:
+            self.client = None
+        else:
+            with self.instrumentation.span("client_init"):
+                self.client = factory.client(service_name, region_name)
 
     def describe_offerings(
         self,
         params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Fetch one page of offerings, served from the snapshot being replayed or
+        from the cache when possible. Concurrent identical requests share one
+        in-flight call. Pages are recorded into the snapshot unless it is being
+        replayed. With fields set, the offerings of each page are projected
+        as soon as it is parsed, and only the projected page is cached; the
+        cache is then not read while recording, since a snapshot needs the
+        full page.
+        """
+        with self.instrumentation.span("describe_offerings"):
+            if self.snapshot is not None and self.snapshot.replay:
+                response = self._project(
+                    self.snapshot.get(self.service_name, self.region_name, params)
+                )
+            else:
+                key = OfferingCache.make_key(
+                    self.service_name,
+                    self.region_name,
+                    params,
+                    self.fields,
+                    endpoint_url=self.endpoint_url,
+                    profile_name=self.profile_name,
+                )
+                if self.single_flight is None:
+                    response = self._fetch_offerings(key, params)
+                else:
+                    response = self.single_flight.do(
+                        key, lambda: self._fetch_offerings(key, params)
+                    )
+        self.instrumentation.count("pages")
+        if self.result_key is not None:
+            self.instrumentation.count(
+                "items", len(response.get(self.result_key) or [])
+            )
+        return response
+
+    def _fetch_offerings(self, key: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        # A projected cached page cannot be recorded: snapshots keep full pages
+        use_cache = self.cache is not None and (
+            self.snapshot is None or self.fields is None
+        )
+        response = self.cache.get(key) if use_cache else None
+        if response is None:
+            response = self._call_api(params)
+            if self.snapshot is not None:
+                # Snapshots keep the full pages, so they replay any projection
+                self.snapshot.record(
+                    self.service_name, self.region_name, params, response
+                )
+            response = self._project(response)
+            if self.cache is not None:
+                self.cache.set(
+                    key, {k: v for k, v in response.items() if k != "ResponseMetadata"}
+                )
+        else:
+            self.instrumentation.count("cache_hits")
+            if self.snapshot is not None:
+                self.snapshot.record(
+                    self.service_name, self.region_name, params, response
+                )
+        return response
+
+    def _project(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        if self.fields is None:
+            return response
+        with self.instrumentation.span("project"):
+            return project_page(response, self.result_key, self.fields)
+
+    def _call_api(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Call the API within the (service, region) rate and concurrency limits.
+        Throttles are reported to the limiter by the client's event handler.
+        """
+        with self.instrumentation.span("rate_limit_wait"):
+            self.limiter.acquire()
+        try:
+            with self.instrumentation.span("api_call"):
+                response = self._describe_offerings(params)
+            self.limiter.on_success()
+        finally:
+            self.limiter.release()
+        if self.instrumentation.enabled:
+            metadata = response.get("ResponseMetadata") or {}
+            self.instrumentation.count("api_calls")
+            self.instrumentation.count("retries", metadata.get("RetryAttempts") or 0)
+            length = (metadata.get("HTTPHeaders") or {}).get("content-length")
+            if length is not None:
+                self.instrumentation.count("bytes", int(length))
+        return response
+
+    def _describe_offerings(
+        self,
+        params: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
         Wrapper for AWS describe_reserved_db_instances_offerings or describe_reserved_cache_nodes_offerings API.
@@ -0,0 +1,140 @@
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from offering_finder.clients.OfferingCache import OfferingCache
+from offering_finder.clients.RateLimiter import RateLimiter, is_throttling_response
+from offering_finder.clients.SingleFlight import SingleFlight
+from offering_finder.clients.Snapshot import Snapshot
+from offering_finder.instrumentation import Instrumentation
+
+if TYPE_CHECKING:
+    import boto3
+
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+# The RateLimiter paces requests, so botocore's adaptive client-side limiter
+# is not stacked on top of it
+DEFAULT_RETRY_MODE = "standard"
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 30
+
+
+class ClientFactory:
+    """
+    Creates boto3 clients from one shared boto3.Session per profile and keeps
+    them per (profile, service, region), so a process querying several
+    services and regions builds each client only once.
+    The factory also carries the offering cache, snapshot, single-flight
+    group, rate limiter and instrumentation shared by every AWSClient it
+    backs. boto3 and botocore are imported only once a client is
+    actually needed, which keeps CLI startup fast.
+    """
+
+    def __init__(
+        self,
+        profile_name: Optional[str] = None,
+        endpoint_url: Optional[str] = None,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+        tcp_keepalive: bool = True,
+        retry_mode: str = DEFAULT_RETRY_MODE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        cache: Optional[OfferingCache] = None,
+        snapshot: Optional[Snapshot] = None,
+        single_flight: Optional[SingleFlight] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> None:
+        self.profile_name = profile_name
+        self.endpoint_url = endpoint_url
+        self.cache = cache
+        self.snapshot = snapshot
+        self.single_flight = single_flight or SingleFlight()
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.instrumentation = instrumentation or Instrumentation(enabled=False)
+        self.config_options: Dict[str, Any] = {
+            "max_pool_connections": max_pool_connections,
+            "tcp_keepalive": tcp_keepalive,
+            "retries": {"mode": retry_mode, "max_attempts": max_attempts},
+            "connect_timeout": connect_timeout,
+            "read_timeout": read_timeout,
+        }
+        self._config = None
+        self._lock = threading.Lock()
+        self._sessions: Dict[Optional[str], "boto3.Session"] = {}
+        self._clients: Dict[Tuple[Optional[str], str, str], Any] = {}
+
+    @property
+    def config(self) -> Any:
+        """
+        botocore Config applied to every client.
+        """
+        if self._config is None:
+            from botocore.config import Config
+
+            self._config = Config(**self.config_options)
+        return self._config
+
+    def session(self, profile_name: Optional[str] = None) -> "boto3.Session":
+        profile_name = profile_name or self.profile_name
+        with self._lock:
+            return self._session(profile_name)
+
+    def _session(self, profile_name: Optional[str]) -> "boto3.Session":
+        if profile_name not in self._sessions:
+            import boto3
+
+            self._sessions[profile_name] = boto3.Session(profile_name=profile_name)
+        return self._sessions[profile_name]
+
+    def client(
+        self, service_name: str, region_name: str, profile_name: Optional[str] = None
+    ) -> Any:
+        """
+        Return the boto3 client for the service and region, creating it on
+        first use. boto3 sessions are not safe for concurrent client
+        creation, so creation is serialized.
+        """
+        profile_name = profile_name or self.profile_name
+        key = (profile_name, service_name, region_name)
+        with self._lock:
+            if key not in self._clients:
+                with self.instrumentation.span("create_client"):
+                    client = self._session(profile_name).client(
+                        service_name,
+                        region_name=region_name,
+                        endpoint_url=self.endpoint_url,
+                        config=self.config,
+                    )
+                self.rate_limiter.observe(client, service_name, region_name)
+                if self.instrumentation.enabled:
+                    self._observe(client)
+                self._clients[key] = client
+            return self._clients[key]
+
+    def _observe(self, client: Any) -> None:
+        """
+        Count the throttling errors botocore retries internally.
+        """
+        instrumentation = self.instrumentation
+
+        def on_needs_retry(response: Any = None, **kwargs: Any) -> None:
+            if response is not None and is_throttling_response(response[1]):
+                instrumentation.count("throttles")
+
+        client.meta.events.register("needs-retry", on_needs_retry)
+
+
+_default_client_factory: Optional[ClientFactory] = None
+_default_lock = threading.Lock()
+
+
+def default_client_factory() -> ClientFactory:
+    """
+    Return the process-wide factory used when none is given explicitly.
+    """
+    global _default_client_factory
+    with _default_lock:
+        if _default_client_factory is None:
+            _default_client_factory = ClientFactory()
+        return _default_client_factory
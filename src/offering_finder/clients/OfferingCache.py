@@ -0,0 +1,134 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "offering_finder",
+    "offerings.sqlite3",
+)
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_MAX_SIZE = 100 * 1024 * 1024
+
+
+class OfferingCache:
+    """
+    On-disk cache of describe offerings responses backed by SQLite.
+    Entries expire after ttl seconds, and the least recently used entries are
+    evicted once the stored responses exceed max_size bytes.
+    With refresh=True the cache is written but never read.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: float = DEFAULT_TTL,
+        max_size: int = DEFAULT_MAX_SIZE,
+        refresh: bool = False,
+    ) -> None:
+        self.path = path or os.environ.get("OFFERING_FINDER_CACHE", DEFAULT_CACHE_PATH)
+        self.ttl = ttl
+        self.max_size = max_size
+        self.refresh = refresh
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS offerings ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def make_key(
+        service_name: str,
+        region_name: str,
+        params: Dict[str, Any],
+        fields: Optional[Sequence[str]] = None,
+        endpoint_url: Optional[str] = None,
+        profile_name: Optional[str] = None,
+    ) -> str:
+        """
+        Build the cache key from the service, region and request parameters,
+        the projected fields when the cached pages are projected, and the
+        endpoint and profile when they are not the defaults, so pages from a
+        local stand-in are never served to a run against AWS.
+        """
+        parts: List[Any] = [service_name, region_name, params]
+        if fields:
+            parts.append(sorted(fields))
+        if endpoint_url or profile_name:
+            parts.append({"endpoint_url": endpoint_url, "profile": profile_name})
+        raw = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.refresh:
+            return None
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT value, created_at FROM offerings WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if now - row[1] > self.ttl:
+                    self._conn.execute("DELETE FROM offerings WHERE key = ?", (key,))
+                    return None
+                self._conn.execute(
+                    "UPDATE offerings SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+            return json.loads(row[0])
+        except sqlite3.Error as e:
+            logging.warning(f"Offering cache read failed: {e}")
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        now = time.time()
+        data = json.dumps(value, default=str)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO offerings VALUES (?, ?, ?, ?, ?)",
+                    (key, data, len(data), now, now),
+                )
+                self._evict(now)
+        except sqlite3.Error as e:
+            logging.warning(f"Offering cache write failed: {e}")
+
+    def _evict(self, now: float) -> None:
+        self._conn.execute(
+            "DELETE FROM offerings WHERE created_at < ?", (now - self.ttl,)
+        )
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM offerings"
+        ).fetchone()[0]
+        if total <= self.max_size:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM offerings ORDER BY accessed_at, rowid"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_size:
+                break
+            self._conn.execute("DELETE FROM offerings WHERE key = ?", (key,))
+            total -= size
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM offerings")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,169 @@
+import logging
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from offering_finder.clients.AWSClient import AWSClient
+
+
+class PaginationDescriptor(BaseModel):
+    """
+    Data class describing how a describe offerings API pages its results.
+    The token field has the same name in the request and the response.
+    """
+
+    result_key: str
+    token_field: str
+    page_size_field: str
+    max_page_size: int
+
+
+PAGINATION_DESCRIPTORS: Dict[str, PaginationDescriptor] = {
+    "rds": PaginationDescriptor(
+        result_key="ReservedDBInstancesOfferings",
+        token_field="Marker",
+        page_size_field="MaxRecords",
+        max_page_size=100,
+    ),
+    "elasticache": PaginationDescriptor(
+        result_key="ReservedCacheNodesOfferings",
+        token_field="Marker",
+        page_size_field="MaxRecords",
+        max_page_size=100,
+    ),
+    "opensearch": PaginationDescriptor(
+        result_key="ReservedInstanceOfferings",
+        token_field="NextToken",
+        page_size_field="MaxResults",
+        max_page_size=100,
+    ),
+    "savingsplans": PaginationDescriptor(
+        result_key="searchResults",
+        token_field="nextToken",
+        page_size_field="maxResults",
+        max_page_size=1000,
+    ),
+}
+
+
+class PageStats(BaseModel):
+    """
+    Data class for the timing of a single fetched page.
+    """
+
+    page_number: int
+    item_count: int
+    elapsed: float
+
+
+class Paginator:
+    def __init__(
+        self,
+        client: "AWSClient",
+        descriptor: Optional[PaginationDescriptor] = None,
+        page_size: Optional[int] = None,
+        on_page: Optional[Callable[[PageStats], None]] = None,
+        prefetch: int = 0,
+    ) -> None:
+        self.client = client
+        self.descriptor = descriptor or PAGINATION_DESCRIPTORS[client.service_name]
+        self.page_size = page_size
+        self.on_page = on_page
+        self.prefetch = prefetch
+
+    def pages(self, params: Dict[str, Any]) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Lazily yield the offerings of each page, following the pagination token.
+        An empty token is treated as the last page, since Savings Plans returns
+        'nextToken': '' when there are no more results.
+        With prefetch set, a background thread fetches up to that many pages
+        ahead while the consumer processes the current one.
+        """
+        if self.prefetch > 0:
+            return self._prefetch_pages(params)
+        return self._fetch_pages(params)
+
+    def _prefetch_pages(self, params: Dict[str, Any]) -> Iterator[List[Dict[str, Any]]]:
+        pages: queue.Queue = queue.Queue(maxsize=self.prefetch)
+        stopped = threading.Event()
+        done = object()
+        errors = []
+
+        def put(item: Any) -> bool:
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for page in self._fetch_pages(params):
+                    if not put(page):
+                        return
+            except Exception as e:
+                errors.append(e)
+            finally:
+                put(done)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        try:
+            while True:
+                page = pages.get()
+                if page is done:
+                    break
+                yield page
+        finally:
+            # Let the producer exit when the consumer stops early
+            stopped.set()
+        if errors:
+            raise errors[0]
+
+    def _fetch_pages(self, params: Dict[str, Any]) -> Iterator[List[Dict[str, Any]]]:
+        fetch_params = dict(params)
+        if self.page_size is not None:
+            fetch_params[self.descriptor.page_size_field] = min(
+                self.page_size, self.descriptor.max_page_size
+            )
+        else:
+            # Fewer, larger pages: request the API maximum unless told otherwise
+            fetch_params.setdefault(
+                self.descriptor.page_size_field, self.descriptor.max_page_size
+            )
+        page_number = 0
+        while True:
+            start = time.perf_counter()
+            response = self.client.describe_offerings(fetch_params)
+            elapsed = time.perf_counter() - start
+            items = response.get(self.descriptor.result_key, [])
+            page_number += 1
+            stats = PageStats(
+                page_number=page_number, item_count=len(items), elapsed=elapsed
+            )
+            logging.debug(
+                f"Fetched page {stats.page_number} ({stats.item_count} items) "
+                f"in {stats.elapsed:.3f}s"
+            )
+            if self.on_page:
+                self.on_page(stats)
+            yield items
+            token = response.get(self.descriptor.token_field)
+            if not token:
+                break
+            if token == fetch_params.get(self.descriptor.token_field):
+                logging.warning(f"Pagination token did not advance: {token}")
+                break
+            fetch_params[self.descriptor.token_field] = token
+
+    def items(self, params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield every offering across all pages.
+        """
+        for page in self.pages(params):
+            yield from page
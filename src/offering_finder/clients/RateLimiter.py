@@ -0,0 +1,150 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+THROTTLING_ERROR_CODES = frozenset(
+    {
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestLimitExceeded",
+        "TooManyRequestsException",
+        "RequestThrottled",
+        "RequestThrottledException",
+    }
+)
+
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 10
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MIN_RATE = 0.5
+
+
+def is_throttling_response(parsed: Optional[Dict[str, Any]]) -> bool:
+    """
+    Return True if a parsed botocore response is a throttling error.
+    """
+    if not parsed:
+        return False
+    return parsed.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+
+
+class AdaptiveLimiter:
+    """
+    Token bucket capping the request rate, combined with an AIMD concurrency
+    limit: every throttle halves the concurrency and the rate, and every
+    success grows them back additively (about one slot per window of
+    successful requests).
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        min_rate: float = DEFAULT_MIN_RATE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.concurrency = float(max_concurrency)
+        self.in_flight = 0
+        self.throttles = 0
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """
+        Block until a concurrency slot and a token are available.
+        """
+        with self._condition:
+            while True:
+                self._refill()
+                if self.in_flight < int(self.concurrency) and self._tokens >= 1:
+                    self._tokens -= 1
+                    self.in_flight += 1
+                    return
+                timeout = None
+                if self.in_flight < int(self.concurrency):
+                    timeout = (1 - self._tokens) / self.rate
+                self._condition.wait(timeout)
+
+    def release(self) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self) -> None:
+        with self._condition:
+            self.concurrency = min(
+                float(self.max_concurrency), self.concurrency + 1 / self.concurrency
+            )
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+            self._condition.notify_all()
+
+    def on_throttle(self) -> None:
+        with self._condition:
+            self.throttles += 1
+            self.concurrency = max(1.0, self.concurrency / 2)
+            self.rate = max(self.min_rate, self.rate / 2)
+            logging.debug(
+                f"Throttled: concurrency {self.concurrency:.1f}, rate {self.rate:.2f}/s"
+            )
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+
+class RateLimiter:
+    """
+    One AdaptiveLimiter per (service, region), shared by every client of a
+    ClientFactory. Throttles are observed through botocore's 'needs-retry'
+    event, so the limiter reacts to each throttled attempt, including those
+    botocore retries internally.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._limiters: Dict[Tuple[str, str], AdaptiveLimiter] = {}
+
+    def limiter(self, service_name: str, region_name: str) -> AdaptiveLimiter:
+        key = (service_name, region_name)
+        with self._lock:
+            if key not in self._limiters:
+                self._limiters[key] = AdaptiveLimiter(
+                    rate=self.rate,
+                    burst=self.burst,
+                    max_concurrency=self.max_concurrency,
+                )
+            return self._limiters[key]
+
+    def observe(self, client: Any, service_name: str, region_name: str) -> None:
+        """
+        Register a botocore event handler feeding the client's throttles to
+        its limiter.
+        """
+        limiter = self.limiter(service_name, region_name)
+
+        def on_needs_retry(response=None, **kwargs: Any) -> None:
+            if response is not None and is_throttling_response(response[1]):
+                limiter.on_throttle()
+
+        client.meta.events.register("needs-retry", on_needs_retry)
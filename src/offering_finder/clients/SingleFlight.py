@@ -0,0 +1,78 @@
+import copy
+import threading
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+
+class SingleFlightStats(NamedTuple):
+    """
+    Single-flight metrics. A NamedTuple rather than a pydantic model, since
+    the CLI imports the client factory before pydantic is needed.
+    """
+
+    calls: int = 0
+    coalesced: int = 0
+
+    @property
+    def executions(self) -> int:
+        return self.calls - self.coalesced
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.followers = 0
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key: the first caller runs the
+    function, and the callers arriving while it is in flight wait for it and
+    share its result (or its exception).
+    Every caller gets its own deep copy of a shared result, since callers
+    may still modify the offerings (e.g. tagging RegionName).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._calls_count = 0
+        self._coalesced_count = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            self._calls_count += 1
+            call = self._calls.get(key)
+            if call is not None:
+                call.followers += 1
+                self._coalesced_count += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        else:
+            call.result = result
+        finally:
+            # No caller can join once the key is removed, so followers is final
+            with self._lock:
+                del self._calls[key]
+                followers = call.followers
+            call.done.set()
+        return copy.deepcopy(result) if followers else result
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(self._calls_count, self._coalesced_count)
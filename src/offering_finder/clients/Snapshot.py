@@ -0,0 +1,87 @@
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional
+from offering_finder.clients.OfferingCache import OfferingCache
+
+
+class SnapshotMissError(KeyError):
+    """
+    Raised when a replayed request was not recorded in the snapshot.
+    """
+
+
+class Snapshot:
+    """
+    Raw describe offerings pages recorded to a JSON file.
+    In replay mode AWSClient answers every request from the snapshot, without
+    AWS credentials or network access.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self, pages: Optional[List[Dict[str, Any]]] = None, replay: bool = False
+    ) -> None:
+        self.replay = replay
+        self._lock = threading.Lock()
+        self._pages: Dict[str, Dict[str, Any]] = {}
+        for page in pages or []:
+            key = OfferingCache.make_key(
+                page["service_name"], page["region_name"], page["params"]
+            )
+            self._pages[key] = page
+
+    @classmethod
+    def load(cls, path: str, replay: bool = True) -> "Snapshot":
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Unsupported snapshot version: {data.get('version')}")
+        return cls(pages=data["pages"], replay=replay)
+
+    def save(self, path: str) -> None:
+        with self._lock:
+            data = {"version": self.VERSION, "pages": list(self._pages.values())}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, default=str)
+        os.replace(tmp_path, path)
+
+    def record(
+        self,
+        service_name: str,
+        region_name: str,
+        params: Dict[str, Any],
+        response: Dict[str, Any],
+    ) -> None:
+        key = OfferingCache.make_key(service_name, region_name, params)
+        page = {
+            "service_name": service_name,
+            "region_name": region_name,
+            "params": dict(params),
+            # Copied now, since callers may modify the offerings afterwards
+            "response": json.loads(
+                json.dumps(
+                    {k: v for k, v in response.items() if k != "ResponseMetadata"},
+                    default=str,
+                )
+            ),
+        }
+        with self._lock:
+            self._pages[key] = page
+
+    def get(
+        self, service_name: str, region_name: str, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        key = OfferingCache.make_key(service_name, region_name, params)
+        with self._lock:
+            page = self._pages.get(key)
+        if page is None:
+            raise SnapshotMissError(
+                f"No recorded page for {service_name} in {region_name}: {params}"
+            )
+        return json.loads(json.dumps(page["response"]))
+
+    def __len__(self) -> int:
+        return len(self._pages)
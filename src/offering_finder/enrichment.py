@@ -0,0 +1,121 @@
+import datetime
+import logging
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+
+def as_dict(offering: Any) -> Any:
+    """
+    Materialize an enriched view or compact record into a plain dict for JSON;
+    anything else is returned as is.
+    """
+    to_dict = getattr(offering, "to_dict", None)
+    return to_dict() if to_dict is not None else offering
+
+
+def materialize(offerings: Iterable[Any]) -> Iterator[Any]:
+    """
+    Lazily materialize offerings with as_dict. An offering whose purchase
+    command fails to render is logged and skipped, like an offering that
+    fails to enrich, instead of aborting the whole output.
+    """
+    for offering in offerings:
+        try:
+            yield as_dict(offering)
+        except Exception as e:
+            logging.error(
+                f"Unexpected error processing offering: {e}, "
+                f"offering_id: {getattr(offering, 'offering_id', 'unknown')}"
+            )
+
+
+class Enrichment:
+    """
+    State shared by one enrichment batch: a single run timestamp and the
+    purchase command renderer, called with the offering ID.
+    """
+
+    __slots__ = ("timestamp", "render_command")
+
+    def __init__(
+        self,
+        render_command: Callable[[str], str],
+        timestamp: Optional[str] = None,
+    ) -> None:
+        self.render_command = render_command
+        self.timestamp = (
+            timestamp or datetime.datetime.now(datetime.timezone.utc).isoformat()
+        )
+
+
+class EnrichedOffering(Mapping):
+    """
+    View over an offering that adds the order keys, the batch timestamp and
+    the purchase command without modifying the offering, so a cached catalog
+    can be shared and enriched per request. The purchase command is rendered
+    on first access. Keys set on the view (e.g. RegionName) stay on the view.
+    """
+
+    __slots__ = ("offering", "offering_id", "_keys", "_batch", "_command", "_extra")
+
+    def __init__(
+        self,
+        offering: Mapping,
+        offering_id: str,
+        keys: Dict[str, Any],
+        batch: Enrichment,
+    ) -> None:
+        self.offering = offering
+        self.offering_id = offering_id
+        self._keys = keys
+        self._batch = batch
+        self._command: Optional[str] = None
+        self._extra: Optional[Dict[str, Any]] = None
+
+    @property
+    def purchase_command(self) -> str:
+        if self._command is None:
+            self._command = self._batch.render_command(self.offering_id)
+        return self._command
+
+    def __getitem__(self, key: str) -> Any:
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        if key in self._keys:
+            return self._keys[key]
+        if key == "Timestamp":
+            return self._batch.timestamp
+        if key == "PurchaseCommand":
+            return self.purchase_command
+        return self.offering[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+
+    def __iter__(self) -> Iterator[str]:
+        # Same order as to_dict, without rendering the purchase command
+        seen = set()
+        for keys in (
+            self.offering,
+            self._keys,
+            ("Timestamp", "PurchaseCommand"),
+            self._extra or (),
+        ):
+            for key in keys:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = dict(as_dict(self.offering))
+        result.update(self._keys)
+        result["Timestamp"] = self._batch.timestamp
+        result["PurchaseCommand"] = self.purchase_command
+        if self._extra:
+            result.update(self._extra)
+        return result
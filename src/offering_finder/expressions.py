@@ -0,0 +1,329 @@
+import re
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+from offering_finder.planner import offering_value, values_equal
+
+Predicate = Callable[[Mapping[str, Any]], bool]
+
+COMPARISON_OPERATORS = ("=", "!=", "<", "<=", ">", ">=", "~", "in")
+# Operators whose conjuncts can be sent to the API as criteria
+PUSHDOWN_OPERATORS = ("=", "in")
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+        |(?P<op><=|>=|!=|=|<|>|~)
+        |(?P<punct>[(),])
+        |(?P<word>[^\s()<>=!~,"']+)
+    )""",
+    re.VERBOSE,
+)
+_KEYWORDS = ("and", "or", "not", "in")
+
+
+def _literal(token: Tuple[str, str]) -> Any:
+    """
+    Convert a value token: quoted strings stay strings, bare words become
+    booleans or numbers when they look like one.
+    """
+    kind, text = token
+    if kind == "string":
+        return re.sub(r"\\(.)", r"\1", text[1:-1])
+    if text.lower() in ("true", "false"):
+        return text.lower() == "true"
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    return text
+
+
+def _as_number(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class Comparison:
+    """
+    One 'Field <op> value' term. Offering fields are looked up like the
+    planner does, including Savings Plans properties; a missing field never
+    matches. '~' is a case-insensitive substring match, and '<', '>' and
+    friends compare numerically when both sides are numbers.
+    """
+
+    __slots__ = ("field", "op", "value")
+
+    def __init__(self, field: str, op: str, value: Any) -> None:
+        self.field = field
+        self.op = op
+        self.value = value
+
+    def compile(self) -> Predicate:
+        field = self.field
+        test = self._compile_test()
+
+        def predicate(offering: Mapping[str, Any]) -> bool:
+            actual = offering_value(offering, field)
+            if actual is None:
+                return False
+            if isinstance(actual, (list, tuple)):
+                return any(test(a) for a in actual)
+            return test(actual)
+
+        return predicate
+
+    def _compile_test(self) -> Callable[[Any], bool]:
+        op, value = self.op, self.value
+        if op == "=":
+            return lambda actual: values_equal(actual, value)
+        if op == "!=":
+            return lambda actual: not values_equal(actual, value)
+        if op == "in":
+            return lambda actual: any(values_equal(actual, v) for v in value)
+        if op == "~":
+            needle = str(value).lower()
+            return lambda actual: needle in str(actual).lower()
+        compare = {
+            "<": lambda a, b: a < b,
+            "<=": lambda a, b: a <= b,
+            ">": lambda a, b: a > b,
+            ">=": lambda a, b: a >= b,
+        }[op]
+        number = _as_number(value)
+        if number is None:
+            text = str(value)
+            return lambda actual: compare(str(actual), text)
+
+        def test(actual: Any) -> bool:
+            actual_number = _as_number(actual)
+            return actual_number is not None and compare(actual_number, number)
+
+        return test
+
+    def __repr__(self) -> str:
+        return f"Comparison({self.field!r}, {self.op!r}, {self.value!r})"
+
+
+class And:
+    __slots__ = ("terms",)
+
+    def __init__(self, terms: List[Any]) -> None:
+        self.terms = terms
+
+    def compile(self) -> Predicate:
+        predicates = tuple(term.compile() for term in self.terms)
+        return lambda offering: all(p(offering) for p in predicates)
+
+
+class Or:
+    __slots__ = ("terms",)
+
+    def __init__(self, terms: List[Any]) -> None:
+        self.terms = terms
+
+    def compile(self) -> Predicate:
+        predicates = tuple(term.compile() for term in self.terms)
+        return lambda offering: any(p(offering) for p in predicates)
+
+
+class Not:
+    __slots__ = ("term",)
+
+    def __init__(self, term: Any) -> None:
+        self.term = term
+
+    def compile(self) -> Predicate:
+        predicate = self.term.compile()
+        return lambda offering: not predicate(offering)
+
+
+def _conjuncts(node: Any) -> List[Any]:
+    """
+    Flatten nested 'and' terms, e.g. '(a and b) and c' into [a, b, c].
+    """
+    if isinstance(node, And):
+        return [t for term in node.terms for t in _conjuncts(term)]
+    return [node]
+
+
+class _Parser:
+    """
+    Recursive descent parser for:
+        expr       := and_expr ('or' and_expr)*
+        and_expr   := not_expr ('and' not_expr)*
+        not_expr   := 'not' not_expr | '(' expr ')' | comparison
+        comparison := FIELD OP value | FIELD 'in' '(' value (',' value)* ')'
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.tokens = self._tokenize(text)
+        self.position = 0
+
+    @staticmethod
+    def _tokenize(text: str) -> List[Tuple[str, str]]:
+        tokens = []
+        position = 0
+        while text[position:].strip():
+            match = _TOKEN.match(text, position)
+            if match is None:
+                raise ValueError(
+                    f"Invalid where expression at position {position}: {text!r}"
+                )
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == "word" and value.lower() in _KEYWORDS:
+                kind, value = "keyword", value.lower()
+            tokens.append((kind, value))
+            position = match.end()
+        return tokens
+
+    def _peek(self) -> Optional[Tuple[str, str]]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def _next(self, expected: str) -> Tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise ValueError(f"Unexpected end of where expression, expected {expected}")
+        self.position += 1
+        return token
+
+    def _accept(self, kind: str, value: str) -> bool:
+        if self._peek() == (kind, value):
+            self.position += 1
+            return True
+        return False
+
+    def _expect(self, kind: str, value: str) -> None:
+        token = self._next(f"'{value}'")
+        if token != (kind, value):
+            raise ValueError(f"Expected '{value}' in where expression, got {token[1]!r}")
+
+    def parse(self) -> Any:
+        if not self.tokens:
+            raise ValueError("Empty where expression")
+        node = self._or()
+        if self._peek() is not None:
+            raise ValueError(
+                f"Unexpected {self._peek()[1]!r} in where expression: {self.text!r}"
+            )
+        return node
+
+    def _or(self) -> Any:
+        terms = [self._and()]
+        while self._accept("keyword", "or"):
+            terms.append(self._and())
+        return terms[0] if len(terms) == 1 else Or(terms)
+
+    def _and(self) -> Any:
+        terms = [self._not()]
+        while self._accept("keyword", "and"):
+            terms.append(self._not())
+        return terms[0] if len(terms) == 1 else And(terms)
+
+    def _not(self) -> Any:
+        if self._accept("keyword", "not"):
+            return Not(self._not())
+        if self._accept("punct", "("):
+            node = self._or()
+            self._expect("punct", ")")
+            return node
+        return self._comparison()
+
+    def _comparison(self) -> Comparison:
+        kind, field = self._next("a field name")
+        if kind != "word":
+            raise ValueError(f"Expected a field name in where expression, got {field!r}")
+        if self._accept("keyword", "in"):
+            self._expect("punct", "(")
+            values = [self._value()]
+            while self._accept("punct", ","):
+                values.append(self._value())
+            self._expect("punct", ")")
+            return Comparison(field, "in", values)
+        kind, op = self._next("an operator")
+        if kind != "op":
+            raise ValueError(f"Expected an operator after {field!r}, got {op!r}")
+        return Comparison(field, op, self._value())
+
+    def _value(self) -> Any:
+        token = self._next("a value")
+        if token[0] not in ("string", "word"):
+            raise ValueError(f"Expected a value in where expression, got {token[1]!r}")
+        return _literal(token)
+
+
+class WhereExpression:
+    """
+    A parsed --where expression, e.g.
+    'Duration=31536000 and FixedPrice<2000 and ProductDescription~"postgres"'.
+    It is parsed and compiled into a single predicate once; split separates
+    the equality conjuncts the planner can push down to the API from the
+    rest, which is evaluated client-side.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.root = _Parser(text).parse()
+        self.predicate: Predicate = self.root.compile()
+
+    def __call__(self, offering: Mapping[str, Any]) -> bool:
+        return self.predicate(offering)
+
+    def fields(self) -> List[str]:
+        """
+        Offering fields the expression refers to.
+        """
+        fields: List[str] = []
+        nodes = [self.root]
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, Comparison):
+                fields.append(node.field)
+            elif isinstance(node, Not):
+                nodes.append(node.term)
+            else:
+                nodes.extend(reversed(node.terms))
+        return list(dict.fromkeys(fields))
+
+    def split(
+        self, exclude: Iterable[str] = ()
+    ) -> Tuple[Dict[str, Any], Optional[Predicate]]:
+        """
+        Return the criteria of the top-level '=' and 'in' conjuncts (field ->
+        value or list of accepted values) and a predicate for the remaining
+        terms, or None when every term became a criterion. Terms on the
+        excluded fields, already constrained elsewhere, stay in the predicate.
+        """
+        conjuncts = _conjuncts(self.root)
+        criteria: Dict[str, Any] = {}
+        excluded = set(exclude)
+        residual = []
+        for term in conjuncts:
+            if (
+                isinstance(term, Comparison)
+                and term.op in PUSHDOWN_OPERATORS
+                and term.field not in criteria
+                and term.field not in excluded
+            ):
+                criteria[term.field] = term.value
+            else:
+                residual.append(term)
+        if not residual:
+            return criteria, None
+        node = residual[0] if len(residual) == 1 else And(residual)
+        return criteria, node.compile()
+
+    def __repr__(self) -> str:
+        return f"WhereExpression({self.text!r})"
+
+
+def parse_where(text: str) -> WhereExpression:
+    """
+    Parse and compile a where expression; raises ValueError on syntax errors.
+    """
+    return WhereExpression(text)
@@ -1,8 +1,14 @@
-import datetime
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
 from botocore.exceptions import BotoCoreError, ClientError
 from offering_finder.clients.AWSClient import AWSClient
+from offering_finder.clients.ClientFactory import ClientFactory
+from offering_finder.clients.Paginator import Paginator
+from offering_finder.enrichment import (
+    EnrichedOffering,
+    Enrichment,
+    materialize,
+)
 from offering_finder.models.elasticache_params import (
     ElastiCacheParams,
     ElastiCachePurchaseParams,
@@ -10,8 +16,17 @@ from offering_finder.models.elasticache_params import (
 
 
 class ElastiCacheManager:
-    def __init__(self, region_name: str) -> None:
-        self.client = AWSClient("elasticache", region_name)
+    def __init__(
+        self,
+        region_name: str,
+        client_factory: Optional[ClientFactory] = None,
+        prefetch: int = 0,
+        fields: Optional[Sequence[str]] = None,
+    ) -> None:
+        self.client = AWSClient(
+            "elasticache", region_name, client_factory=client_factory, fields=fields
+        )
+        self.paginator = Paginator(self.client, prefetch=prefetch)
 
     def generate_purchase_command(
         self,
@@ -40,24 +55,42 @@ class ElastiCacheManager:
     def add_keys_to_offerings(
         self, offerings: List[Dict[str, Any]], params: ElastiCachePurchaseParams
     ) -> List[Dict[str, Any]]:
-        result = []
+        return list(self.iter_add_keys_to_offerings(offerings, params))
+
+    def iter_add_keys_to_offerings(
+        self, offerings: Iterable[Dict[str, Any]], params: ElastiCachePurchaseParams
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield copies of the offerings with the order keys and purchase
+        command added. The offerings themselves are left untouched.
+        """
+        yield from materialize(self.enrich_offerings(offerings, params))
+
+    def enrich_offerings(
+        self, offerings: Iterable[Dict[str, Any]], params: ElastiCachePurchaseParams
+    ) -> Iterator[EnrichedOffering]:
+        """
+        Lazily wrap each offering in a view adding the order keys and purchase
+        command. The batch shares one timestamp, and purchase commands are
+        rendered only for the views that are actually output.
+        """
+        batch = Enrichment(
+            render_command=lambda offering_id: self.generate_purchase_command(
+                purchase_profile=params.purchase_profile,
+                region_name=params.region_name,
+                offering_id=offering_id,
+                quantity=params.quantity,
+                reserved_cache_node_id=params.reserved_cache_node_id,
+            )
+        )
         for offering in offerings:
             try:
-                offering["OrderQuantity"] = params.quantity
-                offering["OrderEstimatedAmount"] = (
-                    float(offering["FixedPrice"]) * params.quantity
-                )
-                offering["Timestamp"] = datetime.datetime.now(
-                    datetime.timezone.utc
-                ).isoformat()
-                offering["PurchaseCommand"] = self.generate_purchase_command(
-                    purchase_profile=params.purchase_profile,
-                    region_name=params.region_name,
-                    offering_id=offering["ReservedCacheNodesOfferingId"],
-                    quantity=params.quantity,
-                    reserved_cache_node_id=params.reserved_cache_node_id,
-                )
-                result.append(offering)
+                offering_id = offering["ReservedCacheNodesOfferingId"]
+                keys = {
+                    "OrderQuantity": params.quantity,
+                    "OrderEstimatedAmount": float(offering["FixedPrice"])
+                    * params.quantity,
+                }
             except KeyError as e:
                 logging.error(
                     f"Missing required key in offering: {e}, "
@@ -76,21 +109,18 @@ class ElastiCacheManager:
                     f"offering_id: {offering.get('ReservedCacheNodesOfferingId', 'unknown')}"
                 )
                 continue
-        return result
+            yield EnrichedOffering(offering, offering_id, keys, batch)
 
     def get_offerings(self, params: ElastiCacheParams) -> List[Dict[str, Any]]:
+        return list(self.iter_offerings(params))
+
+    def iter_offerings(self, params: ElastiCacheParams) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield offerings page by page.
+        """
         try:
             fetch_params = params.model_dump(exclude_none=True)
-            result = []
-            while True:
-                response = self.client.describe_offerings(fetch_params)
-                offerings = response.get("ReservedCacheNodesOfferings", [])
-                result.extend(offerings)
-                if "Marker" in response:
-                    fetch_params["Marker"] = response["Marker"]
-                else:
-                    break
-            return result
+            yield from self.paginator.items(fetch_params)
         except ClientError as e:
             error_code = e.response['Error']['Code']
             error_message = e.response['Error']['Message']
@@ -1,8 +1,14 @@
-import datetime
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
 from botocore.exceptions import BotoCoreError, ClientError
 from offering_finder.clients.AWSClient import AWSClient
+from offering_finder.clients.ClientFactory import ClientFactory
+from offering_finder.clients.Paginator import Paginator
+from offering_finder.enrichment import (
+    EnrichedOffering,
+    Enrichment,
+    materialize,
+)
 from offering_finder.models.opensearch_params import (
     OpenSearchParams,
     OpenSearchFilterParams,
@@ -11,8 +17,17 @@ from offering_finder.models.opensearch_params import (
 
 
 class OpenSearchManager:
-    def __init__(self, region_name: str) -> None:
-        self.client = AWSClient("opensearch", region_name)
+    def __init__(
+        self,
+        region_name: str,
+        client_factory: Optional[ClientFactory] = None,
+        prefetch: int = 0,
+        fields: Optional[Sequence[str]] = None,
+    ) -> None:
+        self.client = AWSClient(
+            "opensearch", region_name, client_factory=client_factory, fields=fields
+        )
+        self.paginator = Paginator(self.client, prefetch=prefetch)
 
     def generate_purchase_command(
         self,
@@ -45,18 +60,15 @@ class OpenSearchManager:
         Get the list of OpenSearch reserved instance offering IDs.
         https://boto3.amazonaws.com/v1/documentation/api/1.35.8/reference/services/opensearch/client/describe_reserved_instance_offerings.html
         """
+        return list(self.iter_offering_ids(params))
+
+    def iter_offering_ids(self, params: OpenSearchParams) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield OpenSearch reserved instance offerings page by page.
+        """
         try:
             fetch_params = params.model_dump(exclude_none=True)
-            result = []
-            while True:
-                response = self.client.describe_offerings(fetch_params)
-                offerings = response.get("ReservedInstanceOfferings", [])
-                result.extend(offerings)
-                if "NextToken" in response:
-                    fetch_params["NextToken"] = response["NextToken"]
-                else:
-                    break
-            return result
+            yield from self.paginator.items(fetch_params)
         except ClientError as e:
             error_code = e.response['Error']['Code']
             error_message = e.response['Error']['Message']
@@ -72,7 +84,14 @@ class OpenSearchManager:
         """
         Filter the offerings to match the specified filter parameters.
         """
-        result = []
+        return list(self.iter_filter_offerings(offerings, params))
+
+    def iter_filter_offerings(
+        self, offerings: Iterable[Dict[str, Any]], params: OpenSearchFilterParams
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield the offerings that match the specified filter parameters.
+        """
         for offering in offerings:
             if (
                 (
@@ -97,31 +116,52 @@ class OpenSearchManager:
                     or offering["PaymentOption"] == params.PaymentOption
                 )
             ):
-                result.append(offering)
-        return result
+                yield offering
 
     def add_keys_to_offerings(
         self, offerings: List[Dict[str, Any]], purchase_params: OpenSearchPurchaseParams
     ) -> List[Dict[str, Any]]:
-        result = []
+        return list(self.iter_add_keys_to_offerings(offerings, purchase_params))
+
+    def iter_add_keys_to_offerings(
+        self,
+        offerings: Iterable[Dict[str, Any]],
+        purchase_params: OpenSearchPurchaseParams,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield copies of the offerings with the order keys and purchase
+        command added. The offerings themselves are left untouched.
+        """
+        yield from materialize(self.enrich_offerings(offerings, purchase_params))
+
+    def enrich_offerings(
+        self,
+        offerings: Iterable[Dict[str, Any]],
+        purchase_params: OpenSearchPurchaseParams,
+    ) -> Iterator[EnrichedOffering]:
+        """
+        Lazily wrap each offering in a view adding the order keys and purchase
+        command. The batch shares one timestamp, and purchase commands are
+        rendered only for the views that are actually output.
+        """
+        batch = Enrichment(
+            render_command=lambda offering_id: self.generate_purchase_command(
+                offering_id=offering_id,
+                purchase_profile=purchase_params.purchase_profile,
+                region_name=purchase_params.region_name,
+                quantity=purchase_params.quantity,
+                reservation_name=purchase_params.reservation_name,
+            )
+        )
         for offering in offerings:
             try:
+                offering_id = offering["ReservedInstanceOfferingId"]
+                keys: Dict[str, Any] = {}
                 if purchase_params.quantity:
-                    offering["OrderQuantity"] = purchase_params.quantity
-                    offering["OrderEstimatedAmount"] = (
+                    keys["OrderQuantity"] = purchase_params.quantity
+                    keys["OrderEstimatedAmount"] = (
                         float(offering["FixedPrice"]) * purchase_params.quantity
                     )
-                offering["Timestamp"] = datetime.datetime.now(
-                    datetime.timezone.utc
-                ).isoformat()
-                offering["PurchaseCommand"] = self.generate_purchase_command(
-                    offering_id=offering["ReservedInstanceOfferingId"],
-                    purchase_profile=purchase_params.purchase_profile,
-                    region_name=purchase_params.region_name,
-                    quantity=purchase_params.quantity,
-                    reservation_name=purchase_params.reservation_name,
-                )
-                result.append(offering)
             except KeyError as e:
                 logging.error(
                     f"Missing required key in offering: {e}, "
@@ -140,4 +180,4 @@ class OpenSearchManager:
                     f"offering_id: {offering.get('ReservedInstanceOfferingId', 'unknown')}"
                 )
                 continue
-        return result
+            yield EnrichedOffering(offering, offering_id, keys, batch)
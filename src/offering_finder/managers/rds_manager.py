@@ -1,14 +1,29 @@
-import datetime
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
 from botocore.exceptions import BotoCoreError, ClientError
 from offering_finder.clients.AWSClient import AWSClient
+from offering_finder.clients.ClientFactory import ClientFactory
+from offering_finder.clients.Paginator import Paginator
+from offering_finder.enrichment import (
+    EnrichedOffering,
+    Enrichment,
+    materialize,
+)
 from offering_finder.models.rds_params import RDSParams, RDSPurchaseParams
 
 
 class RDSManager:
-    def __init__(self, region_name: str) -> None:
-        self.client = AWSClient("rds", region_name)
+    def __init__(
+        self,
+        region_name: str,
+        client_factory: Optional[ClientFactory] = None,
+        prefetch: int = 0,
+        fields: Optional[Sequence[str]] = None,
+    ) -> None:
+        self.client = AWSClient(
+            "rds", region_name, client_factory=client_factory, fields=fields
+        )
+        self.paginator = Paginator(self.client, prefetch=prefetch)
 
     def generate_purchase_command(
         self,
@@ -37,24 +52,42 @@ class RDSManager:
     def add_keys_to_offerings(
         self, offerings: List[Dict[str, Any]], params: RDSPurchaseParams
     ) -> List[Dict[str, Any]]:
-        result = []
+        return list(self.iter_add_keys_to_offerings(offerings, params))
+
+    def iter_add_keys_to_offerings(
+        self, offerings: Iterable[Dict[str, Any]], params: RDSPurchaseParams
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield copies of the offerings with the order keys and purchase
+        command added. The offerings themselves are left untouched.
+        """
+        yield from materialize(self.enrich_offerings(offerings, params))
+
+    def enrich_offerings(
+        self, offerings: Iterable[Dict[str, Any]], params: RDSPurchaseParams
+    ) -> Iterator[EnrichedOffering]:
+        """
+        Lazily wrap each offering in a view adding the order keys and purchase
+        command. The batch shares one timestamp, and purchase commands are
+        rendered only for the views that are actually output.
+        """
+        batch = Enrichment(
+            render_command=lambda offering_id: self.generate_purchase_command(
+                purchase_profile=params.purchase_profile,
+                region_name=params.region_name,
+                offering_id=offering_id,
+                quantity=params.quantity,
+                reserved_instance_id=params.reserved_instance_id,
+            )
+        )
         for offering in offerings:
             try:
-                offering["OrderQuantity"] = params.quantity
-                offering["OrderEstimatedAmount"] = (
-                    float(offering["FixedPrice"]) * params.quantity
-                )
-                offering["Timestamp"] = datetime.datetime.now(
-                    datetime.timezone.utc
-                ).isoformat()
-                offering["PurchaseCommand"] = self.generate_purchase_command(
-                    purchase_profile=params.purchase_profile,
-                    region_name=params.region_name,
-                    offering_id=offering["ReservedDBInstancesOfferingId"],
-                    quantity=params.quantity,
-                    reserved_instance_id=params.reserved_instance_id,
-                )
-                result.append(offering)
+                offering_id = offering["ReservedDBInstancesOfferingId"]
+                keys = {
+                    "OrderQuantity": params.quantity,
+                    "OrderEstimatedAmount": float(offering["FixedPrice"])
+                    * params.quantity,
+                }
             except KeyError as e:
                 logging.error(
                     f"Missing required key in offering: {e}, "
@@ -74,21 +107,18 @@ class RDSManager:
                     f"offering_id: {offering.get('ReservedDBInstancesOfferingId', 'unknown')}"
                 )
                 continue
-        return result
+            yield EnrichedOffering(offering, offering_id, keys, batch)
 
     def get_offerings(self, params: RDSParams) -> List[Dict[str, Any]]:
+        return list(self.iter_offerings(params))
+
+    def iter_offerings(self, params: RDSParams) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield offerings page by page.
+        """
         try:
             rds_params = params.model_dump(exclude_none=True)
-            result = []
-            while True:
-                response = self.client.describe_offerings(rds_params)
-                offerings = response.get("ReservedDBInstancesOfferings", [])
-                result.extend(offerings)
-                if "Marker" in response:
-                    rds_params["Marker"] = response["Marker"]
-                else:
-                    break
-            return result
+            yield from self.paginator.items(rds_params)
         except ClientError as e:
             error_code = e.response['Error']['Code']
             error_message = e.response['Error']['Message']
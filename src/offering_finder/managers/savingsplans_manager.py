@@ -1,17 +1,67 @@
-import datetime
+import itertools
 import logging
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
 from botocore.exceptions import BotoCoreError, ClientError
 from offering_finder.clients.AWSClient import AWSClient
+from offering_finder.clients.ClientFactory import ClientFactory
+from offering_finder.clients.Paginator import Paginator
+from offering_finder.enrichment import (
+    EnrichedOffering,
+    Enrichment,
+    materialize,
+)
 from offering_finder.models.savingsplans_params import (
     SavingsPlansParams,
     SavingsPlansPurchaseParams,
 )
 
+# List parameters a broad query is split along, in order
+PARTITION_FIELDS = ("planTypes", "durations", "paymentOptions", "currencies")
+DEFAULT_MAX_PARTITIONS = 16
+DEFAULT_PARTITION_WORKERS = 4
+
+
+def partition_params(
+    params: SavingsPlansParams, max_partitions: int = DEFAULT_MAX_PARTITIONS
+) -> List[SavingsPlansParams]:
+    """
+    Split a query into independent sub-queries, one per combination of the
+    values of its multi-valued list parameters. Fields are split in
+    PARTITION_FIELDS order as long as the number of sub-queries stays within
+    max_partitions. An offering has a single plan type, duration, payment
+    option and currency, so the sub-queries do not overlap.
+    """
+    dimensions: List[List[Dict[str, Any]]] = []
+    count = 1
+    for field in PARTITION_FIELDS:
+        values = getattr(params, field)
+        if not values or len(values) < 2 or count * len(values) > max_partitions:
+            continue
+        dimensions.append([{field: [value]} for value in values])
+        count *= len(values)
+    if not dimensions:
+        return [params]
+    return [
+        params.model_copy(update={k: v for part in parts for k, v in part.items()})
+        for parts in itertools.product(*dimensions)
+    ]
+
 
 class SavingsPlansManager:
-    def __init__(self, region_name: str) -> None:
-        self.client = AWSClient("savingsplans", region_name)
+    def __init__(
+        self,
+        region_name: str,
+        client_factory: Optional[ClientFactory] = None,
+        max_workers: int = DEFAULT_PARTITION_WORKERS,
+        prefetch: int = 0,
+        fields: Optional[Sequence[str]] = None,
+    ) -> None:
+        self.client = AWSClient(
+            "savingsplans", region_name, client_factory=client_factory, fields=fields
+        )
+        self.paginator = Paginator(self.client, prefetch=prefetch)
+        self.max_workers = max_workers
 
     def generate_purchase_command(
         self,
@@ -47,26 +97,45 @@ class SavingsPlansManager:
     def add_keys_to_offerings(
         self, offerings: List[Dict[str, Any]], params: SavingsPlansPurchaseParams
     ) -> List[Dict[str, Any]]:
-        result = []
+        return list(self.iter_add_keys_to_offerings(offerings, params))
+
+    def iter_add_keys_to_offerings(
+        self, offerings: Iterable[Dict[str, Any]], params: SavingsPlansPurchaseParams
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield copies of the offerings with the order keys and purchase
+        command added. The offerings themselves are left untouched.
+        """
+        yield from materialize(self.enrich_offerings(offerings, params))
+
+    def enrich_offerings(
+        self, offerings: Iterable[Dict[str, Any]], params: SavingsPlansPurchaseParams
+    ) -> Iterator[EnrichedOffering]:
+        """
+        Lazily wrap each offering in a view adding the order keys and purchase
+        command. The batch shares one timestamp, and purchase commands are
+        rendered only for the views that are actually output.
+        """
+        batch = Enrichment(
+            render_command=lambda offering_id: self.generate_purchase_command(
+                offering_id=offering_id,
+                purchase_profile=params.purchase_profile,
+                region_name=params.region_name,
+                commitment=params.commitment,
+                client_token=params.client_token,
+                purchase_time=params.purchase_time,
+                tags=params.tags,
+            )
+        )
         for offering in offerings:
             try:
-                offering["OrderCommitment"] = params.commitment
-                offering["OrderEstimatedAmount"] = (
-                    float(offering["durationSeconds"] / 60 / 60) * params.commitment
-                )
-                offering["Timestamp"] = datetime.datetime.now(
-                    datetime.timezone.utc
-                ).isoformat()
-                offering["PurchaseCommand"] = self.generate_purchase_command(
-                    offering_id=offering["offeringId"],
-                    purchase_profile=params.purchase_profile,
-                    region_name=params.region_name,
-                    commitment=params.commitment,
-                    client_token=params.client_token,
-                    purchase_time=params.purchase_time,
-                    tags=params.tags,
-                )
-                result.append(offering)
+                offering_id = offering["offeringId"]
+                keys = {
+                    "OrderCommitment": params.commitment,
+                    "OrderEstimatedAmount": (
+                        float(offering["durationSeconds"] / 60 / 60) * params.commitment
+                    ),
+                }
             except KeyError as e:
                 logging.error(
                     f"Missing required key in offering: {e}, "
@@ -85,22 +154,25 @@ class SavingsPlansManager:
                     f"offering_id: {offering.get('offeringId', 'unknown')}"
                 )
                 continue
-        return result
+            yield EnrichedOffering(offering, offering_id, keys, batch)
 
     def get_offerings(self, params: SavingsPlansParams) -> List[Dict[str, Any]]:
+        return list(self.iter_offerings(params))
+
+    def iter_offerings(self, params: SavingsPlansParams) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield offerings page by page.
+        A broad query is split with partition_params, and the sub-queries are
+        paginated concurrently; their offerings are yielded in sub-query order,
+        without duplicates.
+        """
         try:
-            aws_params = params.model_dump(exclude_none=True)
-            result = []
-            while True:
-                response = self.client.describe_offerings(aws_params)
-                offerings = response.get("searchResults", [])
-                result.extend(offerings)
-                if response.get("nextToken"):
-                    """ 次ページが無い場合も 'nextToken': '' という形で返ってくるため、空文字ではない事をチェック"""
-                    aws_params["nextToken"] = response["nextToken"]
-                else:
-                    break
-            return result
+            partitions = partition_params(params)
+            if len(partitions) == 1 or self.max_workers < 2:
+                aws_params = params.model_dump(exclude_none=True)
+                yield from self.paginator.items(aws_params)
+                return
+            yield from self._iter_partitions(partitions)
         except ClientError as e:
             error_code = e.response['Error']['Code']
             error_message = e.response['Error']['Message']
@@ -109,3 +181,29 @@ class SavingsPlansManager:
         except BotoCoreError as e:
             logging.error(f"AWS SDK Error: {e}")
             raise
+
+    def _iter_partitions(
+        self, partitions: List[SavingsPlansParams]
+    ) -> Iterator[Dict[str, Any]]:
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(partitions))
+        )
+        try:
+            futures = [
+                executor.submit(
+                    list, self.paginator.items(partition.model_dump(exclude_none=True))
+                )
+                for partition in partitions
+            ]
+            seen = set()
+            for future in futures:
+                for offering in future.result():
+                    offering_id = offering.get("offeringId")
+                    if offering_id is not None:
+                        if offering_id in seen:
+                            continue
+                        seen.add(offering_id)
+                    yield offering
+        finally:
+            # Stop pending sub-queries when the consumer stops early or one fails
+            executor.shutdown(wait=False, cancel_futures=True)
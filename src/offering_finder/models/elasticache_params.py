@@ -25,5 +25,5 @@ class ElastiCacheParams(BaseModel):
     Duration: Optional[str] = "31536000"
     ProductDescription: Optional[str] = None
     OfferingType: Optional[str] = "All Upfront"
-    MaxRecords: Optional[int] = 100
+    MaxRecords: Optional[int] = None
     Marker: Optional[str] = None
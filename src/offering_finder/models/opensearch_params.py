@@ -22,7 +22,7 @@ class OpenSearchParams(BaseModel):
     """
 
     ReservedInstanceOfferingId: Optional[str] = None
-    MaxResults: Optional[int] = 100
+    MaxResults: Optional[int] = None
     NextToken: Optional[str] = None
 
 
@@ -26,6 +26,6 @@ class RDSParams(BaseModel):
     ProductDescription: Optional[str] = None
     MultiAZ: Optional[bool] = False
     OfferingType: Optional[str] = None
-    MaxRecords: Optional[int] = 100
+    MaxRecords: Optional[int] = None
     Marker: Optional[str] = None
     Filters: Optional[list[Dict[str, Any]]] = None
@@ -32,7 +32,7 @@ class SavingsPlansParams(BaseModel):
     descriptions: Optional[List[str]] = None
     serviceCodes: Optional[List[str]] = None
     usageTypes: Optional[List[str]] = None
-    operations: Optional[str] = None
+    operations: Optional[List[str]] = None
     filters: Optional[List[Dict[str, Any]]] = None
     nextToken: Optional[str] = None
-    maxResults: Optional[int] = 100
+    maxResults: Optional[int] = None
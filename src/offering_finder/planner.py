@@ -0,0 +1,208 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from pydantic import BaseModel
+
+
+def _scalar(value: Any) -> Any:
+    return value[0] if isinstance(value, (list, tuple)) else value
+
+
+def _as_str(value: Any) -> str:
+    return str(_scalar(value))
+
+
+def _as_list(value: Any) -> List[Any]:
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def _as_int_list(value: Any) -> List[int]:
+    return [int(v) for v in _as_list(value)]
+
+
+class Pushdown(BaseModel):
+    """
+    Data class describing how one offering field is sent to the API.
+    The converter turns the criterion into the request value.
+    A scalar request parameter can only take a single criterion value.
+    """
+
+    request_field: str
+    converter: Callable[[Any], Any]
+    multi_value: bool = False
+
+
+PUSHDOWN_FIELDS: Dict[str, Dict[str, Pushdown]] = {
+    # RDS also accepts 'Filters', but the API documents it as not supported yet
+    "rds": {
+        "ReservedDBInstancesOfferingId": Pushdown(
+            request_field="ReservedDBInstancesOfferingId", converter=_as_str
+        ),
+        "DBInstanceClass": Pushdown(request_field="DBInstanceClass", converter=_as_str),
+        "Duration": Pushdown(request_field="Duration", converter=_as_str),
+        "ProductDescription": Pushdown(
+            request_field="ProductDescription", converter=_as_str
+        ),
+        "OfferingType": Pushdown(request_field="OfferingType", converter=_as_str),
+        "MultiAZ": Pushdown(request_field="MultiAZ", converter=lambda v: bool(_scalar(v))),
+    },
+    "elasticache": {
+        "ReservedCacheNodesOfferingId": Pushdown(
+            request_field="ReservedCacheNodesOfferingId", converter=_as_str
+        ),
+        "CacheNodeType": Pushdown(request_field="CacheNodeType", converter=_as_str),
+        "Duration": Pushdown(request_field="Duration", converter=_as_str),
+        "ProductDescription": Pushdown(
+            request_field="ProductDescription", converter=_as_str
+        ),
+        "OfferingType": Pushdown(request_field="OfferingType", converter=_as_str),
+    },
+    "opensearch": {
+        "ReservedInstanceOfferingId": Pushdown(
+            request_field="ReservedInstanceOfferingId", converter=_as_str
+        ),
+    },
+    "savingsplans": {
+        "offeringId": Pushdown(
+            request_field="offeringIds", converter=_as_list, multi_value=True
+        ),
+        "paymentOption": Pushdown(
+            request_field="paymentOptions", converter=_as_list, multi_value=True
+        ),
+        "productTypes": Pushdown(request_field="productType", converter=_as_str),
+        "planType": Pushdown(
+            request_field="planTypes", converter=_as_list, multi_value=True
+        ),
+        "durationSeconds": Pushdown(
+            request_field="durations", converter=_as_int_list, multi_value=True
+        ),
+        "currency": Pushdown(
+            request_field="currencies", converter=_as_list, multi_value=True
+        ),
+        "description": Pushdown(
+            request_field="descriptions", converter=_as_list, multi_value=True
+        ),
+        "serviceCode": Pushdown(
+            request_field="serviceCodes", converter=_as_list, multi_value=True
+        ),
+        "usageType": Pushdown(
+            request_field="usageTypes", converter=_as_list, multi_value=True
+        ),
+        "operation": Pushdown(
+            request_field="operations", converter=_as_list, multi_value=True
+        ),
+    },
+}
+
+# Savings Plans offering properties that the API filters through 'filters'
+SAVINGSPLANS_PROPERTY_FILTERS = ("region", "instanceFamily")
+
+
+def values_equal(actual: Any, expected: Any) -> bool:
+    """
+    Compare an offering value with a criterion value.
+    Numbers are compared numerically so that '31536000' matches 31536000,
+    and list values match when any element matches.
+    """
+    if isinstance(actual, (list, tuple)):
+        return any(values_equal(a, expected) for a in actual)
+    if isinstance(actual, bool) or isinstance(expected, bool):
+        return str(actual).lower() == str(expected).lower()
+    try:
+        return float(actual) == float(expected)
+    except (TypeError, ValueError):
+        return str(actual) == str(expected)
+
+
+def offering_value(offering: Dict[str, Any], field: str) -> Any:
+    """
+    Return a field of the offering, looking into the Savings Plans
+    'properties' list when the offering has no such key.
+    """
+    if field in offering:
+        return offering[field]
+    for prop in offering.get("properties", []):
+        if prop.get("name") == field:
+            return prop.get("value")
+    return None
+
+
+class QueryPlan(BaseModel):
+    """
+    Data class for a planned query: the request parameters sent to the API,
+    the residual criteria that still have to be checked client-side, and
+    the compiled predicate of the where expression terms that could not be
+    turned into criteria.
+    """
+
+    service_name: str
+    request: Dict[str, Any]
+    residual: Dict[str, Any]
+    predicate: Optional[Callable[[Dict[str, Any]], bool]] = None
+
+    def matches(self, offering: Dict[str, Any]) -> bool:
+        for field, expected in self.residual.items():
+            actual = offering_value(offering, field)
+            if actual is None:
+                return False
+            if not any(values_equal(actual, e) for e in _as_list(expected)):
+                return False
+        return self.predicate is None or self.predicate(offering)
+
+    def filter(self, offerings: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield the offerings that match the residual criteria.
+        """
+        if not self.residual and self.predicate is None:
+            yield from offerings
+            return
+        for offering in offerings:
+            if self.matches(offering):
+                yield offering
+
+
+def plan_query(
+    service_name: str,
+    criteria: Dict[str, Any],
+    request: Optional[Dict[str, Any]] = None,
+    where: Optional[Any] = None,
+) -> QueryPlan:
+    """
+    Split the criteria (offering field -> value or list of accepted values)
+    into API request parameters and residual client-side criteria.
+    The equality terms of a where expression (see expressions.WhereExpression)
+    are planned like criteria; its other terms are checked client-side.
+    The page size is left to the Paginator, which requests the largest page
+    the API allows.
+    """
+    pushdown_fields = PUSHDOWN_FIELDS[service_name]
+    plan_request = dict(request or {})
+    residual: Dict[str, Any] = {}
+    predicate = None
+    if where is not None:
+        # A field already constrained keeps the where term client-side
+        where_criteria, predicate = where.split(
+            exclude=[field for field, value in criteria.items() if value is not None]
+        )
+        criteria = {**criteria, **where_criteria}
+    for field, value in criteria.items():
+        if value is None:
+            continue
+        values = _as_list(value)
+        pushdown = pushdown_fields.get(field)
+        if (
+            pushdown is not None
+            and pushdown.request_field not in plan_request
+            and (pushdown.multi_value or len(values) == 1)
+        ):
+            plan_request[pushdown.request_field] = pushdown.converter(value)
+        elif service_name == "savingsplans" and field in SAVINGSPLANS_PROPERTY_FILTERS:
+            filters = list(plan_request.get("filters") or [])
+            filters.append({"name": field, "values": [str(v) for v in values]})
+            plan_request["filters"] = filters
+        else:
+            residual[field] = value
+    return QueryPlan(
+        service_name=service_name,
+        request=plan_request,
+        residual=residual,
+        predicate=predicate,
+    )
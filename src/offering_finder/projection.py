@@ -0,0 +1,62 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Offering fields every offering keeps: the ID and what enrichment reads
+REQUIRED_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "rds": ("ReservedDBInstancesOfferingId", "FixedPrice"),
+    "elasticache": ("ReservedCacheNodesOfferingId", "FixedPrice"),
+    "opensearch": ("ReservedInstanceOfferingId", "FixedPrice"),
+    "savingsplans": ("offeringId", "durationSeconds"),
+}
+
+# Offering fields the cost ranking reads
+RANKING_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "rds": ("Duration", "FixedPrice", "UsagePrice", "RecurringCharges"),
+    "elasticache": ("Duration", "FixedPrice", "UsagePrice", "RecurringCharges"),
+    "opensearch": ("Duration", "FixedPrice", "UsagePrice", "RecurringCharges"),
+    "savingsplans": ("durationSeconds", "paymentOption"),
+}
+
+
+def projection_fields(
+    service_name: str,
+    fields: Optional[Iterable[str]],
+    *needed: Iterable[str],
+) -> Optional[Tuple[str, ...]]:
+    """
+    Fields to keep for a requested projection: the requested ones, the
+    required ones and any other fields needed downstream (filtering, ranking,
+    catalog lookups), in that order. None when no projection is requested.
+    """
+    if not fields:
+        return None
+    kept = [*fields, *REQUIRED_FIELDS[service_name]]
+    for group in needed:
+        kept.extend(group)
+    return tuple(dict.fromkeys(kept))
+
+
+def project(offering: Dict[str, Any], fields: Iterable[str]) -> Dict[str, Any]:
+    """
+    Keep only the given fields of an offering. Savings Plans 'properties'
+    entries are kept when their name is one of the fields.
+    """
+    if not isinstance(fields, (set, frozenset)):
+        fields = set(fields)
+    result = {k: v for k, v in offering.items() if k in fields}
+    properties = offering.get("properties")
+    if properties and "properties" not in result:
+        kept = [p for p in properties if p.get("name") in fields]
+        if kept:
+            result["properties"] = kept
+    return result
+
+
+def project_page(
+    page: Dict[str, Any], result_key: str, fields: Iterable[str]
+) -> Dict[str, Any]:
+    """
+    Return a copy of a describe offerings page with its offerings projected.
+    """
+    fields = frozenset(fields)
+    offerings: List[Dict[str, Any]] = page.get(result_key) or []
+    return {**page, result_key: [project(o, fields) for o in offerings]}
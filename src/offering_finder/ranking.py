@@ -0,0 +1,256 @@
+import heapq
+import math
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HOURS_PER_MONTH = 730
+
+# Ranking metric -> key added to each offering
+RANK_METRICS: Dict[str, str] = {
+    "effective_hourly_rate": "EffectiveHourlyRate",
+    "total_cost": "TotalCost",
+    "break_even_month": "BreakEvenMonth",
+}
+
+# Share of a Savings Plans commitment paid upfront, per payment option
+SAVINGSPLANS_UPFRONT_SHARE = {
+    "All Upfront": 1.0,
+    "Partial Upfront": 0.5,
+    "No Upfront": 0.0,
+}
+
+
+def _term_hours(offering: Mapping[str, Any]) -> float:
+    if "durationSeconds" in offering:
+        seconds = offering["durationSeconds"]
+    else:
+        seconds = offering["Duration"]
+    return float(seconds) / 3600 or math.nan
+
+
+def _savingsplans_split(offering: Mapping[str, Any]) -> Tuple[float, float]:
+    """
+    Return the hourly commitment and the share of it paid upfront.
+    """
+    commitment = float(offering.get("OrderCommitment") or 0.0)
+    share = SAVINGSPLANS_UPFRONT_SHARE.get(offering.get("paymentOption"), math.nan)
+    return commitment, share
+
+
+def _upfront(offering: Mapping[str, Any]) -> float:
+    if "durationSeconds" in offering:
+        commitment, share = _savingsplans_split(offering)
+        return commitment * _term_hours(offering) * share
+    return float(offering["FixedPrice"])
+
+
+def _hourly(offering: Mapping[str, Any]) -> float:
+    if "durationSeconds" in offering:
+        commitment, share = _savingsplans_split(offering)
+        return commitment * (1 - share)
+    hourly = float(offering.get("UsagePrice") or 0.0)
+    for charge in offering.get("RecurringCharges") or []:
+        if charge.get("RecurringChargeFrequency") == "Hourly":
+            hourly += float(charge.get("RecurringChargeAmount", 0.0))
+    return hourly
+
+
+def _quantity(offering: Mapping[str, Any]) -> float:
+    if "durationSeconds" in offering:
+        # The commitment already covers the whole plan
+        return 1.0
+    return float(offering.get("OrderQuantity") or 1)
+
+
+# Columns of offering_costs, in order
+COST_COLUMNS = (_upfront, _hourly, _term_hours, _quantity)
+
+
+def _cost(
+    column: Callable[[Mapping[str, Any]], float], offering: Mapping[str, Any]
+) -> float:
+    try:
+        return column(offering)
+    except (KeyError, TypeError, ValueError):
+        return math.nan
+
+
+def offering_costs(offering: Mapping[str, Any]) -> Tuple[float, float, float, float]:
+    """
+    Return (upfront, hourly, term hours, quantity) for one unit of an
+    offering, with NaN for anything that cannot be determined.
+    Reserved offerings pay FixedPrice upfront, plus UsagePrice and the hourly
+    RecurringCharges. A Savings Plan pays its hourly commitment
+    (OrderCommitment), split between upfront and hourly according to its
+    payment option.
+    """
+    return tuple(_cost(column, offering) for column in COST_COLUMNS)
+
+
+def _effective_hourly_rate(
+    upfront: Any, hourly: Any, term_hours: Any, quantity: Any
+) -> Any:
+    """
+    Upfront price spread over the term plus the hourly charges, for the
+    quantity. Like _total_cost, applies to floats and NumPy arrays alike.
+    """
+    return (upfront / term_hours + hourly) * quantity
+
+
+def _total_cost(
+    upfront: Any, hourly: Any, term_hours: Any, quantity: Any
+) -> Any:
+    return (upfront + hourly * term_hours) * quantity
+
+
+def compute_metrics(
+    offerings: Sequence[Mapping[str, Any]], on_demand_rate: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Compute every ranking metric for all offerings at once.
+    Returns one array (or list, without numpy) per metric, NaN where unknown.
+    The effective hourly rate and the total cost are for the ordered
+    quantity. The break-even month is the first month in which the upfront
+    payment is covered by the savings against the given on-demand hourly rate
+    of one unit, which does not depend on the quantity.
+    """
+    if np is None:
+        return _compute_metrics_python(offerings, on_demand_rate)
+    upfront, hourly, term_hours, quantity = (
+        np.fromiter(
+            (_cost(column, offering) for offering in offerings),
+            dtype=float,
+            count=len(offerings),
+        )
+        for column in COST_COLUMNS
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if on_demand_rate is None:
+            break_even = np.full(len(offerings), np.nan)
+        else:
+            savings = (on_demand_rate - hourly) * HOURS_PER_MONTH
+            break_even = np.where(savings > 0, np.ceil(upfront / savings), np.nan)
+        return {
+            "effective_hourly_rate": _effective_hourly_rate(
+                upfront, hourly, term_hours, quantity
+            ),
+            "total_cost": _total_cost(upfront, hourly, term_hours, quantity),
+            "break_even_month": break_even,
+        }
+
+
+def offering_metrics(
+    offering: Mapping[str, Any], on_demand_rate: Optional[float] = None
+) -> Dict[str, float]:
+    """
+    Compute the ranking metrics of a single offering, NaN where unknown.
+    See compute_metrics.
+    """
+    upfront, hourly, term_hours, quantity = offering_costs(offering)
+    break_even = math.nan
+    if on_demand_rate is not None and on_demand_rate - hourly > 0:
+        savings = (on_demand_rate - hourly) * HOURS_PER_MONTH
+        if not math.isnan(upfront):
+            break_even = math.ceil(upfront / savings)
+    return {
+        "effective_hourly_rate": _effective_hourly_rate(
+            upfront, hourly, term_hours, quantity
+        ),
+        "total_cost": _total_cost(upfront, hourly, term_hours, quantity),
+        "break_even_month": break_even,
+    }
+
+
+def _compute_metrics_python(
+    offerings: Sequence[Mapping[str, Any]], on_demand_rate: Optional[float]
+) -> Dict[str, Any]:
+    metrics: Dict[str, List[float]] = {name: [] for name in RANK_METRICS}
+    for offering in offerings:
+        for name, value in offering_metrics(offering, on_demand_rate).items():
+            metrics[name].append(value)
+    return metrics
+
+
+def _sort_key(value: float) -> Tuple[bool, float]:
+    unknown = math.isnan(value)
+    return (unknown, 0.0 if unknown else value)
+
+
+def _order(values: Any, count: int) -> List[int]:
+    """
+    Ascending order of the values, stable, with NaN last.
+    """
+    if np is not None:
+        return np.argsort(values, kind="stable").tolist()
+    return sorted(range(count), key=lambda i: _sort_key(values[i]))
+
+
+def rank_offerings(
+    offerings: Sequence[MutableMapping[str, Any]],
+    sort: Optional[str] = None,
+    top: Optional[int] = None,
+    on_demand_rate: Optional[float] = None,
+) -> List[MutableMapping[str, Any]]:
+    """
+    Sort the offerings by a metric (ascending, unknown values last), keep the
+    first top ones, and add their EffectiveHourlyRate, TotalCost (both for
+    the ordered quantity) and BreakEvenMonth keys.
+    """
+    offerings = list(offerings)
+    if not offerings:
+        return offerings
+    metrics = compute_metrics(offerings, on_demand_rate)
+    if sort is not None:
+        order = _order(metrics[sort], len(offerings))
+    else:
+        order = list(range(len(offerings)))
+    if top is not None:
+        order = order[:top]
+    # Only the offerings that are returned get the metric keys
+    ranked = []
+    for i in order:
+        offering = offerings[i]
+        for name, key in RANK_METRICS.items():
+            value = float(metrics[name][i])
+            if math.isnan(value):
+                offering[key] = None
+            elif name == "break_even_month":
+                offering[key] = int(value)
+            else:
+                offering[key] = round(value, 6)
+        ranked.append(offering)
+    return ranked
+
+
+def top_offerings(
+    offerings: Iterable[MutableMapping[str, Any]],
+    top: int,
+    by: str,
+    on_demand_rate: Optional[float] = None,
+) -> List[MutableMapping[str, Any]]:
+    """
+    Streaming variant of rank_offerings for a top N: the offerings are
+    consumed one by one into a bounded heap, so memory stays O(top) however
+    many offerings stream in. Ties keep their arrival order.
+    """
+    best = heapq.nsmallest(
+        top,
+        offerings,
+        key=lambda offering: _sort_key(offering_metrics(offering, on_demand_rate)[by]),
+    )
+    return rank_offerings(best, on_demand_rate=on_demand_rate)
@@ -0,0 +1,222 @@
+import math
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple, Type
+from offering_finder.ranking import offering_metrics
+
+# Tags a frozen dict inside a frozen list
+_DICT = object()
+
+
+def _freeze(value: Any, shared: Dict[Any, Any]) -> Any:
+    """
+    Share equal strings, and turn lists (of dicts) into shared tuples, through
+    the shared table.
+    """
+    if type(value) is str:
+        return shared.setdefault(value, value)
+    if type(value) is list:
+        frozen = tuple(
+            (_DICT, tuple((k, _freeze(v, shared)) for k, v in item.items()))
+            if type(item) is dict
+            else _freeze(item, shared)
+            for item in value
+        )
+        return shared.setdefault(frozen, frozen)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if type(value) is tuple:
+        return [
+            {k: _thaw(v) for k, v in item[1]}
+            if type(item) is tuple and item and item[0] is _DICT
+            else _thaw(item)
+            for item in value
+        ]
+    return value
+
+
+class OfferingRecord(Mapping):
+    """
+    Compact, read-only offering backed by __slots__ instead of a response dict.
+    The known response fields are stored in slots, with their strings and
+    their lists (frozen into tuples) shared across the records built with the
+    same table, since they repeat across the catalog; any other key lands in
+    '_extra'. Records are Mappings, so dict(record) and the planner and
+    catalog lookups work unchanged. Convert them with to_dict before
+    enriching or serializing.
+    """
+
+    __slots__ = ("_extra", "_hourly_rate")
+    FIELDS: Tuple[str, ...] = ()
+    _field_set: frozenset = frozenset()
+    ID_FIELD = ""
+
+    @classmethod
+    def from_dict(
+        cls, data: Dict[str, Any], shared: Optional[Dict[Any, Any]] = None
+    ) -> "OfferingRecord":
+        """
+        Build a record. Records built with the same shared table share their
+        repeated values; the table is only needed while building them.
+        """
+        shared = {} if shared is None else shared
+        record = cls.__new__(cls)
+        for field in cls.FIELDS:
+            value = data.get(field)
+            # Offering IDs are unique: sharing them would only grow the table
+            if field != cls.ID_FIELD:
+                value = _freeze(value, shared)
+            setattr(record, field, value)
+        extra = {k: v for k, v in data.items() if k not in cls._field_set}
+        record._extra = extra or None
+        record._hourly_rate = None
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {}
+        for field in self.FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                result[field] = _thaw(value)
+        if self._extra:
+            result.update(self._extra)
+        return result
+
+    @property
+    def offering_id(self) -> Optional[str]:
+        return getattr(self, self.ID_FIELD)
+
+    @property
+    def duration_seconds(self) -> Optional[int]:
+        value = getattr(self, "Duration", None)
+        return int(value) if value is not None else None
+
+    @property
+    def effective_hourly_rate(self) -> Optional[float]:
+        """
+        Upfront price spread over the term plus the hourly charges of one
+        unit (see ranking.offering_metrics), computed on first access.
+        """
+        if self._hourly_rate is None:
+            self._hourly_rate = self._compute_hourly_rate()
+        return self._hourly_rate
+
+    def _compute_hourly_rate(self) -> Optional[float]:
+        rate = offering_metrics(self)["effective_hourly_rate"]
+        return None if math.isnan(rate) else rate
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_set:
+            value = getattr(self, key)
+            if value is not None:
+                return _thaw(value)
+        elif self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for field in self.FIELDS:
+            if getattr(self, field) is not None:
+                yield field
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls.FIELDS)
+
+
+class RDSOfferingRecord(OfferingRecord):
+    FIELDS = (
+        "ReservedDBInstancesOfferingId",
+        "DBInstanceClass",
+        "Duration",
+        "FixedPrice",
+        "UsagePrice",
+        "CurrencyCode",
+        "ProductDescription",
+        "OfferingType",
+        "MultiAZ",
+        "RecurringCharges",
+    )
+    __slots__ = FIELDS
+    ID_FIELD = "ReservedDBInstancesOfferingId"
+
+
+class ElastiCacheOfferingRecord(OfferingRecord):
+    FIELDS = (
+        "ReservedCacheNodesOfferingId",
+        "CacheNodeType",
+        "Duration",
+        "FixedPrice",
+        "UsagePrice",
+        "ProductDescription",
+        "OfferingType",
+        "RecurringCharges",
+    )
+    __slots__ = FIELDS
+    ID_FIELD = "ReservedCacheNodesOfferingId"
+
+
+class OpenSearchOfferingRecord(OfferingRecord):
+    FIELDS = (
+        "ReservedInstanceOfferingId",
+        "InstanceType",
+        "Duration",
+        "FixedPrice",
+        "UsagePrice",
+        "CurrencyCode",
+        "PaymentOption",
+        "RecurringCharges",
+    )
+    __slots__ = FIELDS
+    ID_FIELD = "ReservedInstanceOfferingId"
+
+
+class SavingsPlansOfferingRecord(OfferingRecord):
+    FIELDS = (
+        "offeringId",
+        "productTypes",
+        "planType",
+        "description",
+        "paymentOption",
+        "durationSeconds",
+        "currency",
+        "serviceCode",
+        "usageType",
+        "operation",
+        "properties",
+    )
+    __slots__ = FIELDS
+    ID_FIELD = "offeringId"
+
+    @property
+    def duration_seconds(self) -> Optional[int]:
+        return int(self.durationSeconds) if self.durationSeconds is not None else None
+
+    def _compute_hourly_rate(self) -> Optional[float]:
+        # Savings Plans offerings carry no price; rates come from a separate API
+        return None
+
+
+RECORD_CLASSES: Dict[str, Type[OfferingRecord]] = {
+    "rds": RDSOfferingRecord,
+    "elasticache": ElastiCacheOfferingRecord,
+    "opensearch": OpenSearchOfferingRecord,
+    "savingsplans": SavingsPlansOfferingRecord,
+}
+
+
+def to_record(
+    service_name: str,
+    offering: Dict[str, Any],
+    shared: Optional[Dict[Any, Any]] = None,
+) -> OfferingRecord:
+    return RECORD_CLASSES[service_name].from_dict(offering, shared)
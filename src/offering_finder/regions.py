@@ -0,0 +1,140 @@
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_QUEUE_SIZE = 1000
+
+_DONE = object()
+
+# Services served from a single global endpoint, with the endpoint region
+GLOBAL_SERVICES = {"savingsplans": "us-east-1"}
+
+
+def resolve_regions(
+    service_name: str,
+    region_names: Optional[Sequence[str]] = None,
+    all_regions: bool = False,
+) -> List[str]:
+    """
+    Resolve the list of regions to query.
+    Duplicates are removed while keeping the order given on the command line.
+    A global service is queried once: in its endpoint region with
+    all_regions, else in the first region given.
+    """
+    result = []
+    for region_name in region_names or []:
+        if region_name not in result:
+            result.append(region_name)
+    if service_name in GLOBAL_SERVICES:
+        # Every region returns the same catalog: fetching it more than once
+        # only duplicates the offerings
+        if all_regions:
+            return [GLOBAL_SERVICES[service_name]]
+        if len(result) > 1:
+            logging.warning(
+                f"{service_name} offerings are global, querying {result[0]} only"
+            )
+        return result[:1] or [GLOBAL_SERVICES[service_name]]
+    if all_regions:
+        import boto3
+
+        return boto3.session.Session().get_available_regions(service_name)
+    if not result:
+        raise ValueError("At least one region name or all_regions is required")
+    return result
+
+
+def fetch_across_regions(
+    fetch: Callable[[str], Iterable[Dict[str, Any]]],
+    region_names: Sequence[str],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List[Dict[str, Any]]:
+    """
+    Call fetch(region_name) for every region on a bounded thread pool and merge
+    the results in region order. Each offering is tagged with 'RegionName'.
+    A failing region is logged and skipped; the error is raised only when
+    every region failed.
+    """
+    if not region_names:
+        return []
+    workers = max(1, min(max_workers, len(region_names)))
+    result = []
+    errors = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(lambda name: list(fetch(name)), region_name)
+            for region_name in region_names
+        ]
+        for region_name, future in zip(region_names, futures):
+            try:
+                offerings = future.result()
+            except Exception as e:
+                logging.error(f"Failed to fetch offerings in {region_name}: {e}")
+                errors.append(e)
+                continue
+            for offering in offerings:
+                offering["RegionName"] = region_name
+                result.append(offering)
+    if errors and len(errors) == len(region_names):
+        raise errors[-1]
+    return result
+
+
+def iter_across_regions(
+    fetch: Callable[[str], Iterable[Dict[str, Any]]],
+    region_names: Sequence[str],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming variant of fetch_across_regions.
+    Offerings are yielded as soon as any region produces them, so the order
+    across regions is not stable. The bounded queue caps memory when the
+    consumer is slower than the producers.
+    """
+    if not region_names:
+        return
+    workers = max(1, min(max_workers, len(region_names)))
+    results: queue.Queue = queue.Queue(maxsize=queue_size)
+    stopped = threading.Event()
+    errors = []
+
+    def put(item: Any) -> bool:
+        while not stopped.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(region_name: str) -> None:
+        try:
+            for offering in fetch(region_name):
+                offering["RegionName"] = region_name
+                if not put(offering):
+                    return
+        except Exception as e:
+            logging.error(f"Failed to fetch offerings in {region_name}: {e}")
+            errors.append(e)
+        finally:
+            put(_DONE)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for region_name in region_names:
+            executor.submit(produce, region_name)
+        try:
+            remaining = len(region_names)
+            while remaining:
+                item = results.get()
+                if item is _DONE:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            stopped.set()
+    if errors and len(errors) == len(region_names):
+        raise errors[-1]
@@ -0,0 +1,199 @@
+import csv
+import importlib.util
+import io
+import json
+import sys
+from contextlib import contextmanager
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+OUTPUT_FORMATS = ["json", "json-compact", "ndjson", "csv", "arrow", "parquet"]
+# Formats written record by record, as the records arrive
+STREAMING_FORMATS = frozenset({"json-compact", "ndjson"})
+# Formats needing pyarrow (pip install 'offering-finder[arrow]')
+COLUMNAR_FORMATS = frozenset({"arrow", "parquet"})
+# Write buffer of the output stream or file
+BUFFER_SIZE = 1 << 20
+
+
+def _default(value: Any) -> Any:
+    """
+    Encode what the JSON encoders do not know: numpy scalars and Mappings
+    (e.g. enriched views left unmaterialized).
+    """
+    item = getattr(value, "item", None)
+    if item is not None:
+        return item()
+    if hasattr(value, "keys"):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any, indent: bool = False) -> bytes:
+    """
+    Encode a value as UTF-8 JSON, with orjson when it is installed.
+    Compact unless indent is set (2 spaces).
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(value, default=_default, option=option)
+    if indent:
+        return json.dumps(value, indent=2, default=_default).encode()
+    return json.dumps(value, separators=(",", ":"), default=_default).encode()
+
+
+def write_json(records: Iterable[Dict[str, Any]], stream: IO[bytes]) -> None:
+    """
+    Write the records as one indented JSON array.
+    """
+    stream.write(dumps(list(records), indent=True) + b"\n")
+
+
+def write_json_compact(records: Iterable[Dict[str, Any]], stream: IO[bytes]) -> None:
+    """
+    Stream the records as one compact JSON array.
+    """
+    stream.write(b"[")
+    for i, record in enumerate(records):
+        if i:
+            stream.write(b",")
+        stream.write(dumps(record))
+    stream.write(b"]\n")
+
+
+def write_ndjson(
+    records: Iterable[Dict[str, Any]], stream: IO[bytes], flush: bool = False
+) -> None:
+    """
+    Stream the records one JSON object per line. With flush set, each line
+    is flushed as soon as it is written (e.g. for a terminal).
+    """
+    for record in records:
+        stream.write(dumps(record) + b"\n")
+        if flush:
+            stream.flush()
+
+
+def _cell(value: Any) -> Any:
+    if isinstance(value, (list, dict)):
+        return dumps(value).decode()
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
+
+
+def write_csv(records: Iterable[Dict[str, Any]], stream: IO[bytes]) -> None:
+    """
+    Write the records as CSV. The columns are every key of the records, in
+    order of appearance, so the records are collected first; nested values
+    (e.g. RecurringCharges) are JSON encoded.
+    """
+    records = list(records)
+    columns: Dict[str, None] = {}
+    for record in records:
+        columns.update(dict.fromkeys(record))
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="", write_through=True)
+    try:
+        writer = csv.DictWriter(text, fieldnames=list(columns))
+        writer.writeheader()
+        for record in records:
+            writer.writerow({k: _cell(v) for k, v in record.items()})
+    finally:
+        # Leave the underlying stream open
+        text.detach()
+
+
+def check_output(output: str) -> None:
+    """
+    Fail before anything is fetched when the output format needs a missing
+    optional dependency.
+    """
+    if output in COLUMNAR_FORMATS and importlib.util.find_spec("pyarrow") is None:
+        raise ImportError(
+            f"'{output}' output requires pyarrow: pip install 'offering-finder[arrow]'"
+        )
+
+
+def _table(records: Iterable[Dict[str, Any]], output: str) -> Any:
+    check_output(output)
+    import pyarrow as pa
+
+    rows: List[Dict[str, Any]] = list(records)
+    return pa.Table.from_pylist(rows)
+
+
+def write_arrow(records: Iterable[Dict[str, Any]], stream: IO[bytes]) -> None:
+    """
+    Write the records as an Arrow IPC file.
+    """
+    table = _table(records, "arrow")
+    import pyarrow as pa
+
+    with pa.ipc.new_file(stream, table.schema) as writer:
+        writer.write_table(table)
+
+
+def write_parquet(records: Iterable[Dict[str, Any]], stream: IO[bytes]) -> None:
+    """
+    Write the records as a Parquet file.
+    """
+    table = _table(records, "parquet")
+    import pyarrow.parquet as pq
+
+    pq.write_table(table, stream)
+
+
+WRITERS: Dict[str, Callable[[Iterable[Dict[str, Any]], IO[bytes]], None]] = {
+    "json": write_json,
+    "json-compact": write_json_compact,
+    "ndjson": write_ndjson,
+    "csv": write_csv,
+    "arrow": write_arrow,
+    "parquet": write_parquet,
+}
+
+
+def write(
+    records: Iterable[Dict[str, Any]],
+    stream: IO[bytes],
+    output: str = "json",
+) -> None:
+    """
+    Write the records to a binary stream in the given output format.
+    """
+    if output not in WRITERS:
+        raise ValueError(f"Unknown output format: {output}")
+    if output == "ndjson":
+        isatty = getattr(stream, "isatty", None)
+        write_ndjson(records, stream, flush=bool(isatty and isatty()))
+        return
+    WRITERS[output](records, stream)
+
+
+@contextmanager
+def open_output(path: Optional[str] = None) -> Iterator[IO[bytes]]:
+    """
+    Open a buffered binary stream to a file, or stdout's buffer when no path
+    is given. stdout is flushed but left open.
+    """
+    if path is not None:
+        with open(path, "wb", buffering=BUFFER_SIZE) as f:
+            yield f
+        return
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # A text-only stdout (e.g. a redirected StringIO)
+        stream = io.BytesIO()
+        yield stream
+        sys.stdout.write(stream.getvalue().decode())
+        sys.stdout.flush()
+        return
+    try:
+        yield buffer
+    finally:
+        buffer.flush()
@@ -0,0 +1,380 @@
+import datetime
+import io
+import json
+import logging
+import os
+import socketserver
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from pydantic import Field
+from offering_finder.batch import MANAGERS, PARAMS, BatchItem, build_purchase_params
+from offering_finder.catalog import OfferingCatalog
+from offering_finder.clients.ClientFactory import ClientFactory
+from offering_finder.enrichment import as_dict, materialize
+from offering_finder.expressions import parse_where
+from offering_finder.projection import RANKING_FIELDS, project, projection_fields
+from offering_finder.ranking import RANK_METRICS, rank_offerings, top_offerings
+from offering_finder.regions import DEFAULT_MAX_WORKERS, GLOBAL_SERVICES
+from offering_finder.serializers import OUTPUT_FORMATS, check_output, write
+
+DEFAULT_REFRESH_INTERVAL = 3600
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+
+CONTENT_TYPES = {
+    "json": "application/json",
+    "json-compact": "application/json",
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "arrow": "application/vnd.apache.arrow.file",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+CatalogKey = Tuple[str, str]
+
+
+class CatalogNotReady(Exception):
+    """
+    Raised when a served catalog has not been loaded yet.
+    """
+
+
+class ServeQuery(BatchItem):
+    """
+    Data class for one query to the daemon: a batch line item (the same
+    criteria as the subcommands), plus a where expression, cost ranking,
+    field projection and output format.
+    """
+
+    where: Optional[str] = None
+    sort: Optional[str] = None
+    top: Optional[int] = Field(default=None, ge=1)
+    on_demand_rate: Optional[float] = None
+    fields: Optional[List[str]] = None
+    output: str = "json"
+
+
+class CatalogStore:
+    """
+    Full catalogs of the served (service, region) pairs, kept in memory as
+    compact OfferingCatalogs and reloaded every refresh_interval seconds by
+    a background thread. A refreshed catalog replaces the previous one at
+    once, and a catalog that fails to reload keeps serving its previous
+    version. The managers (and their boto3 clients) are created once.
+    The client factory should carry no offering cache, or refreshes would
+    be served from it.
+    """
+
+    def __init__(
+        self,
+        targets: Iterable[CatalogKey],
+        client_factory: Optional[ClientFactory] = None,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        self.targets: List[CatalogKey] = list(dict.fromkeys(targets))
+        for service_name, _ in self.targets:
+            if service_name not in MANAGERS:
+                raise ValueError(f"Unsupported service: {service_name}")
+        self.client_factory = client_factory or ClientFactory()
+        self.refresh_interval = refresh_interval
+        self.max_workers = max_workers
+        self.managers = {
+            key: MANAGERS[key[0]](region_name=key[1], client_factory=self.client_factory)
+            for key in self.targets
+        }
+        self._catalogs: Dict[CatalogKey, OfferingCatalog] = {}
+        self._loaded_at: Dict[CatalogKey, float] = {}
+        self._errors: Dict[CatalogKey, str] = {}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def load(self, key: CatalogKey) -> OfferingCatalog:
+        """
+        Fetch the full catalog of a (service, region).
+        """
+        params_class = PARAMS[key[0]]
+        # Unset model defaults (e.g. Duration) would narrow the catalog
+        params = params_class(**{name: None for name in params_class.model_fields})
+        return OfferingCatalog.from_manager(self.managers[key], params, compact=True)
+
+    def refresh(self) -> None:
+        """
+        Reload every catalog on a bounded thread pool.
+        """
+        with self._refresh_lock:
+            workers = max(1, min(self.max_workers, len(self.targets)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {key: executor.submit(self.load, key) for key in self.targets}
+                for key, future in futures.items():
+                    try:
+                        catalog = future.result()
+                    except Exception as e:
+                        logging.error(
+                            f"Failed to refresh {key[0]} offerings in {key[1]}: {e}"
+                        )
+                        with self._lock:
+                            self._errors[key] = str(e)
+                        continue
+                    with self._lock:
+                        self._catalogs[key] = catalog
+                        self._loaded_at[key] = time.time()
+                        self._errors.pop(key, None)
+
+    def start(self) -> None:
+        """
+        Start refreshing the catalogs in the background.
+        """
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.refresh_interval):
+            self.refresh()
+
+    def catalog_key(self, service_name: str, region_name: str) -> CatalogKey:
+        """
+        Return the served (service, region) answering for a region. The single
+        catalog of a global service answers for every region.
+        """
+        key = (service_name, region_name)
+        if key not in self.managers and service_name in GLOBAL_SERVICES:
+            key = next((k for k in self.targets if k[0] == service_name), key)
+        return key
+
+    def catalog(self, service_name: str, region_name: str) -> OfferingCatalog:
+        """
+        Return the current catalog of a (service, region).
+        Raises LookupError when it is not served, and CatalogNotReady when it
+        has not been loaded yet.
+        """
+        key = self.catalog_key(service_name, region_name)
+        if key not in self.managers:
+            raise LookupError(f"{service_name} offerings in {region_name} are not served")
+        with self._lock:
+            catalog = self._catalogs.get(key)
+            error = self._errors.get(key)
+        if catalog is None:
+            raise CatalogNotReady(
+                f"{service_name} offerings in {region_name} are not loaded yet"
+                + (f": {error}" if error else "")
+            )
+        return catalog
+
+    def status(self) -> List[Dict[str, Any]]:
+        """
+        Size, load time and last refresh error of every catalog.
+        """
+        with self._lock:
+            result = []
+            for key in self.targets:
+                catalog = self._catalogs.get(key)
+                loaded_at = self._loaded_at.get(key)
+                result.append(
+                    {
+                        "service": key[0],
+                        "region": key[1],
+                        "offerings": len(catalog) if catalog is not None else None,
+                        "loaded_at": (
+                            datetime.datetime.fromtimestamp(
+                                loaded_at, datetime.timezone.utc
+                            ).isoformat()
+                            if loaded_at is not None
+                            else None
+                        ),
+                        "error": self._errors.get(key),
+                    }
+                )
+            return result
+
+    @property
+    def ready(self) -> bool:
+        with self._lock:
+            return len(self._catalogs) == len(self.targets)
+
+
+def answer(store: CatalogStore, query: ServeQuery) -> List[Dict[str, Any]]:
+    """
+    Answer a query from the warm catalogs: criteria and the equality terms of
+    the where expression are looked up in the catalog indexes, the rest of
+    the expression is checked on the candidates, and the matches are
+    projected, enriched and ranked as the subcommands do.
+    """
+    if query.sort is not None and query.sort not in RANK_METRICS:
+        raise ValueError(f"Unknown sort metric: {query.sort}")
+    catalog = store.catalog(query.service, query.region)
+    criteria = query.criteria()
+    predicate = None
+    if query.where:
+        where_criteria, predicate = parse_where(query.where).split(exclude=list(criteria))
+        criteria = {**where_criteria, **criteria}
+    offerings: Iterable[Any] = catalog.query(criteria)
+    if predicate is not None:
+        offerings = [offering for offering in offerings if predicate(offering)]
+    ranked = query.sort is not None or query.on_demand_rate is not None
+    fields = projection_fields(
+        query.service, query.fields, RANKING_FIELDS[query.service] if ranked else ()
+    )
+    if fields is not None:
+        offerings = [project(as_dict(offering), fields) for offering in offerings]
+    manager = store.managers[store.catalog_key(query.service, query.region)]
+    views = list(manager.enrich_offerings(offerings, build_purchase_params(query, None)))
+    for view in views:
+        view["RegionName"] = query.region
+    if query.top is not None and query.sort is not None:
+        views = top_offerings(views, query.top, query.sort, query.on_demand_rate)
+    elif ranked:
+        views = rank_offerings(views, query.sort, query.top, query.on_demand_rate)
+    elif query.top is not None:
+        views = views[: query.top]
+    return list(materialize(views))
+
+
+def parse_query(service_name: str, values: Dict[str, Any]) -> ServeQuery:
+    """
+    Build a query from a JSON body or query string values; 'fields' may be
+    a comma-separated string.
+    """
+    values = dict(values)
+    fields = values.get("fields")
+    if isinstance(fields, str):
+        values["fields"] = [f.strip() for f in fields.split(",") if f.strip()]
+    return ServeQuery(**{**values, "service": service_name})
+
+
+class OfferingRequestHandler(BaseHTTPRequestHandler):
+    """
+    Local HTTP API over a CatalogStore (the server's 'store'):
+    GET /healthz, GET /catalogs, POST /refresh, and GET (query string) or
+    POST (JSON body) /offerings/<service>.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # The client address is empty on a unix socket
+        logging.debug(format % args)
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        if url.path == "/healthz":
+            ready = self.server.store.ready
+            self._send_json(
+                200 if ready else 503,
+                {"status": "ok" if ready else "loading"},
+            )
+        elif url.path == "/catalogs":
+            self._send_json(200, self.server.store.status())
+        elif url.path.startswith("/offerings/"):
+            values = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            self._offerings(url.path, values)
+        else:
+            self._send_json(404, {"error": f"Unknown path: {url.path}"})
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        if url.path == "/refresh":
+            self.server.store.refresh()
+            self._send_json(200, self.server.store.status())
+            return
+        if not url.path.startswith("/offerings/"):
+            self._send_json(404, {"error": f"Unknown path: {url.path}"})
+            return
+        try:
+            values = json.loads(body or b"{}")
+        except ValueError as e:
+            self._send_json(400, {"error": f"Invalid JSON body: {e}"})
+            return
+        if not isinstance(values, dict):
+            self._send_json(400, {"error": "The body must be a JSON object"})
+            return
+        self._offerings(url.path, values)
+
+    def _offerings(self, path: str, values: Dict[str, Any]) -> None:
+        service_name = path[len("/offerings/"):].strip("/")
+        if service_name not in MANAGERS:
+            self._send_json(404, {"error": f"Unsupported service: {service_name}"})
+            return
+        try:
+            query = parse_query(service_name, values)
+            if query.output not in OUTPUT_FORMATS:
+                raise ValueError(f"Unknown output format: {query.output}")
+            check_output(query.output)
+            offerings = answer(self.server.store, query)
+        except LookupError as e:
+            self._send_json(404, {"error": str(e)})
+            return
+        except CatalogNotReady as e:
+            self._send_json(503, {"error": str(e)})
+            return
+        except (ValueError, ImportError) as e:
+            # pydantic's ValidationError is a ValueError
+            self._send_json(400, {"error": str(e)})
+            return
+        stream = io.BytesIO()
+        write(offerings, stream, query.output)
+        self._send(200, CONTENT_TYPES[query.output], stream.getvalue())
+
+    def _send_json(self, status: int, body: Any) -> None:
+        self._send(status, "application/json", json.dumps(body).encode())
+
+    def _send(self, status: int, content_type: str, data: bytes) -> None:
+        # The status line, headers and body go out in one write: split writes
+        # on a keep-alive connection stall on Nagle's algorithm and delayed
+        # ACKs (about 40 ms per request)
+        self.log_request(status)
+        head = (
+            f"{self.protocol_version} {status} {self.responses[status][0]}\r\n"
+            f"Server: {self.version_string()}\r\n"
+            f"Date: {self.date_time_string()}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            "\r\n"
+        )
+        self.wfile.write(head.encode("latin-1") + data)
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(
+    store: CatalogStore,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[str] = None,
+) -> socketserver.BaseServer:
+    """
+    Create the HTTP server answering from the store, on a TCP address or
+    on a unix socket when socket_path is given. A stale socket left at
+    socket_path is replaced; any other file there raises FileExistsError.
+    """
+    if socket_path is not None:
+        if os.path.lexists(socket_path):
+            if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+                raise FileExistsError(f"{socket_path} exists and is not a socket")
+            os.unlink(socket_path)
+        server: socketserver.BaseServer = ThreadingUnixHTTPServer(
+            socket_path, OfferingRequestHandler
+        )
+    else:
+        server = ThreadingHTTPServer((host, port), OfferingRequestHandler)
+        server.daemon_threads = True
+    server.store = store
+    return server
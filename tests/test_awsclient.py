@@ -1,43 +1,48 @@
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import ANY, Mock, patch, MagicMock
 from src.offering_finder.clients.AWSClient import AWSClient
+from src.offering_finder.clients.ClientFactory import ClientFactory
 
 
-@patch("src.offering_finder.clients.AWSClient.boto3")
-def test_awsclient_init_rds(mock_boto3):
+@patch("boto3.Session")
+def test_awsclient_init_rds(mock_session):
     """RDSサービスのAWSClientが正しく初期化されることを確認"""
     mock_client = Mock()
-    mock_boto3.client.return_value = mock_client
+    mock_session.return_value.client.return_value = mock_client
 
-    client = AWSClient("rds", "us-west-2")
+    client = AWSClient("rds", "us-west-2", client_factory=ClientFactory())
 
-    mock_boto3.client.assert_called_once_with("rds", region_name="us-west-2")
+    mock_session.return_value.client.assert_called_once_with(
+        "rds", region_name="us-west-2", endpoint_url=None, config=ANY
+    )
     assert client.client == mock_client
 
 
-@patch("src.offering_finder.clients.AWSClient.boto3")
-def test_awsclient_init_elasticache(mock_boto3):
+@patch("boto3.Session")
+def test_awsclient_init_elasticache(mock_session):
     """ElastiCacheサービスのAWSClientが正しく初期化されることを確認"""
     mock_client = Mock()
-    mock_boto3.client.return_value = mock_client
+    mock_session.return_value.client.return_value = mock_client
 
-    client = AWSClient("elasticache", "us-west-2")
+    client = AWSClient("elasticache", "us-west-2", client_factory=ClientFactory())
 
-    mock_boto3.client.assert_called_once_with("elasticache", region_name="us-west-2")
+    mock_session.return_value.client.assert_called_once_with(
+        "elasticache", region_name="us-west-2", endpoint_url=None, config=ANY
+    )
     assert client.client == mock_client
 
 
-@patch("src.offering_finder.clients.AWSClient.boto3")
-def test_describe_offerings_rds(mock_boto3):
+@patch("boto3.Session")
+def test_describe_offerings_rds(mock_session):
     """RDSのdescribe_offeringsが正しく呼ばれることを確認"""
     mock_client = Mock()
     mock_client.meta.service_model.service_name = "rds"
     mock_client.describe_reserved_db_instances_offerings.return_value = {
         "ReservedDBInstancesOfferings": [{"OfferingId": "rds-123"}]
     }
-    mock_boto3.client.return_value = mock_client
+    mock_session.return_value.client.return_value = mock_client
 
-    client = AWSClient("rds", "us-west-2")
+    client = AWSClient("rds", "us-west-2", client_factory=ClientFactory())
     result = client.describe_offerings({"ProductDescription": "MySQL"})
 
     mock_client.describe_reserved_db_instances_offerings.assert_called_once_with(
@@ -46,17 +51,17 @@ def test_describe_offerings_rds(mock_boto3):
     assert result == {"ReservedDBInstancesOfferings": [{"OfferingId": "rds-123"}]}
 
 
-@patch("src.offering_finder.clients.AWSClient.boto3")
-def test_describe_offerings_elasticache(mock_boto3):
+@patch("boto3.Session")
+def test_describe_offerings_elasticache(mock_session):
     """ElastiCacheのdescribe_offeringsが正しく呼ばれることを確認"""
     mock_client = Mock()
     mock_client.meta.service_model.service_name = "elasticache"
     mock_client.describe_reserved_cache_nodes_offerings.return_value = {
         "ReservedCacheNodesOfferings": [{"OfferingId": "ec-123"}]
     }
-    mock_boto3.client.return_value = mock_client
+    mock_session.return_value.client.return_value = mock_client
 
-    client = AWSClient("elasticache", "us-west-2")
+    client = AWSClient("elasticache", "us-west-2", client_factory=ClientFactory())
     result = client.describe_offerings({"ProductDescription": "redis"})
 
     mock_client.describe_reserved_cache_nodes_offerings.assert_called_once_with(
@@ -65,17 +70,17 @@ def test_describe_offerings_elasticache(mock_boto3):
     assert result == {"ReservedCacheNodesOfferings": [{"OfferingId": "ec-123"}]}
 
 
-@patch("src.offering_finder.clients.AWSClient.boto3")
-def test_describe_offerings_savingsplans(mock_boto3):
+@patch("boto3.Session")
+def test_describe_offerings_savingsplans(mock_session):
     """Savings Plansのdescribe_offeringsが正しく呼ばれることを確認"""
     mock_client = Mock()
     mock_client.meta.service_model.service_name = "savingsplans"
     mock_client.describe_savings_plans_offerings.return_value = {
         "searchResults": [{"offeringId": "sp-123"}]
     }
-    mock_boto3.client.return_value = mock_client
+    mock_session.return_value.client.return_value = mock_client
 
-    client = AWSClient("savingsplans", "us-west-2")
+    client = AWSClient("savingsplans", "us-west-2", client_factory=ClientFactory())
     result = client.describe_offerings({"productType": "EC2"})
 
     mock_client.describe_savings_plans_offerings.assert_called_once_with(
@@ -84,17 +89,17 @@ def test_describe_offerings_savingsplans(mock_boto3):
     assert result == {"searchResults": [{"offeringId": "sp-123"}]}
 
 
-@patch("src.offering_finder.clients.AWSClient.boto3")
-def test_describe_offerings_opensearch(mock_boto3):
+@patch("boto3.Session")
+def test_describe_offerings_opensearch(mock_session):
     """OpenSearchのdescribe_offeringsが正しく呼ばれることを確認"""
     mock_client = Mock()
     mock_client.meta.service_model.service_name = "opensearch"
     mock_client.describe_reserved_instance_offerings.return_value = {
         "ReservedInstanceOfferings": [{"OfferingId": "os-123"}]
     }
-    mock_boto3.client.return_value = mock_client
+    mock_session.return_value.client.return_value = mock_client
 
-    client = AWSClient("opensearch", "us-west-2")
+    client = AWSClient("opensearch", "us-west-2", client_factory=ClientFactory())
     result = client.describe_offerings({"MaxResults": 100})
 
     mock_client.describe_reserved_instance_offerings.assert_called_once_with(
@@ -103,30 +108,30 @@ def test_describe_offerings_opensearch(mock_boto3):
     assert result == {"ReservedInstanceOfferings": [{"OfferingId": "os-123"}]}
 
 
-@patch("src.offering_finder.clients.AWSClient.boto3")
-def test_describe_offerings_unsupported_service(mock_boto3):
+@patch("boto3.Session")
+def test_describe_offerings_unsupported_service(mock_session):
     """未サポートのサービスでValueErrorが発生することを確認"""
     mock_client = Mock()
     mock_client.meta.service_model.service_name = "s3"
-    mock_boto3.client.return_value = mock_client
+    mock_session.return_value.client.return_value = mock_client
 
-    client = AWSClient("s3", "us-west-2")
+    client = AWSClient("s3", "us-west-2", client_factory=ClientFactory())
 
     with pytest.raises(ValueError, match="Unsupported service"):
         client.describe_offerings({})
 
 
-@patch("src.offering_finder.clients.AWSClient.boto3")
-def test_describe_offerings_with_multiple_params(mock_boto3):
+@patch("boto3.Session")
+def test_describe_offerings_with_multiple_params(mock_session):
     """複数のパラメータが正しく渡されることを確認"""
     mock_client = Mock()
     mock_client.meta.service_model.service_name = "rds"
     mock_client.describe_reserved_db_instances_offerings.return_value = {
         "ReservedDBInstancesOfferings": []
     }
-    mock_boto3.client.return_value = mock_client
+    mock_session.return_value.client.return_value = mock_client
 
-    client = AWSClient("rds", "us-west-2")
+    client = AWSClient("rds", "us-west-2", client_factory=ClientFactory())
     params = {
         "ProductDescription": "MySQL",
         "DBInstanceClass": "db.m5.large",
@@ -140,5 +145,70 @@ def test_describe_offerings_with_multiple_params(mock_boto3):
     )
 
 
+@patch("boto3.Session")
+def test_describe_offerings_projects_fields_before_caching(mock_session):
+    """fields指定時にページが射影され、射影後のページがキャッシュされることを確認"""
+    from src.offering_finder.clients.OfferingCache import OfferingCache
+
+    mock_client = Mock()
+    mock_client.meta.service_model.service_name = "rds"
+    mock_client.describe_reserved_db_instances_offerings.return_value = {
+        "ReservedDBInstancesOfferings": [
+            {"ReservedDBInstancesOfferingId": "rds-123", "FixedPrice": 1.0, "Extra": 1}
+        ]
+    }
+    mock_session.return_value.client.return_value = mock_client
+    cache = OfferingCache(path=":memory:")
+    fields = ("ReservedDBInstancesOfferingId", "FixedPrice")
+
+    client = AWSClient(
+        "rds", "us-west-2", client_factory=ClientFactory(cache=cache), fields=fields
+    )
+    result = client.describe_offerings({})
+
+    expected = [{"ReservedDBInstancesOfferingId": "rds-123", "FixedPrice": 1.0}]
+    assert result["ReservedDBInstancesOfferings"] == expected
+    key = OfferingCache.make_key("rds", "us-west-2", {}, fields)
+    assert key != OfferingCache.make_key("rds", "us-west-2", {})
+    assert cache.get(key)["ReservedDBInstancesOfferings"] == expected
+
+
+@patch("boto3.Session")
+def test_describe_offerings_records_full_page_despite_projected_cache(mock_session):
+    """射影済みページがキャッシュにあっても、スナップショットには全フィールドのページが記録されることを確認"""
+    from src.offering_finder.clients.OfferingCache import OfferingCache
+    from src.offering_finder.clients.Snapshot import Snapshot
+
+    page = {
+        "ReservedDBInstancesOfferings": [
+            {"ReservedDBInstancesOfferingId": "rds-123", "FixedPrice": 1.0, "Extra": 1}
+        ]
+    }
+    mock_client = Mock()
+    mock_client.meta.service_model.service_name = "rds"
+    mock_client.describe_reserved_db_instances_offerings.return_value = page
+    mock_session.return_value.client.return_value = mock_client
+    cache = OfferingCache(path=":memory:")
+    fields = ("ReservedDBInstancesOfferingId", "FixedPrice")
+    AWSClient(
+        "rds", "us-west-2", client_factory=ClientFactory(cache=cache), fields=fields
+    ).describe_offerings({})
+    snapshot = Snapshot()
+
+    client = AWSClient(
+        "rds",
+        "us-west-2",
+        client_factory=ClientFactory(cache=cache, snapshot=snapshot),
+        fields=fields,
+    )
+    result = client.describe_offerings({})
+
+    assert result["ReservedDBInstancesOfferings"] == [
+        {"ReservedDBInstancesOfferingId": "rds-123", "FixedPrice": 1.0}
+    ]
+    recorded = snapshot.get("rds", "us-west-2", {})
+    assert recorded["ReservedDBInstancesOfferings"] == page["ReservedDBInstancesOfferings"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,152 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from src.offering_finder.batch import (
+    BatchItem,
+    group_criteria,
+    load_inventory,
+    run_batch,
+)
+from src.offering_finder.clients.ClientFactory import ClientFactory
+
+
+RDS_OFFERINGS = [
+    {
+        "ReservedDBInstancesOfferingId": "offering-1",
+        "DBInstanceClass": "db.m5.large",
+        "Duration": 31536000,
+        "FixedPrice": 1000.0,
+        "OfferingType": "All Upfront",
+        "ProductDescription": "mysql",
+        "MultiAZ": False,
+    },
+    {
+        "ReservedDBInstancesOfferingId": "offering-2",
+        "DBInstanceClass": "db.r5.large",
+        "Duration": 31536000,
+        "FixedPrice": 2000.0,
+        "OfferingType": "All Upfront",
+        "ProductDescription": "mysql",
+        "MultiAZ": False,
+    },
+]
+
+
+def test_load_inventory_csv_and_json(tmp_path):
+    """CSVとJSONの在庫ファイルを読み込めることを確認"""
+    csv_path = tmp_path / "inventory.csv"
+    csv_path.write_text(
+        "service,region,instance_class,engine,duration,quantity,multi_az\n"
+        "rds,us-west-2,db.m5.large,mysql,31536000,2,\n"
+    )
+    json_path = tmp_path / "inventory.json"
+    json_path.write_text(
+        json.dumps({"items": [{"service": "elasticache", "region": "us-west-2"}]})
+    )
+
+    csv_items = load_inventory(str(csv_path))
+    json_items = load_inventory(str(json_path))
+
+    assert csv_items[0].quantity == 2
+    assert csv_items[0].multi_az is None
+    assert csv_items[0].criteria() == {
+        "DBInstanceClass": "db.m5.large",
+        "ProductDescription": "mysql",
+        "Duration": 31536000,
+    }
+    assert json_items[0].service == "elasticache"
+
+
+def test_load_inventory_rejects_unknown_service(tmp_path):
+    """未対応のサービスを含む在庫ファイルはエラーになることを確認"""
+    path = tmp_path / "inventory.json"
+    path.write_text(json.dumps([{"service": "ec2", "region": "us-west-2"}]))
+
+    with pytest.raises(ValueError):
+        load_inventory(str(path))
+
+
+def test_group_criteria_keeps_shared_fields():
+    """全ての品目が指定する項目のみがグループの条件になることを確認"""
+    items = [
+        BatchItem(
+            service="rds",
+            region="us-west-2",
+            instance_class="db.m5.large",
+            duration=31536000,
+        ),
+        BatchItem(
+            service="rds",
+            region="us-west-2",
+            instance_class="db.r5.large",
+            duration=31536000,
+        ),
+        BatchItem(service="rds", region="us-west-2", duration=31536000),
+    ]
+
+    assert group_criteria(items) == {"Duration": [31536000]}
+
+
+@patch("boto3.Session")
+def test_run_batch_fetches_each_catalog_once(mock_session):
+    """同じサービスとリージョンの品目はカタログを1回だけ取得することを確認"""
+    mock_client = MagicMock()
+    mock_client.meta.service_model.service_name = "rds"
+    mock_client.describe_reserved_db_instances_offerings.return_value = {
+        "ReservedDBInstancesOfferings": RDS_OFFERINGS
+    }
+    mock_session.return_value.client.return_value = mock_client
+    items = [
+        BatchItem(
+            service="rds",
+            region="us-west-2",
+            instance_class="db.m5.large",
+            duration=31536000,
+            quantity=2,
+        ),
+        BatchItem(
+            service="rds",
+            region="us-west-2",
+            instance_class="db.r5.large",
+            duration=31536000,
+        ),
+        BatchItem(
+            service="rds",
+            region="us-west-2",
+            instance_class="db.t3.micro",
+            duration=31536000,
+        ),
+    ]
+
+    results = run_batch(items, ClientFactory())
+
+    mock_client.describe_reserved_db_instances_offerings.assert_called_once_with(
+        Duration="31536000", MaxRecords=100
+    )
+    assert [r["MatchCount"] for r in results] == [1, 1, 0]
+    offering = results[0]["Offerings"][0]
+    assert offering["OrderEstimatedAmount"] == 2000.0
+    assert (
+        "--reserved-db-instances-offering-id offering-1" in offering["PurchaseCommand"]
+    )
+    assert "PurchaseCommand" not in RDS_OFFERINGS[0]
+
+
+@patch("boto3.Session")
+def test_run_batch_reports_fetch_errors_per_item(mock_session):
+    """カタログの取得に失敗した品目にエラーが記録されることを確認"""
+    mock_client = MagicMock()
+    mock_client.meta.service_model.service_name = "rds"
+    mock_client.describe_reserved_db_instances_offerings.side_effect = RuntimeError(
+        "boom"
+    )
+    mock_session.return_value.client.return_value = mock_client
+
+    results = run_batch([BatchItem(service="rds", region="us-west-2")], ClientFactory())
+
+    assert results[0]["Error"] == "boom"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
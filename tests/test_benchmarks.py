@@ -0,0 +1,55 @@
+import pytest
+from benchmarks import generators
+from benchmarks.generators import GENERATORS, generate_offerings
+from benchmarks.run import build_cases, compare, time_case
+from src.offering_finder.catalog import OFFERING_ID_FIELDS
+
+
+@pytest.mark.parametrize("service_name", sorted(GENERATORS))
+def test_generate_offerings_is_deterministic(service_name):
+    """同じシードで同じ合成カタログが生成され、件数が指定どおりであることを確認"""
+    first = list(generate_offerings(service_name, 5, seed=1))
+    second = list(generate_offerings(service_name, 5, seed=1))
+
+    assert first == second
+    assert all(o[OFFERING_ID_FIELDS[service_name]] for o in first)
+
+
+def test_generate_offerings_cycles_through_pool(monkeypatch):
+    """プールより多い件数はプールを循環して生成されることを確認"""
+    monkeypatch.setattr(generators, "POOL_SIZE", 4)
+
+    offerings = list(generate_offerings("rds", 10))
+
+    assert len(offerings) == 10
+    assert offerings[4] is offerings[0]
+
+
+def test_every_case_runs_on_synthetic_offerings():
+    """全てのベンチマークケースが合成カタログで実行できることを確認"""
+    for case in build_cases():
+        pool = list(generate_offerings(case.service_name, 10))
+
+        result = time_case(case, pool, 20, repeat=1)
+
+        assert result["size"] == 20
+        assert result["min"] >= 0
+
+
+def test_compare_flags_regressions():
+    """ベースラインより閾値を超えて遅いケースのみ回帰と判定されることを確認"""
+    baseline = {"results": {"a[1k]": {"min": 1.0}, "b[1k]": {"min": 1.0}}}
+    current = {
+        "results": {"a[1k]": {"min": 1.05}, "b[1k]": {"min": 1.5}, "c[1k]": {"min": 1}}
+    }
+
+    rows = compare(current, baseline, threshold=0.1)
+
+    assert [(r["case"], r["regression"]) for r in rows] == [
+        ("a[1k]", False),
+        ("b[1k]", True),
+    ]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
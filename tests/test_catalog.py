@@ -0,0 +1,119 @@
+import pytest
+from src.offering_finder.catalog import OfferingCatalog
+
+
+RDS_OFFERINGS = [
+    {
+        "ReservedDBInstancesOfferingId": "offering-1",
+        "DBInstanceClass": "db.m5.large",
+        "Duration": 31536000,
+        "OfferingType": "All Upfront",
+        "ProductDescription": "mysql",
+        "MultiAZ": False,
+        "FixedPrice": 1000.0,
+    },
+    {
+        "ReservedDBInstancesOfferingId": "offering-2",
+        "DBInstanceClass": "db.m5.large",
+        "Duration": 94608000,
+        "OfferingType": "All Upfront",
+        "ProductDescription": "mysql",
+        "MultiAZ": True,
+        "FixedPrice": 2500.0,
+    },
+    {
+        "ReservedDBInstancesOfferingId": "offering-3",
+        "DBInstanceClass": "db.r5.large",
+        "Duration": 31536000,
+        "OfferingType": "No Upfront",
+        "ProductDescription": "postgresql",
+        "MultiAZ": False,
+        "FixedPrice": 0.0,
+    },
+]
+
+
+def _ids(offerings):
+    return [o["ReservedDBInstancesOfferingId"] for o in offerings]
+
+
+def test_query_intersects_indexes():
+    """複数のインデックス条件の積集合で検索できることを確認"""
+    catalog = OfferingCatalog("rds", RDS_OFFERINGS)
+
+    result = catalog.query(DBInstanceClass="db.m5.large", Duration="31536000")
+
+    assert _ids(result) == ["offering-1"]
+
+
+def test_query_accepts_multiple_values_and_residual_fields():
+    """複数値の条件とインデックス対象外の条件を組み合わせて検索できることを確認"""
+    catalog = OfferingCatalog("rds", RDS_OFFERINGS)
+
+    assert _ids(catalog.query({"OfferingType": ["All Upfront", "No Upfront"]})) == [
+        "offering-1",
+        "offering-2",
+        "offering-3",
+    ]
+    assert _ids(catalog.query(ProductDescription="mysql", FixedPrice=2500)) == [
+        "offering-2"
+    ]
+    assert catalog.query(DBInstanceClass="db.t3.micro") == []
+
+
+def test_query_without_criteria_returns_all():
+    """条件なしの場合は全件が元の順序で返ることを確認"""
+    catalog = OfferingCatalog("rds", RDS_OFFERINGS)
+
+    assert _ids(catalog.query()) == ["offering-1", "offering-2", "offering-3"]
+    assert _ids(catalog.query(MultiAZ=True)) == ["offering-2"]
+
+
+def test_get_by_offering_id():
+    """オファリングIDで1件取得できることを確認"""
+    catalog = OfferingCatalog("rds", RDS_OFFERINGS)
+
+    assert catalog.get("offering-3")["DBInstanceClass"] == "db.r5.large"
+    assert catalog.get("missing") is None
+    assert len(catalog) == 3
+
+
+def test_savingsplans_list_and_property_fields():
+    """Savings Plansのリスト値とpropertiesの値で検索できることを確認"""
+    catalog = OfferingCatalog(
+        "savingsplans",
+        [
+            {
+                "offeringId": "sp-1",
+                "productTypes": ["EC2", "Fargate"],
+                "durationSeconds": 31536000,
+                "properties": [{"name": "instanceFamily", "value": "m5"}],
+            },
+            {
+                "offeringId": "sp-2",
+                "productTypes": ["EC2"],
+                "durationSeconds": 94608000,
+                "properties": [{"name": "instanceFamily", "value": "c5"}],
+            },
+        ],
+    )
+
+    assert [o["offeringId"] for o in catalog.query(productTypes="Fargate")] == ["sp-1"]
+    assert [o["offeringId"] for o in catalog.query(instanceFamily="c5")] == ["sp-2"]
+
+
+def test_where_uses_indexes_and_predicate():
+    """where式の等価条件は索引で、残りは述語で絞り込まれることを確認"""
+    from src.offering_finder.expressions import parse_where
+
+    catalog = OfferingCatalog("rds", RDS_OFFERINGS)
+
+    result = catalog.where(
+        parse_where('Duration=31536000 and ProductDescription~"SQL" and FixedPrice<500')
+    )
+
+    assert _ids(result) == ["offering-3"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,210 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("boto3", "botocore", "pydantic", "s3transfer", "numpy")
+# cli.py を実行し、読み込まれたモジュール名を標準エラーに出力する
+LIST_MODULES = """
+import runpy, sys
+try:
+    runpy.run_path("cli.py", run_name="__main__")
+except SystemExit:
+    pass
+sys.stderr.write("\\n".join(sys.modules))
+"""
+
+
+def imported_modules(*args):
+    """cli.py の実行後に読み込まれているモジュール名を取得する"""
+    result = subprocess.run(
+        [sys.executable, "-c", LIST_MODULES, *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stderr.splitlines())
+
+
+def is_heavy(module):
+    return module.split(".")[0] in HEAVY_MODULES or module.startswith(
+        "src.offering_finder.models"
+    )
+
+
+def test_help_does_not_import_heavy_modules():
+    """cli.py --help でboto3/botocore/pydantic/numpyやサブコマンドがインポートされないことを確認"""
+    modules = imported_modules("--help")
+
+    assert not {m for m in modules if is_heavy(m)}
+    assert not {m for m in modules if m.startswith("mycli.rds")}
+
+
+def test_subcommand_help_imports_only_that_subcommand():
+    """サブコマンドの --help で対象のサブコマンドのみが読み込まれることを確認"""
+    modules = imported_modules("rds", "--help")
+
+    assert "mycli.rds" in modules
+    assert "mycli.elasticache" not in modules
+    assert "mycli.opensearch" not in modules
+    assert "mycli.savingsplans" not in modules
+    assert not {m for m in modules if is_heavy(m)}
+
+
+def test_help_lists_lazy_subcommands():
+    """遅延読み込みのサブコマンドがヘルプに一覧表示されることを確認"""
+    sys.path.insert(0, ROOT)
+    from cli import cli
+
+    result = CliRunner().invoke(cli, ["--help"])
+
+    assert result.exit_code == 0
+    for name in ("rds", "elasticache", "savingsplans", "opensearch"):
+        assert name in result.output
+
+
+def test_write_offerings_first_match_stops_paging(capsys):
+    """オファリングID指定時に最初の一致で取得を打ち切ることを確認"""
+    sys.path.insert(0, ROOT)
+    from mycli.output import write_offerings
+    from src.offering_finder.regions import DEFAULT_QUEUE_SIZE
+
+    consumed = []
+    total = 10 * DEFAULT_QUEUE_SIZE
+
+    def fetch(region_name):
+        for i in range(total):
+            consumed.append(i)
+            yield {"OfferingId": i}
+
+    write_offerings(fetch, ["us-west-2"], 1, "ndjson", first_match=True)
+
+    assert capsys.readouterr().out.count("\n") == 1
+    assert len(consumed) < total
+
+
+def test_write_offerings_to_output_file(tmp_path, capsys):
+    """--output_file指定時にファイルへ出力され標準出力には書かれないことを確認"""
+    sys.path.insert(0, ROOT)
+    from mycli.output import write_offerings
+
+    path = tmp_path / "offerings.json"
+
+    def fetch(region_name):
+        return [{"OfferingId": "a"}, {"OfferingId": "b"}]
+
+    write_offerings(
+        fetch, ["us-west-2"], 1, "json-compact", output_file=str(path)
+    )
+
+    assert capsys.readouterr().out == ""
+    assert [o["OfferingId"] for o in json.loads(path.read_text())] == ["a", "b"]
+
+
+def test_rds_where_multi_az_is_pushed_down(monkeypatch):
+    """--multi_az 未指定でも --where の MultiAZ 条件でマルチAZのofferingが返されることを確認"""
+    sys.path.insert(0, ROOT)
+    from benchmarks.fake_aws import FakeAWSServer
+    from cli import cli
+
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.delenv("AWS_PROFILE", raising=False)
+    with FakeAWSServer(catalog_size=200) as server:
+        catalog = server.catalog("rds")
+        sample = next(o for o in catalog if o["MultiAZ"])
+        keys = ("DBInstanceClass", "ProductDescription", "Duration", "OfferingType")
+        expected = sorted(
+            o["ReservedDBInstancesOfferingId"]
+            for o in catalog
+            if o["MultiAZ"] and all(o[k] == sample[k] for k in keys)
+        )
+        args = [
+            "rds",
+            "--endpoint_url", server.url,
+            "--no_cache",
+            "--region_name", "us-east-1",
+            "--db_instance_class", sample["DBInstanceClass"],
+            "--product_description", sample["ProductDescription"],
+            "--duration", str(sample["Duration"]),
+            "--offering_type", sample["OfferingType"],
+            "--quantity", "1",
+            "--output", "ndjson",
+        ]
+
+        results = [
+            CliRunner().invoke(cli, args + extra)
+            for extra in (["--where", "MultiAZ=true"], ["--multi_az"])
+        ]
+
+    for result in results:
+        assert result.exit_code == 0, result.output
+        offerings = [json.loads(line) for line in result.output.splitlines()]
+        assert sorted(o["ReservedDBInstancesOfferingId"] for o in offerings) == expected
+
+
+def test_savingsplans_all_regions_queries_global_endpoint_region(monkeypatch):
+    """savingsplans --all_regions でデフォルトのリージョンではなくus-east-1で1回だけ取得されることを確認"""
+    sys.path.insert(0, ROOT)
+    from benchmarks.fake_aws import FakeAWSServer
+    from cli import cli
+
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.delenv("AWS_PROFILE", raising=False)
+    with FakeAWSServer(catalog_size=30) as server:
+        result = CliRunner().invoke(
+            cli,
+            [
+                "savingsplans",
+                "--endpoint_url", server.url,
+                "--no_cache",
+                "--all_regions",
+                "--output", "ndjson",
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    offerings = [json.loads(line) for line in result.output.splitlines()]
+    assert offerings
+    assert len({o["offeringId"] for o in offerings}) == len(offerings)
+    assert {o["RegionName"] for o in offerings} == {"us-east-1"}
+    assert all("--region us-east-1 " in o["PurchaseCommand"] for o in offerings)
+
+
+def test_timings_total_covers_client_creation(monkeypatch, tmp_path):
+    """--timings の total がクライアント生成を含む全ステージ以上になることを確認"""
+    sys.path.insert(0, ROOT)
+    from benchmarks.fake_aws import FakeAWSServer
+    from cli import cli
+
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.delenv("AWS_PROFILE", raising=False)
+    with FakeAWSServer(catalog_size=10) as server:
+        result = CliRunner().invoke(
+            cli,
+            [
+                "opensearch",
+                "--endpoint_url", server.url,
+                "--no_cache",
+                "--region_name", "us-east-1",
+                "--quantity", "1",
+                "--timings", "json",
+                "--output_file", str(tmp_path / "offerings.json"),
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    stages = json.loads(result.stderr.splitlines()[-1])["stages"]
+    assert "create_client" in stages
+    assert all(stages["total"]["total"] >= stage["total"] for stage in stages.values())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
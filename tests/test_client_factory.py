@@ -0,0 +1,56 @@
+import pytest
+from unittest.mock import patch
+from src.offering_finder.clients.ClientFactory import ClientFactory
+
+
+@patch("boto3.Session")
+def test_client_is_cached_per_service_and_region(mock_session):
+    """同じサービス・リージョンのクライアントが再利用されることを確認"""
+    factory = ClientFactory()
+
+    first = factory.client("rds", "us-west-2")
+    second = factory.client("rds", "us-west-2")
+    factory.client("rds", "ap-northeast-1")
+    factory.client("elasticache", "us-west-2")
+
+    assert first is second
+    mock_session.assert_called_once_with(profile_name=None)
+    assert mock_session.return_value.client.call_count == 3
+
+
+@patch("boto3.Session")
+def test_client_is_cached_per_profile(mock_session):
+    """プロファイル毎にセッションが作成されることを確認"""
+    factory = ClientFactory(profile_name="default-profile")
+
+    factory.client("rds", "us-west-2")
+    factory.client("rds", "us-west-2", profile_name="other-profile")
+
+    assert mock_session.call_count == 2
+    mock_session.assert_any_call(profile_name="default-profile")
+    mock_session.assert_any_call(profile_name="other-profile")
+
+
+@patch("boto3.Session")
+def test_client_uses_endpoint_url_and_config(mock_session):
+    """endpoint_urlとbotocoreのConfigがクライアントに渡されることを確認"""
+    factory = ClientFactory(
+        endpoint_url="http://localhost:8080",
+        max_pool_connections=32,
+        retry_mode="standard",
+        max_attempts=3,
+        read_timeout=5,
+    )
+
+    factory.client("opensearch", "us-west-2")
+
+    kwargs = mock_session.return_value.client.call_args.kwargs
+    assert kwargs["endpoint_url"] == "http://localhost:8080"
+    assert kwargs["config"].max_pool_connections == 32
+    assert kwargs["config"].retries == {"mode": "standard", "max_attempts": 3}
+    assert kwargs["config"].read_timeout == 5
+    assert kwargs["config"].tcp_keepalive is True
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
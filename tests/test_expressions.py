@@ -0,0 +1,106 @@
+import pytest
+from src.offering_finder.expressions import parse_where
+from src.offering_finder.planner import plan_query
+
+OFFERINGS = [
+    {
+        "Id": "mysql-1yr",
+        "Duration": 31536000,
+        "FixedPrice": 1000.0,
+        "ProductDescription": "mysql",
+        "MultiAZ": False,
+    },
+    {
+        "Id": "postgres-1yr",
+        "Duration": "31536000",
+        "FixedPrice": 2500.0,
+        "ProductDescription": "PostgreSQL",
+        "MultiAZ": True,
+    },
+    {
+        "Id": "postgres-3yr",
+        "Duration": 94608000,
+        "FixedPrice": 1500.0,
+        "ProductDescription": "aurora-postgresql",
+        "MultiAZ": False,
+    },
+]
+
+
+def _ids(where):
+    expression = parse_where(where)
+    return [o["Id"] for o in OFFERINGS if expression(o)]
+
+
+@pytest.mark.parametrize(
+    "where, expected",
+    [
+        ("Duration=31536000", ["mysql-1yr", "postgres-1yr"]),
+        ("FixedPrice<2000", ["mysql-1yr", "postgres-3yr"]),
+        ('ProductDescription~"postgres"', ["postgres-1yr", "postgres-3yr"]),
+        (
+            'Duration=31536000 and FixedPrice<2000 or ProductDescription~"aurora"',
+            ["mysql-1yr", "postgres-3yr"],
+        ),
+        ("not (MultiAZ=true or FixedPrice>=1500)", ["mysql-1yr"]),
+        ("Id in (mysql-1yr, 'postgres-3yr')", ["mysql-1yr", "postgres-3yr"]),
+        ("ProductDescription!=mysql", ["postgres-1yr", "postgres-3yr"]),
+        ("CurrencyCode=USD", []),
+    ],
+)
+def test_where_expression_matches(where, expected):
+    """比較・論理演算・括弧を含む式で期待するオファリングが選ばれることを確認"""
+    assert _ids(where) == expected
+
+
+@pytest.mark.parametrize(
+    "where", ["", "Duration", "Duration=", "FixedPrice<2000 and", "(Duration=1", "a=1 b=2"]
+)
+def test_where_expression_syntax_error(where):
+    """不正な式はValueErrorになることを確認"""
+    with pytest.raises(ValueError):
+        parse_where(where)
+
+
+def test_split_separates_equality_conjuncts():
+    """トップレベルの等価条件が条件に、それ以外が述語に分かれることを確認"""
+    criteria, predicate = parse_where(
+        "(Duration=31536000 and MultiAZ=false) and FixedPrice<2000 and Duration=1"
+    ).split()
+
+    assert criteria == {"Duration": 31536000, "MultiAZ": False}
+    assert predicate({"FixedPrice": 1000, "Duration": 1})
+    assert not predicate({"FixedPrice": 1000, "Duration": 31536000})
+
+
+def test_plan_query_pushes_where_down():
+    """where式の等価条件はAPIリクエストに、それ以外はクライアント側で判定されることを確認"""
+    plan = plan_query(
+        "rds",
+        {},
+        request={"DBInstanceClass": "db.m5.large"},
+        where=parse_where(
+            "Duration=31536000 and DBInstanceClass=db.r5.large and FixedPrice<2000"
+        ),
+    )
+
+    assert plan.request == {"DBInstanceClass": "db.m5.large", "Duration": "31536000"}
+    assert plan.residual == {"DBInstanceClass": "db.r5.large"}
+    assert [o["Id"] for o in plan.filter(OFFERINGS)] == []
+    assert plan.matches({"DBInstanceClass": "db.r5.large", "FixedPrice": 1000})
+
+
+def test_plan_query_keeps_where_on_constrained_field():
+    """既に条件のあるフィールドのwhere項はクライアント側で判定されることを確認"""
+    plan = plan_query(
+        "opensearch",
+        {"Duration": 31536000},
+        where=parse_where("Duration=94608000"),
+    )
+
+    assert plan.residual == {"Duration": 31536000}
+    assert not plan.matches({"Duration": 31536000})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,132 @@
+import http.client
+
+import pytest
+from botocore.exceptions import ClientError
+from benchmarks.e2e import percentile, run_e2e
+from benchmarks.fake_aws import OPENSEARCH_PATH, FakeAWSServer
+from src.offering_finder.batch import MANAGERS, PARAMS
+from src.offering_finder.clients.ClientFactory import ClientFactory
+from src.offering_finder.models.rds_params import RDSParams
+
+
+@pytest.fixture
+def credentials(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.delenv("AWS_PROFILE", raising=False)
+
+
+class RecordingWriter:
+    """ハンドラの wfile への書き込みを記録するラッパー"""
+
+    def __init__(self, wfile, writes):
+        self.wfile = wfile
+        self.writes = writes
+
+    def write(self, data):
+        self.writes.append(bytes(data))
+        return self.wfile.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.wfile, name)
+
+
+def record_writes(monkeypatch, handler_class):
+    """ハンドラクラスの各接続の書き込みを記録するリストを返す"""
+    writes = []
+    setup = handler_class.setup
+
+    def recording_setup(self):
+        setup(self)
+        self.wfile = RecordingWriter(self.wfile, writes)
+
+    monkeypatch.setattr(handler_class, "setup", recording_setup)
+    return writes
+
+
+def fetch_all(service_name, factory):
+    manager = MANAGERS[service_name]("us-east-1", client_factory=factory)
+    params_class = PARAMS[service_name]
+    params = params_class(**{name: None for name in params_class.model_fields})
+    if service_name == "opensearch":
+        return list(manager.iter_offering_ids(params))
+    return list(manager.iter_offerings(params))
+
+
+@pytest.mark.parametrize("service_name", sorted(MANAGERS))
+def test_managers_page_through_fake_endpoint(credentials, service_name):
+    """ローカルのエンドポイント経由で全サービスのカタログがページングされて取得できることを確認"""
+    with FakeAWSServer(catalog_size=25, page_size=10) as server:
+        offerings = fetch_all(service_name, ClientFactory(endpoint_url=server.url))
+
+        assert offerings == server.catalog(service_name)
+        assert server.requests == 3
+
+
+def test_fake_endpoint_filters_on_request_parameters(credentials):
+    """リクエストパラメータでオファリングが絞り込まれることを確認"""
+    with FakeAWSServer(catalog_size=40) as server:
+        manager = MANAGERS["rds"]("us-east-1", client_factory=ClientFactory(endpoint_url=server.url))
+
+        offerings = manager.get_offerings(RDSParams(Duration="94608000", MultiAZ=True))
+
+        expected = [
+            o for o in server.catalog("rds") if o["Duration"] == 94608000 and o["MultiAZ"]
+        ]
+        assert offerings == expected
+
+
+@pytest.mark.parametrize("service_name", ["rds", "savingsplans"])
+def test_fake_endpoint_throttles(credentials, service_name):
+    """スロットリングエラーが各プロトコルの形式で返されることを確認"""
+    with FakeAWSServer(catalog_size=5, throttle_rate=1.0) as server:
+        factory = ClientFactory(endpoint_url=server.url, max_attempts=0)
+
+        with pytest.raises(ClientError) as e:
+            fetch_all(service_name, factory)
+
+        assert e.value.response["Error"]["Code"] in ("Throttling", "ThrottlingException")
+        assert server.throttled == 1
+
+
+def test_run_e2e_reports_throughput_and_latency(credentials):
+    """エンドツーエンドの件数・スループット・レイテンシが報告されることを確認"""
+    with FakeAWSServer(catalog_size=15, page_size=10) as server:
+        results = run_e2e(
+            server.url, ["opensearch"], ["us-east-1", "us-west-2"]
+        )
+
+    result = results["opensearch"]
+    assert result["offerings"] == 30
+    assert result["pages"] == 4
+    assert result["offerings_per_s"] > 0
+    assert 0 < result["p50_ms"] <= result["p99_ms"]
+
+
+def test_keep_alive_responses_are_single_writes(monkeypatch):
+    """同一接続での各レスポンスがNagle/遅延ACKで待たされないよう1回の書き込みで送られることを確認"""
+    with FakeAWSServer(catalog_size=5) as server:
+        writes = record_writes(monkeypatch, server.httpd.RequestHandlerClass)
+        connection = http.client.HTTPConnection(*server.httpd.server_address[:2])
+        bodies = []
+        for _ in range(3):
+            connection.request("GET", f"{OPENSEARCH_PATH}?maxResults=5")
+            bodies.append(connection.getresponse().read())
+
+    assert len(writes) == 3
+    for write, body in zip(writes, bodies):
+        assert write.startswith(b"HTTP/1.1 200 ")
+        assert write.endswith(b"\r\n\r\n" + body)
+
+
+def test_percentile_nearest_rank():
+    """最近傍ランク法でパーセンタイルが計算されることを確認"""
+    values = list(range(1, 101))
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 99) == 0.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
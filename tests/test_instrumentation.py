@@ -0,0 +1,78 @@
+import io
+import json
+
+import pytest
+from src.offering_finder.instrumentation import Instrumentation
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_span_self_time_excludes_nested_spans():
+    """入れ子のスパンの時間が外側のスパンの自己時間から除かれることを確認"""
+    clock = FakeClock()
+    instrumentation = Instrumentation(clock=clock)
+
+    with instrumentation.span("outer"):
+        clock.now += 1.0
+        with instrumentation.span("inner"):
+            clock.now += 2.0
+
+    stages = instrumentation.summary()["stages"]
+    assert stages["outer"] == {"calls": 1, "total": 3.0, "self": 1.0, "max": 3.0}
+    assert stages["inner"]["self"] == 2.0
+    assert list(stages) == ["inner", "outer"]
+
+
+def test_timed_excludes_consumer_time():
+    """遅延ステージの計測に消費側の処理時間が含まれないことを確認"""
+    clock = FakeClock()
+    instrumentation = Instrumentation(clock=clock)
+
+    def produce():
+        for i in range(3):
+            clock.now += 0.5
+            yield i
+
+    for _ in instrumentation.timed("produce", produce()):
+        clock.now += 10.0
+
+    stage = instrumentation.summary()["stages"]["produce"]
+    assert stage["calls"] == 4
+    assert stage["total"] == pytest.approx(1.5)
+
+
+def test_disabled_records_nothing():
+    """無効なインスタンスは何も記録せず、イテラブルをそのまま返すことを確認"""
+    instrumentation = Instrumentation(enabled=False)
+    items = [1, 2]
+
+    with instrumentation.span("stage"):
+        instrumentation.count("pages")
+
+    assert instrumentation.timed("stage", items) is items
+    assert instrumentation.summary() == {"stages": {}, "counters": {}}
+
+
+def test_report_json():
+    """JSON形式でステージとカウンタが出力されることを確認"""
+    instrumentation = Instrumentation(clock=FakeClock())
+    instrumentation.count("pages", 2)
+    with instrumentation.span("api_call"):
+        pass
+    stream = io.StringIO()
+
+    instrumentation.report(stream, "json")
+
+    summary = json.loads(stream.getvalue())
+    assert summary["counters"] == {"pages": 2}
+    assert summary["stages"]["api_call"]["calls"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
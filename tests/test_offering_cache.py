@@ -0,0 +1,101 @@
+import pytest
+from unittest.mock import Mock, patch
+from src.offering_finder.clients.AWSClient import AWSClient
+from src.offering_finder.clients.ClientFactory import ClientFactory
+from src.offering_finder.clients.OfferingCache import OfferingCache
+
+
+def test_cache_round_trip(tmp_path):
+    """保存した値が取得できることを確認"""
+    cache = OfferingCache(path=str(tmp_path / "cache.sqlite3"))
+    key = OfferingCache.make_key("rds", "us-west-2", {"Duration": "31536000"})
+
+    cache.set(key, {"ReservedDBInstancesOfferings": [{"id": 1}]})
+
+    assert cache.get(key) == {"ReservedDBInstancesOfferings": [{"id": 1}]}
+
+
+def test_cache_key_ignores_param_order():
+    """パラメータの順序がキーに影響しないことを確認"""
+    key1 = OfferingCache.make_key("rds", "us-west-2", {"a": 1, "b": 2})
+    key2 = OfferingCache.make_key("rds", "us-west-2", {"b": 2, "a": 1})
+    key3 = OfferingCache.make_key("rds", "ap-northeast-1", {"a": 1, "b": 2})
+
+    assert key1 == key2
+    assert key1 != key3
+
+
+def test_cache_expired_entry(tmp_path):
+    """TTLを過ぎたエントリが返されないことを確認"""
+    cache = OfferingCache(path=str(tmp_path / "cache.sqlite3"), ttl=-1)
+    cache.set("key", {"value": 1})
+
+    assert cache.get("key") is None
+
+
+def test_cache_refresh_skips_read(tmp_path):
+    """refresh指定時はキャッシュを読まずに書き込みのみ行うことを確認"""
+    path = str(tmp_path / "cache.sqlite3")
+    OfferingCache(path=path).set("key", {"value": 1})
+
+    cache = OfferingCache(path=path, refresh=True)
+
+    assert cache.get("key") is None
+    assert OfferingCache(path=path).get("key") == {"value": 1}
+
+
+def test_cache_size_based_eviction(tmp_path):
+    """サイズ上限を超えた場合に最も古いエントリから削除されることを確認"""
+    cache = OfferingCache(path=str(tmp_path / "cache.sqlite3"), max_size=40)
+    cache.set("old", {"value": "x" * 10})
+    cache.set("new", {"value": "y" * 10})
+
+    assert cache.get("old") is None
+    assert cache.get("new") == {"value": "y" * 10}
+
+
+@patch("boto3.Session")
+def test_describe_offerings_uses_cache(mock_session, tmp_path):
+    """2回目以降の同一リクエストがキャッシュから返されることを確認"""
+    mock_client = Mock()
+    mock_client.meta.service_model.service_name = "rds"
+    mock_client.describe_reserved_db_instances_offerings.return_value = {
+        "ReservedDBInstancesOfferings": [{"OfferingId": "rds-123"}],
+        "ResponseMetadata": {"RequestId": "abc"},
+    }
+    mock_session.return_value.client.return_value = mock_client
+    cache = OfferingCache(path=str(tmp_path / "cache.sqlite3"))
+
+    client = AWSClient("rds", "us-west-2", client_factory=ClientFactory(cache=cache))
+    client.describe_offerings({"ProductDescription": "MySQL"})
+    result = client.describe_offerings({"ProductDescription": "MySQL"})
+
+    mock_client.describe_reserved_db_instances_offerings.assert_called_once()
+    assert result == {"ReservedDBInstancesOfferings": [{"OfferingId": "rds-123"}]}
+
+
+@patch("boto3.Session")
+def test_endpoints_do_not_share_cached_pages(mock_session, tmp_path):
+    """エンドポイントやプロファイルが異なるクライアント間でキャッシュが共有されないことを確認"""
+    mock_client = Mock()
+    mock_client.meta.service_model.service_name = "rds"
+    mock_client.describe_reserved_db_instances_offerings.return_value = {
+        "ReservedDBInstancesOfferings": [{"OfferingId": "rds-123"}],
+    }
+    mock_session.return_value.client.return_value = mock_client
+    cache = OfferingCache(path=str(tmp_path / "cache.sqlite3"))
+    factories = [
+        ClientFactory(cache=cache, endpoint_url="http://127.0.0.1:4566"),
+        ClientFactory(cache=cache),
+        ClientFactory(cache=cache, profile_name="other"),
+        ClientFactory(cache=cache, endpoint_url="http://127.0.0.1:4566"),
+    ]
+
+    for factory in factories:
+        AWSClient("rds", "us-west-2", client_factory=factory).describe_offerings({})
+
+    assert mock_client.describe_reserved_db_instances_offerings.call_count == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,167 @@
+import time
+
+import pytest
+from unittest.mock import Mock
+from src.offering_finder.clients.Paginator import (
+    PAGINATION_DESCRIPTORS,
+    Paginator,
+)
+
+
+def make_client(service_name, responses):
+    client = Mock()
+    client.service_name = service_name
+    client.describe_offerings.side_effect = responses
+    return client
+
+
+def test_pages_follow_marker():
+    """Markerを辿って全ページが取得されることを確認"""
+    client = make_client(
+        "rds",
+        [
+            {"ReservedDBInstancesOfferings": [{"id": 1}], "Marker": "m1"},
+            {"ReservedDBInstancesOfferings": [{"id": 2}, {"id": 3}]},
+        ],
+    )
+    paginator = Paginator(client)
+
+    result = list(paginator.items({"MaxRecords": 100}))
+
+    assert [o["id"] for o in result] == [1, 2, 3]
+    assert client.describe_offerings.call_count == 2
+    assert client.describe_offerings.call_args_list[1].args[0] == {
+        "MaxRecords": 100,
+        "Marker": "m1",
+    }
+
+
+def test_pages_stop_on_empty_next_token():
+    """Savings Plansの空文字nextTokenで取得が終了することを確認"""
+    client = make_client(
+        "savingsplans",
+        [
+            {"searchResults": [{"offeringId": "a"}], "nextToken": "t1"},
+            {"searchResults": [{"offeringId": "b"}], "nextToken": ""},
+        ],
+    )
+    paginator = Paginator(client)
+
+    result = list(paginator.items({}))
+
+    assert [o["offeringId"] for o in result] == ["a", "b"]
+    assert client.describe_offerings.call_count == 2
+
+
+def test_pages_are_lazy():
+    """ページが遅延取得されることを確認"""
+    client = make_client(
+        "opensearch",
+        [
+            {"ReservedInstanceOfferings": [{"id": 1}], "NextToken": "t1"},
+            {"ReservedInstanceOfferings": [{"id": 2}]},
+        ],
+    )
+    pages = Paginator(client).pages({})
+
+    assert next(pages) == [{"id": 1}]
+    assert client.describe_offerings.call_count == 1
+
+
+def test_pages_stop_when_token_does_not_advance():
+    """同じトークンが返され続けた場合に無限ループしないことを確認"""
+    client = make_client(
+        "elasticache",
+        [
+            {"ReservedCacheNodesOfferings": [{"id": 1}], "Marker": "m1"},
+            {"ReservedCacheNodesOfferings": [{"id": 2}], "Marker": "m1"},
+        ],
+    )
+
+    result = list(Paginator(client).items({}))
+
+    assert len(result) == 2
+
+
+def test_page_size_is_capped_and_timed():
+    """ページサイズが上限に丸められ、ページ毎の計測が通知されることを確認"""
+    client = make_client(
+        "opensearch",
+        [{"ReservedInstanceOfferings": [{"id": 1}, {"id": 2}]}],
+    )
+    stats = []
+    paginator = Paginator(client, page_size=500, on_page=stats.append)
+
+    list(paginator.items({}))
+
+    max_page_size = PAGINATION_DESCRIPTORS["opensearch"].max_page_size
+    assert client.describe_offerings.call_args.args[0] == {
+        "MaxResults": max_page_size
+    }
+    assert len(stats) == 1
+    assert stats[0].page_number == 1
+    assert stats[0].item_count == 2
+    assert stats[0].elapsed >= 0
+
+
+def test_prefetch_fetches_next_page_while_consuming():
+    """先読みで現在のページの処理中に次のページが取得されることを確認"""
+    client = make_client(
+        "rds",
+        [
+            {"ReservedDBInstancesOfferings": [{"id": 1}], "Marker": "m1"},
+            {"ReservedDBInstancesOfferings": [{"id": 2}], "Marker": "m2"},
+            {"ReservedDBInstancesOfferings": [{"id": 3}]},
+        ],
+    )
+    paginator = Paginator(client, prefetch=1)
+
+    pages = paginator.pages({})
+    first = next(pages)
+    deadline = time.monotonic() + 5
+    while client.describe_offerings.call_count < 2:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+    assert first == [{"id": 1}]
+    assert [page[0]["id"] for page in pages] == [2, 3]
+    assert client.describe_offerings.call_count == 3
+
+
+def test_prefetch_raises_fetch_errors_in_consumer():
+    """先読み中の取得エラーが利用側で送出されることを確認"""
+    client = make_client(
+        "rds",
+        [
+            {"ReservedDBInstancesOfferings": [{"id": 1}], "Marker": "m1"},
+            RuntimeError("boom"),
+        ],
+    )
+    paginator = Paginator(client, prefetch=2)
+
+    with pytest.raises(RuntimeError):
+        list(paginator.items({}))
+
+
+def test_prefetch_stops_when_consumer_closes():
+    """利用側が途中で終了した場合に先読みが停止することを確認"""
+    responses = (
+        {"ReservedDBInstancesOfferings": [{"id": i}], "Marker": f"m{i}"}
+        for i in range(1000)
+    )
+    client = make_client("rds", responses)
+    paginator = Paginator(client, prefetch=1)
+
+    pages = paginator.pages({})
+    next(pages)
+    pages.close()
+    time.sleep(0.3)
+    calls = client.describe_offerings.call_count
+    time.sleep(0.2)
+
+    assert client.describe_offerings.call_count == calls
+    assert calls < 5
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
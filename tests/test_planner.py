@@ -0,0 +1,92 @@
+import pytest
+from src.offering_finder.planner import plan_query, values_equal
+
+
+def test_plan_opensearch_pushes_offering_id_only():
+    """OpenSearchではオファリングIDのみがリクエストに含まれることを確認"""
+    plan = plan_query(
+        "opensearch",
+        {
+            "ReservedInstanceOfferingId": "offering-1",
+            "InstanceType": "m5.large.search",
+            "Duration": 31536000,
+        },
+    )
+
+    assert plan.request == {"ReservedInstanceOfferingId": "offering-1"}
+    assert plan.residual == {"InstanceType": "m5.large.search", "Duration": 31536000}
+
+
+def test_plan_rds_pushes_supported_fields():
+    """RDSでAPIが対応する条件がリクエストに、未対応の条件が残余になることを確認"""
+    plan = plan_query(
+        "rds",
+        {"DBInstanceClass": "db.m5.large", "Duration": 31536000, "CurrencyCode": "USD"},
+    )
+
+    assert plan.request == {"DBInstanceClass": "db.m5.large", "Duration": "31536000"}
+    assert plan.residual == {"CurrencyCode": "USD"}
+
+
+def test_plan_multiple_values_for_scalar_parameter():
+    """単一値のパラメータに複数値を指定した場合は残余で判定されることを確認"""
+    plan = plan_query("rds", {"DBInstanceClass": ["db.m5.large", "db.r5.large"]})
+
+    assert "DBInstanceClass" not in plan.request
+    assert plan.matches({"DBInstanceClass": "db.r5.large"})
+    assert not plan.matches({"DBInstanceClass": "db.t3.micro"})
+
+
+def test_plan_savingsplans_filters_and_usage_types():
+    """Savings Plansでfilters/usageTypesにプッシュダウンされることを確認"""
+    plan = plan_query(
+        "savingsplans",
+        {"usageType": ["USE1-BoxUsage:m5.large"], "instanceFamily": "m5", "region": "us-east-1"},
+        request={"planTypes": ["EC2Instance"]},
+    )
+
+    assert plan.request == {
+        "planTypes": ["EC2Instance"],
+        "usageTypes": ["USE1-BoxUsage:m5.large"],
+        "filters": [
+            {"name": "instanceFamily", "values": ["m5"]},
+            {"name": "region", "values": ["us-east-1"]},
+        ],
+    }
+    assert plan.residual == {}
+
+
+def test_plan_keeps_explicit_request_parameter():
+    """リクエストに既に指定された項目は上書きせず残余で判定されることを確認"""
+    plan = plan_query(
+        "savingsplans", {"planType": "Compute"}, request={"planTypes": ["EC2Instance"]}
+    )
+
+    assert plan.request == {"planTypes": ["EC2Instance"]}
+    assert plan.residual == {"planType": "Compute"}
+
+
+def test_plan_filter_residual():
+    """残余条件でofferingが絞り込まれることを確認"""
+    plan = plan_query("opensearch", {"InstanceType": "m5.large.search", "Duration": "31536000"})
+    offerings = [
+        {"InstanceType": "m5.large.search", "Duration": 31536000},
+        {"InstanceType": "m5.large.search", "Duration": 94608000},
+        {"InstanceType": "r5.large.search", "Duration": 31536000},
+    ]
+
+    result = list(plan.filter(offerings))
+
+    assert result == [{"InstanceType": "m5.large.search", "Duration": 31536000}]
+
+
+def test_values_equal():
+    """数値・真偽値・リストの比較が正しく行われることを確認"""
+    assert values_equal(31536000, "31536000")
+    assert values_equal(True, "true")
+    assert values_equal(["EC2", "Fargate"], "Fargate")
+    assert not values_equal("MySQL", "postgresql")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,48 @@
+import pytest
+from src.offering_finder.projection import project, project_page, projection_fields
+
+
+def test_projection_fields_adds_required_fields():
+    """要求したフィールドに必須フィールドと後段で必要なフィールドが加わることを確認"""
+    result = projection_fields("rds", ["FixedPrice", "Duration"], ["CurrencyCode"])
+
+    assert result == (
+        "FixedPrice",
+        "Duration",
+        "ReservedDBInstancesOfferingId",
+        "CurrencyCode",
+    )
+    assert projection_fields("rds", None) is None
+
+
+def test_project_keeps_savingsplans_properties():
+    """Savings Plansのpropertiesは指定した名前の要素のみ残ることを確認"""
+    offering = {
+        "offeringId": "sp-1",
+        "description": "long text",
+        "properties": [
+            {"name": "instanceFamily", "value": "m5"},
+            {"name": "region", "value": "us-east-1"},
+        ],
+    }
+
+    result = project(offering, {"offeringId", "instanceFamily"})
+
+    assert result == {
+        "offeringId": "sp-1",
+        "properties": [{"name": "instanceFamily", "value": "m5"}],
+    }
+
+
+def test_project_page_keeps_token():
+    """ページの射影でページングトークンが保持されることを確認"""
+    page = {"Marker": "next", "ReservedDBInstancesOfferings": [{"A": 1, "B": 2}]}
+
+    result = project_page(page, "ReservedDBInstancesOfferings", ["A"])
+
+    assert result == {"Marker": "next", "ReservedDBInstancesOfferings": [{"A": 1}]}
+    assert page["ReservedDBInstancesOfferings"] == [{"A": 1, "B": 2}]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,92 @@
+import pytest
+from src.offering_finder import ranking
+from src.offering_finder.ranking import offering_costs, rank_offerings, top_offerings
+
+
+def make_offerings():
+    return [
+        {
+            "Id": "partial-1yr",
+            "Duration": 31536000,
+            "FixedPrice": 876.0,
+            "UsagePrice": 0.0,
+            "RecurringCharges": [
+                {"RecurringChargeAmount": 0.05, "RecurringChargeFrequency": "Hourly"}
+            ],
+            "OrderQuantity": 2,
+        },
+        {"Id": "all-3yr", "Duration": 94608000, "FixedPrice": 2628.0, "UsagePrice": 0.0},
+        {"Id": "no-price", "Duration": 31536000},
+        {
+            "Id": "sp",
+            "durationSeconds": 31536000,
+            "paymentOption": "No Upfront",
+            "OrderCommitment": 0.2,
+        },
+    ]
+
+
+def test_offering_costs():
+    """前払い・時間単価・期間・数量が取得できることを確認"""
+    assert offering_costs(make_offerings()[0]) == (876.0, 0.05, 8760.0, 2.0)
+    assert offering_costs(make_offerings()[3]) == (0.0, 0.2, 8760.0, 1.0)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_rank_offerings_by_effective_hourly_rate(monkeypatch, use_numpy):
+    """注文数量分の実質時間単価で昇順に並び、算出できない値は末尾になることを確認"""
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(ranking, "np", None)
+
+    result = rank_offerings(
+        make_offerings(), sort="effective_hourly_rate", on_demand_rate=0.3
+    )
+
+    assert [o["Id"] for o in result] == ["all-3yr", "sp", "partial-1yr", "no-price"]
+    assert result[0]["EffectiveHourlyRate"] == pytest.approx(0.1)
+    assert result[0]["TotalCost"] == pytest.approx(2628.0)
+    assert result[0]["BreakEvenMonth"] == 12
+    partial = result[2]
+    assert partial["EffectiveHourlyRate"] == pytest.approx(2 * 0.15)
+    assert partial["TotalCost"] == pytest.approx(
+        partial["EffectiveHourlyRate"] * 8760
+    )
+    assert partial["BreakEvenMonth"] == 5
+    assert result[3]["EffectiveHourlyRate"] is None
+
+
+def test_rank_offerings_top_keeps_first_n():
+    """--top相当の指定で先頭N件のみ返り、対象外には指標が付かないことを確認"""
+    offerings = make_offerings()
+
+    result = rank_offerings(offerings, sort="total_cost", top=2)
+
+    assert [o["Id"] for o in result] == ["sp", "partial-1yr"]
+    assert result[0]["BreakEvenMonth"] is None
+    assert "TotalCost" not in offerings[1]
+
+
+def test_top_offerings_streams_into_bounded_heap():
+    """ストリームから上位N件のみが指標付きで返り、元の順序のタイが保たれることを確認"""
+    offerings = make_offerings() + [
+        {"Id": "all-3yr-copy", "Duration": 94608000, "FixedPrice": 2628.0}
+    ]
+
+    result = top_offerings(iter(offerings), 2, "effective_hourly_rate")
+
+    assert [o["Id"] for o in result] == ["all-3yr", "all-3yr-copy"]
+    assert result[0]["EffectiveHourlyRate"] == pytest.approx(0.1)
+    assert "EffectiveHourlyRate" not in offerings[0]
+
+
+def test_top_offerings_unknown_metric_last():
+    """算出できない指標の提供は既知の値より後ろになることを確認"""
+    result = top_offerings(make_offerings(), 4, "effective_hourly_rate")
+
+    assert result[-1]["Id"] == "no-price"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,108 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from src.offering_finder.clients.AWSClient import AWSClient
+from src.offering_finder.clients.ClientFactory import ClientFactory
+from src.offering_finder.clients.RateLimiter import AdaptiveLimiter, RateLimiter
+
+
+def test_token_bucket_caps_request_rate():
+    """バースト分を使い切った後はレートに従って待機することを確認"""
+    limiter = AdaptiveLimiter(rate=50, burst=1, max_concurrency=10)
+
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+        limiter.release()
+
+    # 1件目はバーストで即時、残り5件は 1/50 秒ごと
+    assert time.monotonic() - start >= 5 / 50 * 0.9
+
+
+def test_concurrency_limit_blocks_until_release():
+    """同時実行数の上限に達した場合は解放されるまで待機することを確認"""
+    limiter = AdaptiveLimiter(rate=1000, burst=10, max_concurrency=1)
+    limiter.acquire()
+    acquired = threading.Event()
+
+    def second():
+        limiter.acquire()
+        acquired.set()
+        limiter.release()
+
+    thread = threading.Thread(target=second)
+    thread.start()
+
+    assert not acquired.wait(0.05)
+    limiter.release()
+    assert acquired.wait(5)
+    thread.join()
+
+
+def test_throttle_halves_and_success_grows_back():
+    """スロットリングで同時実行数とレートが半減し、成功で回復することを確認"""
+    limiter = AdaptiveLimiter(rate=10, burst=10, max_concurrency=8)
+
+    limiter.on_throttle()
+    limiter.on_throttle()
+
+    assert limiter.concurrency == 2
+    assert limiter.rate == 2.5
+    assert limiter.throttles == 2
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.concurrency == 8
+    assert limiter.rate == 10
+
+
+def test_limiters_are_keyed_by_service_and_region():
+    """サービスとリージョンごとに別のリミッターが使われることを確認"""
+    rate_limiter = RateLimiter()
+
+    assert rate_limiter.limiter("rds", "us-west-2") is rate_limiter.limiter(
+        "rds", "us-west-2"
+    )
+    assert rate_limiter.limiter("rds", "us-west-2") is not rate_limiter.limiter(
+        "rds", "us-east-1"
+    )
+
+
+@patch("boto3.Session")
+def test_throttling_responses_reach_the_limiter(mock_session):
+    """botocoreのneeds-retryイベントでスロットリングがリミッターに伝わることを確認"""
+    mock_client = MagicMock()
+    mock_session.return_value.client.return_value = mock_client
+    factory = ClientFactory()
+    factory.client("rds", "us-west-2")
+    event_name, handler = mock_client.meta.events.register.call_args.args
+    limiter = factory.rate_limiter.limiter("rds", "us-west-2")
+
+    handler(response=(None, {"Error": {"Code": "Throttling"}}))
+    handler(response=(None, {"Error": {"Code": "InvalidParameterValue"}}))
+    handler(response=None)
+
+    assert event_name == "needs-retry"
+    assert limiter.throttles == 1
+
+
+@patch("boto3.Session")
+def test_awsclient_releases_the_limiter_on_error(mock_session):
+    """API呼び出しが失敗しても同時実行枠が解放されることを確認"""
+    mock_client = MagicMock()
+    mock_client.meta.service_model.service_name = "rds"
+    mock_client.describe_reserved_db_instances_offerings.side_effect = RuntimeError(
+        "boom"
+    )
+    mock_session.return_value.client.return_value = mock_client
+    client = AWSClient("rds", "us-west-2", client_factory=ClientFactory())
+
+    with pytest.raises(RuntimeError):
+        client.describe_offerings({})
+
+    assert client.limiter.in_flight == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
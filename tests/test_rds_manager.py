@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 from src.offering_finder.managers.rds_manager import RDSManager
 from src.offering_finder.models.rds_params import RDSPurchaseParams
@@ -134,5 +136,85 @@ def test_add_keys_to_offerings_empty():
     assert len(result) == 0
 
 
+def test_iter_add_keys_to_offerings_is_lazy():
+    """iter_add_keys_to_offeringsが要素を逐次処理することを確認"""
+    manager = RDSManager(region_name="ap-northeast-1")
+    consumed = []
+
+    def offerings():
+        for i in range(3):
+            consumed.append(i)
+            yield {"ReservedDBInstancesOfferingId": f"offering-id-{i}", "FixedPrice": 1.0}
+
+    params = RDSPurchaseParams(region_name="ap-northeast-1", quantity=1)
+    stream = manager.iter_add_keys_to_offerings(offerings(), params)
+
+    first = next(stream)
+
+    assert first["ReservedDBInstancesOfferingId"] == "offering-id-0"
+    assert consumed == [0]
+
+
+def test_add_keys_to_offerings_does_not_mutate_input():
+    """add_keys_to_offeringsが元のofferingsを変更しないことを確認"""
+    manager = RDSManager(region_name="ap-northeast-1")
+    offerings = [{"ReservedDBInstancesOfferingId": "offering-id-1", "FixedPrice": 1.0}]
+    params = RDSPurchaseParams(region_name="ap-northeast-1", quantity=1)
+
+    result = manager.add_keys_to_offerings(offerings, params)
+
+    assert offerings == [{"ReservedDBInstancesOfferingId": "offering-id-1", "FixedPrice": 1.0}]
+    assert result[0]["OrderQuantity"] == 1
+
+
+def test_enrich_offerings_shares_timestamp_and_renders_lazily():
+    """バッチで同じタイムスタンプを共有し、購入コマンドが参照時に生成されることを確認"""
+    manager = RDSManager(region_name="ap-northeast-1")
+    offerings = [
+        {"ReservedDBInstancesOfferingId": f"offering-id-{i}", "FixedPrice": 1.0}
+        for i in range(3)
+    ]
+    params = RDSPurchaseParams(region_name="ap-northeast-1", quantity=2)
+
+    with patch.object(
+        manager, "generate_purchase_command", return_value="command"
+    ) as generate:
+        views = list(manager.enrich_offerings(offerings, params))
+        assert generate.call_count == 0
+
+        assert views[1]["PurchaseCommand"] == "command"
+        assert views[1].to_dict()["PurchaseCommand"] == "command"
+        assert generate.call_count == 1
+
+    assert len({view["Timestamp"] for view in views}) == 1
+    assert views[0]["OrderEstimatedAmount"] == 2.0
+    views[0]["RegionName"] = "ap-northeast-1"
+    assert "RegionName" not in offerings[0]
+
+
+def test_iter_add_keys_to_offerings_skips_failed_purchase_command(caplog):
+    """購入コマンドの生成に失敗したofferingがログに記録されてスキップされることを確認"""
+    manager = RDSManager(region_name="ap-northeast-1")
+    offerings = [
+        {"ReservedDBInstancesOfferingId": f"offering-id-{i}", "FixedPrice": 1.0}
+        for i in range(3)
+    ]
+    params = RDSPurchaseParams(region_name="ap-northeast-1", quantity=1)
+
+    def generate(offering_id, **kwargs):
+        if offering_id == "offering-id-1":
+            raise ValueError("malformed offering")
+        return f"command {offering_id}"
+
+    with patch.object(manager, "generate_purchase_command", side_effect=generate):
+        result = list(manager.iter_add_keys_to_offerings(offerings, params))
+
+    assert [o["ReservedDBInstancesOfferingId"] for o in result] == [
+        "offering-id-0",
+        "offering-id-2",
+    ]
+    assert "offering_id: offering-id-1" in caplog.text
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,107 @@
+import sys
+
+import pytest
+from src.offering_finder.catalog import OfferingCatalog
+from src.offering_finder.records import RDSOfferingRecord, to_record
+
+
+def make_rds_offering(offering_id):
+    return {
+        "ReservedDBInstancesOfferingId": offering_id,
+        "DBInstanceClass": "db.m5.large",
+        "Duration": 31536000,
+        "FixedPrice": 876.0,
+        "UsagePrice": 0.0,
+        "CurrencyCode": "USD",
+        "ProductDescription": "mysql",
+        "OfferingType": "Partial Upfront",
+        "MultiAZ": False,
+        "RecurringCharges": [
+            {"RecurringChargeAmount": 0.05, "RecurringChargeFrequency": "Hourly"}
+        ],
+        "RegionName": "us-west-2",
+    }
+
+
+def test_record_round_trips_to_dict():
+    """レコードから元の辞書に変換できることを確認"""
+    offering = make_rds_offering("offering-1")
+
+    record = to_record("rds", offering)
+
+    assert isinstance(record, RDSOfferingRecord)
+    assert record.to_dict() == offering
+    assert dict(record) == offering
+    assert record["RecurringCharges"] == offering["RecurringCharges"]
+    assert record.get("OrderQuantity") is None
+    assert "RegionName" in record
+    assert not hasattr(record, "__dict__")
+
+
+def test_records_share_repeated_values():
+    """同じ共有テーブルで作成したレコード間で繰り返し現れる文字列とリストが共有されることを確認"""
+    shared = {}
+    first = to_record("rds", make_rds_offering("offering-1"), shared)
+    second = to_record("rds", make_rds_offering("offering-2"), shared)
+
+    assert first.DBInstanceClass is second.DBInstanceClass
+    assert first.RecurringCharges is second.RecurringCharges
+    assert "offering-1" not in shared
+    assert sys.getsizeof(first) < sys.getsizeof(make_rds_offering("offering-3"))
+
+
+def test_catalog_shares_values_per_build():
+    """カタログ内のレコードが構築時の共有テーブルで値を共有することを確認"""
+    catalog = OfferingCatalog(
+        "rds",
+        [make_rds_offering("offering-1"), make_rds_offering("offering-2")],
+        compact=True,
+    )
+
+    first, second = catalog.offerings
+    assert first.RecurringCharges is second.RecurringCharges
+
+
+def test_effective_hourly_rate_is_derived():
+    """前払い料金を期間で按分した時間単価が計算されることを確認"""
+    record = to_record("rds", make_rds_offering("offering-1"))
+
+    assert record.effective_hourly_rate == pytest.approx(876.0 / 8760 + 0.05)
+    assert record.duration_seconds == 31536000
+    assert record.offering_id == "offering-1"
+
+
+def test_savingsplans_record():
+    """Savings Plansのレコードでリストとpropertiesが保持されることを確認"""
+    offering = {
+        "offeringId": "sp-1",
+        "productTypes": ["EC2", "Fargate"],
+        "durationSeconds": 94608000,
+        "properties": [{"name": "instanceFamily", "value": "m5"}],
+    }
+
+    record = to_record("savingsplans", offering)
+
+    assert record.to_dict() == offering
+    assert record.duration_seconds == 94608000
+    assert record.effective_hourly_rate is None
+
+
+def test_compact_catalog_queries_records():
+    """compact指定のカタログがレコードを保持して検索できることを確認"""
+    catalog = OfferingCatalog(
+        "rds",
+        [make_rds_offering("offering-1"), make_rds_offering("offering-2")],
+        compact=True,
+    )
+
+    result = catalog.query(
+        ReservedDBInstancesOfferingId="offering-2", Duration=31536000
+    )
+
+    assert [o.offering_id for o in result] == ["offering-2"]
+    assert not isinstance(result[0], dict)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,143 @@
+import pytest
+from unittest.mock import patch
+from src.offering_finder.regions import (
+    fetch_across_regions,
+    iter_across_regions,
+    resolve_regions,
+)
+
+
+def test_resolve_regions_removes_duplicates():
+    """重複したリージョンが除外され、指定順が保たれることを確認"""
+    result = resolve_regions(
+        "rds", ["us-west-2", "ap-northeast-1", "us-west-2"]
+    )
+
+    assert result == ["us-west-2", "ap-northeast-1"]
+
+
+def test_resolve_regions_requires_region():
+    """リージョン未指定の場合にValueErrorが発生することを確認"""
+    with pytest.raises(ValueError):
+        resolve_regions("rds", [])
+
+
+@patch("boto3.session.Session")
+def test_resolve_regions_all_regions(mock_session_class):
+    """all_regions指定時にサービスの全リージョンが返されることを確認"""
+    mock_session = mock_session_class.return_value
+    mock_session.get_available_regions.return_value = ["us-east-1", "us-west-2"]
+
+    result = resolve_regions("rds", ["ap-northeast-1"], all_regions=True)
+
+    mock_session.get_available_regions.assert_called_once_with("rds")
+    assert result == ["us-east-1", "us-west-2"]
+
+
+@patch("boto3.session.Session")
+def test_resolve_regions_global_service(mock_session_class):
+    """グローバルなサービスは1リージョンのみで取得されることを確認"""
+    assert resolve_regions("savingsplans", ["us-west-2", "ap-northeast-1"]) == [
+        "us-west-2"
+    ]
+    assert resolve_regions("savingsplans", ["ap-northeast-1"], all_regions=True) == [
+        "us-east-1"
+    ]
+    assert resolve_regions("savingsplans", [], all_regions=True) == ["us-east-1"]
+    mock_session_class.assert_not_called()
+
+
+def test_fetch_across_regions_tags_region():
+    """各offeringにRegionNameが付与され、リージョン順にマージされることを確認"""
+
+    def fetch(region_name):
+        return [{"OfferingId": f"{region_name}-1"}, {"OfferingId": f"{region_name}-2"}]
+
+    result = fetch_across_regions(fetch, ["us-west-2", "ap-northeast-1"], max_workers=2)
+
+    assert [o["OfferingId"] for o in result] == [
+        "us-west-2-1",
+        "us-west-2-2",
+        "ap-northeast-1-1",
+        "ap-northeast-1-2",
+    ]
+    assert [o["RegionName"] for o in result] == [
+        "us-west-2",
+        "us-west-2",
+        "ap-northeast-1",
+        "ap-northeast-1",
+    ]
+
+
+def test_fetch_across_regions_skips_failed_region():
+    """一部のリージョンが失敗しても他のリージョンの結果が返されることを確認"""
+
+    def fetch(region_name):
+        if region_name == "us-west-2":
+            raise RuntimeError("boom")
+        return [{"OfferingId": "offering-1"}]
+
+    result = fetch_across_regions(fetch, ["us-west-2", "ap-northeast-1"])
+
+    assert result == [{"OfferingId": "offering-1", "RegionName": "ap-northeast-1"}]
+
+
+def test_fetch_across_regions_all_failed():
+    """全てのリージョンが失敗した場合に例外が発生することを確認"""
+
+    def fetch(region_name):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        fetch_across_regions(fetch, ["us-west-2", "ap-northeast-1"])
+
+
+def test_iter_across_regions_streams_all_offerings():
+    """ストリーミングで全リージョンのofferingが返されることを確認"""
+
+    def fetch(region_name):
+        for i in range(3):
+            yield {"OfferingId": f"{region_name}-{i}"}
+
+    result = list(
+        iter_across_regions(fetch, ["us-west-2", "ap-northeast-1"], queue_size=1)
+    )
+
+    assert sorted(o["OfferingId"] for o in result) == [
+        "ap-northeast-1-0",
+        "ap-northeast-1-1",
+        "ap-northeast-1-2",
+        "us-west-2-0",
+        "us-west-2-1",
+        "us-west-2-2",
+    ]
+    assert all(o["OfferingId"].startswith(o["RegionName"]) for o in result)
+
+
+def test_iter_across_regions_stops_early():
+    """途中で読み込みを止めても生産側スレッドが終了することを確認"""
+
+    def fetch(region_name):
+        for i in range(1000):
+            yield {"OfferingId": i}
+
+    stream = iter_across_regions(fetch, ["us-west-2"], queue_size=1)
+    first = next(stream)
+    stream.close()
+
+    assert first["OfferingId"] == 0
+
+
+def test_iter_across_regions_all_failed():
+    """全てのリージョンが失敗した場合に例外が発生することを確認"""
+
+    def fetch(region_name):
+        raise RuntimeError("boom")
+        yield
+
+    with pytest.raises(RuntimeError):
+        list(iter_across_regions(fetch, ["us-west-2"]))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,6 +1,15 @@
+from unittest.mock import MagicMock, patch
+
 import pytest
-from src.offering_finder.managers.savingsplans_manager import SavingsPlansManager
-from src.offering_finder.models.savingsplans_params import SavingsPlansPurchaseParams
+from src.offering_finder.clients.ClientFactory import ClientFactory
+from src.offering_finder.managers.savingsplans_manager import (
+    SavingsPlansManager,
+    partition_params,
+)
+from src.offering_finder.models.savingsplans_params import (
+    SavingsPlansParams,
+    SavingsPlansPurchaseParams,
+)
 
 
 def test_add_keys_to_offerings_single():
@@ -179,5 +188,76 @@ def test_generate_purchase_command():
     assert "--tags Key=Env,Value=Prod" in command
 
 
+def test_partition_params_splits_list_dimensions():
+    """複数値のリストパラメータの組み合わせごとにクエリが分割されることを確認"""
+    params = SavingsPlansParams(
+        planTypes=["Compute", "EC2Instance"],
+        durations=[31536000, 94608000],
+        paymentOptions=["All Upfront"],
+        productType="EC2",
+    )
+
+    partitions = partition_params(params)
+
+    assert len(partitions) == 4
+    assert {(p.planTypes[0], p.durations[0]) for p in partitions} == {
+        ("Compute", 31536000),
+        ("Compute", 94608000),
+        ("EC2Instance", 31536000),
+        ("EC2Instance", 94608000),
+    }
+    assert all(p.paymentOptions == ["All Upfront"] for p in partitions)
+    assert all(p.productType == "EC2" for p in partitions)
+
+
+def test_partition_params_respects_max_partitions():
+    """分割数の上限を超える次元は分割されないことを確認"""
+    params = SavingsPlansParams(
+        planTypes=["Compute", "EC2Instance"],
+        durations=[31536000, 94608000],
+        paymentOptions=["All Upfront", "Partial Upfront", "No Upfront"],
+    )
+
+    partitions = partition_params(params, max_partitions=4)
+
+    assert len(partitions) == 4
+    assert all(len(p.paymentOptions) == 3 for p in partitions)
+    assert partition_params(SavingsPlansParams(planTypes=["Compute"])) == [
+        SavingsPlansParams(planTypes=["Compute"])
+    ]
+
+
+@patch("boto3.Session")
+def test_iter_offerings_merges_partitions_without_duplicates(mock_session):
+    """分割したクエリの結果が重複なく順序通りに結合されることを確認"""
+    mock_client = MagicMock()
+    mock_client.meta.service_model.service_name = "savingsplans"
+
+    def describe(**params):
+        plan_type = params["planTypes"][0]
+        return {
+            "searchResults": [
+                {"offeringId": f"{plan_type}-1"},
+                {"offeringId": "shared"},
+            ],
+            "nextToken": "",
+        }
+
+    mock_client.describe_savings_plans_offerings.side_effect = describe
+    mock_session.return_value.client.return_value = mock_client
+    manager = SavingsPlansManager("us-east-1", client_factory=ClientFactory())
+
+    offerings = manager.get_offerings(
+        SavingsPlansParams(planTypes=["Compute", "EC2Instance"])
+    )
+
+    assert [o["offeringId"] for o in offerings] == [
+        "Compute-1",
+        "shared",
+        "EC2Instance-1",
+    ]
+    assert mock_client.describe_savings_plans_offerings.call_count == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,112 @@
+import csv
+import io
+import json
+
+import numpy as np
+import pytest
+from src.offering_finder import serializers
+from src.offering_finder.serializers import (
+    check_output,
+    dumps,
+    open_output,
+    write,
+)
+
+RECORDS = [
+    {
+        "ReservedDBInstancesOfferingId": "a",
+        "FixedPrice": 10.0,
+        "MultiAZ": False,
+        "RecurringCharges": [
+            {"RecurringChargeAmount": 0.1, "RecurringChargeFrequency": "Hourly"}
+        ],
+    },
+    {"ReservedDBInstancesOfferingId": "b", "FixedPrice": 20.0, "RegionName": "us-east-1"},
+]
+
+
+def written(output, records=RECORDS):
+    stream = io.BytesIO()
+    write(iter(records), stream, output)
+    return stream.getvalue().decode()
+
+
+def test_json_is_indented_and_compact_json_is_not():
+    """jsonはインデント付き、json-compactは空白なしの同じ配列を出力することを確認"""
+    indented = written("json")
+    compact = written("json-compact")
+
+    assert json.loads(indented) == json.loads(compact) == RECORDS
+    assert "\n  " in indented
+    assert compact == dumps(RECORDS).decode() + "\n"
+    assert ", " not in compact
+
+
+def test_ndjson_writes_one_record_per_line():
+    """ndjsonで1行に1件ずつ出力されることを確認"""
+    lines = written("ndjson").splitlines()
+
+    assert [json.loads(line) for line in lines] == RECORDS
+
+
+def test_csv_columns_are_the_union_of_keys():
+    """CSVの列が全レコードのキーの和集合になり、ネストした値がJSONになることを確認"""
+    rows = list(csv.DictReader(io.StringIO(written("csv"))))
+
+    assert list(rows[0]) == [
+        "ReservedDBInstancesOfferingId",
+        "FixedPrice",
+        "MultiAZ",
+        "RecurringCharges",
+        "RegionName",
+    ]
+    assert rows[0]["MultiAZ"] == "false"
+    assert json.loads(rows[0]["RecurringCharges"]) == RECORDS[0]["RecurringCharges"]
+    assert rows[1]["RegionName"] == "us-east-1"
+    assert rows[1]["RecurringCharges"] == ""
+
+
+def test_dumps_encodes_numpy_scalars():
+    """numpyのスカラー値がJSONにエンコードされることを確認"""
+    assert json.loads(dumps({"BreakEvenMonth": np.int64(7)})) == {"BreakEvenMonth": 7}
+
+
+def test_open_output_writes_to_file(tmp_path):
+    """出力ファイルを指定した場合にファイルへ書き込まれることを確認"""
+    path = tmp_path / "offerings.ndjson"
+
+    with open_output(str(path)) as stream:
+        write(iter(RECORDS), stream, "ndjson")
+
+    assert len(path.read_text().splitlines()) == 2
+
+
+def test_columnar_output_requires_pyarrow(monkeypatch):
+    """pyarrowがない場合にarrow/parquet出力がImportErrorになることを確認"""
+    monkeypatch.setattr(serializers.importlib.util, "find_spec", lambda name: None)
+
+    with pytest.raises(ImportError, match="pyarrow"):
+        check_output("parquet")
+    check_output("csv")
+
+
+@pytest.mark.parametrize("output", ["arrow", "parquet"])
+def test_columnar_output_round_trips(output):
+    """arrow/parquet出力が読み戻せることを確認"""
+    pa = pytest.importorskip("pyarrow")
+    stream = io.BytesIO()
+
+    write(iter(RECORDS), stream, output)
+
+    stream.seek(0)
+    if output == "arrow":
+        table = pa.ipc.open_file(stream).read_all()
+    else:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(stream)
+    assert table.column("ReservedDBInstancesOfferingId").to_pylist() == ["a", "b"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,251 @@
+import http.client
+import json
+import os
+import socket
+import threading
+
+import pytest
+from benchmarks.fake_aws import FakeAWSServer
+from src.offering_finder.clients.ClientFactory import ClientFactory
+from src.offering_finder.server import (
+    CatalogNotReady,
+    CatalogStore,
+    OfferingRequestHandler,
+    ServeQuery,
+    answer,
+    make_server,
+)
+
+
+@pytest.fixture
+def fake_aws(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.delenv("AWS_PROFILE", raising=False)
+    with FakeAWSServer(catalog_size=60, page_size=25) as server:
+        yield server
+
+
+@pytest.fixture
+def store(fake_aws):
+    store = CatalogStore(
+        [("rds", "us-east-1"), ("savingsplans", "us-east-1")],
+        ClientFactory(endpoint_url=fake_aws.url),
+    )
+    store.refresh()
+    return store
+
+
+class RecordingWriter:
+    """ハンドラの wfile への書き込みを記録するラッパー"""
+
+    def __init__(self, wfile, writes):
+        self.wfile = wfile
+        self.writes = writes
+
+    def write(self, data):
+        self.writes.append(bytes(data))
+        return self.wfile.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.wfile, name)
+
+
+def record_writes(monkeypatch, handler_class):
+    """ハンドラクラスの各接続の書き込みを記録するリストを返す"""
+    writes = []
+    setup = handler_class.setup
+
+    def recording_setup(self):
+        setup(self)
+        self.wfile = RecordingWriter(self.wfile, writes)
+
+    monkeypatch.setattr(handler_class, "setup", recording_setup)
+    return writes
+
+
+def serve(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_refresh_loads_full_catalogs(fake_aws, store):
+    """全カタログがメモリに読み込まれ、状態が報告されることを確認"""
+    status = store.status()
+
+    assert [(s["service"], s["offerings"]) for s in status] == [
+        ("rds", 60),
+        ("savingsplans", 60),
+    ]
+    assert all(s["loaded_at"] and s["error"] is None for s in status)
+    assert store.ready
+
+
+def test_answer_matches_subcommand_criteria(fake_aws, store):
+    """条件・where式・件数指定でカタログから回答されることを確認"""
+    catalog = fake_aws.catalog("rds")
+    expected = [
+        o["ReservedDBInstancesOfferingId"]
+        for o in catalog
+        if o["Duration"] == 31536000 and o["FixedPrice"] < 50000
+    ]
+
+    result = answer(
+        store,
+        ServeQuery(
+            service="rds",
+            region="us-east-1",
+            duration=31536000,
+            where="FixedPrice < 50000",
+            quantity=2,
+        ),
+    )
+
+    assert [o["ReservedDBInstancesOfferingId"] for o in result] == expected
+    assert all(o["OrderQuantity"] == 2 and o["RegionName"] == "us-east-1" for o in result)
+    assert "--db-instance-count 2" in result[0]["PurchaseCommand"]
+
+
+def test_answer_ranks_and_projects(store):
+    """コスト順の上位件数とフィールド射影が適用されることを確認"""
+    result = answer(
+        store,
+        ServeQuery(
+            service="rds",
+            region="us-east-1",
+            sort="total_cost",
+            top=3,
+            fields=["DBInstanceClass"],
+        ),
+    )
+
+    assert len(result) == 3
+    costs = [o["TotalCost"] for o in result]
+    assert costs == sorted(costs)
+    assert "ProductDescription" not in result[0]
+    assert "DBInstanceClass" in result[0]
+
+
+def test_global_catalog_answers_every_region(store):
+    """グローバルなSavings Plansのカタログが他のリージョンの問い合わせにも回答することを確認"""
+    result = answer(store, ServeQuery(service="savingsplans", region="us-west-2", top=1))
+
+    assert len(result) == 1
+    assert result[0]["RegionName"] == "us-west-2"
+    assert "--region us-west-2" in result[0]["PurchaseCommand"]
+    with pytest.raises(LookupError):
+        answer(store, ServeQuery(service="rds", region="us-west-2"))
+
+
+def test_unknown_and_unloaded_catalogs(fake_aws):
+    """未設定のカタログは LookupError、未読み込みは CatalogNotReady になることを確認"""
+    store = CatalogStore([("rds", "us-east-1")], ClientFactory(endpoint_url=fake_aws.url))
+
+    with pytest.raises(CatalogNotReady):
+        answer(store, ServeQuery(service="rds", region="us-east-1"))
+    with pytest.raises(LookupError):
+        answer(store, ServeQuery(service="rds", region="eu-west-1"))
+
+
+def test_http_api(store):
+    """HTTP APIでヘルスチェック・クエリ・エラーが返されることを確認"""
+    server = make_server(store, port=0)
+    serve(server)
+    try:
+        connection = http.client.HTTPConnection(*server.server_address[:2])
+
+        connection.request("GET", "/healthz")
+        response = connection.getresponse()
+        assert response.status == 200
+        assert json.loads(response.read()) == {"status": "ok"}
+
+        connection.request("GET", "/offerings/savingsplans?region=us-east-1&plan_type=Compute&top=2")
+        response = connection.getresponse()
+        offerings = json.loads(response.read())
+        assert response.status == 200
+        assert len(offerings) == 2
+        assert all(o["planType"] == "Compute" for o in offerings)
+
+        connection.request(
+            "POST",
+            "/offerings/rds",
+            body=json.dumps({"region": "us-east-1", "where": "FixedPrice <"}),
+        )
+        response = connection.getresponse()
+        assert response.status == 400
+        assert "error" in json.loads(response.read())
+
+        for top in (0, -1):
+            connection.request("GET", f"/offerings/rds?region=us-east-1&top={top}")
+            response = connection.getresponse()
+            assert response.status == 400
+            assert "top" in json.loads(response.read())["error"]
+
+        connection.request("GET", "/offerings/rds?region=eu-west-1")
+        response = connection.getresponse()
+        response.read()
+        assert response.status == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_keep_alive_responses_are_single_writes(store, monkeypatch):
+    """同一接続での各レスポンスがNagle/遅延ACKで待たされないよう1回の書き込みで送られることを確認"""
+    writes = record_writes(monkeypatch, OfferingRequestHandler)
+    server = make_server(store, port=0)
+    serve(server)
+    try:
+        connection = http.client.HTTPConnection(*server.server_address[:2])
+        bodies = []
+        for _ in range(3):
+            connection.request("GET", "/offerings/rds?region=us-east-1&top=2")
+            response = connection.getresponse()
+            bodies.append(response.read())
+            assert response.status == 200
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(writes) == 3
+    for write, body in zip(writes, bodies):
+        assert write.startswith(b"HTTP/1.1 200 ")
+        assert write.endswith(b"\r\n\r\n" + body)
+
+
+def test_unix_socket_api(store, tmp_path):
+    """unixソケット経由でndjson形式の回答が返されることを確認"""
+    path = str(tmp_path / "offering_finder.sock")
+    server = make_server(store, socket_path=path)
+    serve(server)
+    try:
+        connection = http.client.HTTPConnection("localhost")
+        connection.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.sock.connect(path)
+
+        connection.request("GET", "/offerings/rds?region=us-east-1&top=5&output=ndjson")
+        response = connection.getresponse()
+
+        assert response.status == 200
+        assert response.getheader("Content-Type") == "application/x-ndjson"
+        assert len(response.read().splitlines()) == 5
+    finally:
+        server.shutdown()
+        server.server_close()
+        os.unlink(path)
+
+
+def test_socket_path_must_not_be_a_regular_file(store, tmp_path):
+    """--socket に通常ファイルを指定した場合に削除せずエラーになることを確認"""
+    path = tmp_path / "offerings.json"
+    path.write_text("[]")
+
+    with pytest.raises(FileExistsError):
+        make_server(store, socket_path=str(path))
+
+    assert path.read_text() == "[]"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
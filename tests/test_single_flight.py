@@ -0,0 +1,113 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from src.offering_finder.clients.AWSClient import AWSClient
+from src.offering_finder.clients.ClientFactory import ClientFactory
+from src.offering_finder.clients.SingleFlight import SingleFlight
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def run_concurrently(single_flight, fn, callers):
+    """先頭の呼び出しの実行中に残りの呼び出しを開始し、全ての結果を返す"""
+    release = threading.Event()
+    results = [None] * callers
+    errors = [None] * callers
+
+    def blocked():
+        release.wait()
+        return fn()
+
+    def call(i):
+        try:
+            results[i] = single_flight.do("key", blocked)
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: single_flight.stats().calls == callers)
+    release.set()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_concurrent_calls_share_one_execution():
+    """同時の同一呼び出しが1回の実行を共有し、結果は呼び出し元ごとに複製されることを確認"""
+    single_flight = SingleFlight()
+    fn = MagicMock(return_value={"Offerings": [{"Id": "offering-1"}]})
+
+    results, errors = run_concurrently(single_flight, fn, 5)
+
+    fn.assert_called_once()
+    assert errors == [None] * 5
+    assert all(r == {"Offerings": [{"Id": "offering-1"}]} for r in results)
+    assert len({id(r["Offerings"][0]) for r in results}) == 5
+    stats = single_flight.stats()
+    assert (stats.calls, stats.coalesced, stats.executions) == (5, 4, 1)
+
+
+def test_followers_receive_the_leader_error():
+    """実行中の呼び出しの例外が待機中の呼び出し元にも伝わることを確認"""
+    single_flight = SingleFlight()
+    fn = MagicMock(side_effect=RuntimeError("boom"))
+
+    _, errors = run_concurrently(single_flight, fn, 3)
+
+    fn.assert_called_once()
+    assert all(isinstance(e, RuntimeError) for e in errors)
+
+
+def test_sequential_calls_are_not_coalesced():
+    """実行中でない呼び出しは共有されずに毎回実行されることを確認"""
+    single_flight = SingleFlight()
+    fn = MagicMock(return_value={})
+
+    single_flight.do("key", fn)
+    single_flight.do("key", fn)
+
+    assert fn.call_count == 2
+    assert single_flight.stats().coalesced == 0
+
+
+@patch("boto3.Session")
+def test_awsclient_coalesces_identical_pages(mock_session):
+    """AWSClientで同時の同一ページ取得がAPI呼び出し1回にまとめられることを確認"""
+    release = threading.Event()
+    mock_client = MagicMock()
+    mock_client.meta.service_model.service_name = "rds"
+
+    def describe(**params):
+        release.wait()
+        return {"ReservedDBInstancesOfferings": [{"Id": "offering-1"}]}
+
+    mock_client.describe_reserved_db_instances_offerings.side_effect = describe
+    mock_session.return_value.client.return_value = mock_client
+    factory = ClientFactory()
+    clients = [AWSClient("rds", "us-west-2", client_factory=factory) for _ in range(3)]
+    threads = [
+        threading.Thread(target=c.describe_offerings, args=({"MaxRecords": 100},))
+        for c in clients
+    ]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: factory.single_flight.stats().calls == 3)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert mock_client.describe_reserved_db_instances_offerings.call_count == 1
+    assert factory.single_flight.stats().coalesced == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,59 @@
+import pytest
+from unittest.mock import Mock, patch
+from src.offering_finder.clients.AWSClient import AWSClient
+from src.offering_finder.clients.ClientFactory import ClientFactory
+from src.offering_finder.clients.Snapshot import Snapshot, SnapshotMissError
+
+
+@patch("boto3.Session")
+def test_record_and_replay(mock_session, tmp_path):
+    """記録したページがAWSに接続せずに再生されることを確認"""
+    mock_client = Mock()
+    mock_client.meta.service_model.service_name = "rds"
+    mock_client.describe_reserved_db_instances_offerings.return_value = {
+        "ReservedDBInstancesOfferings": [{"OfferingId": "rds-123"}],
+        "ResponseMetadata": {"RequestId": "abc"},
+    }
+    mock_session.return_value.client.return_value = mock_client
+    path = str(tmp_path / "snapshot.json")
+
+    snapshot = Snapshot()
+    client = AWSClient(
+        "rds", "us-west-2", client_factory=ClientFactory(snapshot=snapshot)
+    )
+    response = client.describe_offerings({"ProductDescription": "MySQL"})
+    response["ReservedDBInstancesOfferings"][0]["OrderQuantity"] = 2
+    snapshot.save(path)
+
+    mock_session.reset_mock()
+    replay_factory = ClientFactory(snapshot=Snapshot.load(path))
+    replay_client = AWSClient("rds", "us-west-2", client_factory=replay_factory)
+    result = replay_client.describe_offerings({"ProductDescription": "MySQL"})
+
+    mock_session.return_value.client.assert_not_called()
+    assert replay_client.client is None
+    assert result == {"ReservedDBInstancesOfferings": [{"OfferingId": "rds-123"}]}
+
+
+def test_replay_missing_page():
+    """記録されていないリクエストでSnapshotMissErrorが発生することを確認"""
+    snapshot = Snapshot(replay=True)
+    client = AWSClient(
+        "rds", "us-west-2", client_factory=ClientFactory(snapshot=snapshot)
+    )
+
+    with pytest.raises(SnapshotMissError):
+        client.describe_offerings({"ProductDescription": "MySQL"})
+
+
+def test_load_unsupported_version(tmp_path):
+    """未対応のバージョンのスナップショットでValueErrorが発生することを確認"""
+    path = tmp_path / "snapshot.json"
+    path.write_text('{"version": 99, "pages": []}')
+
+    with pytest.raises(ValueError, match="Unsupported snapshot version"):
+        Snapshot.load(str(path))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])